@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+# Önbellek dosyasının biçimi değişirse artırılır (eski önbellekler yeniden üretilir)
+ATLAS_VERSION = 1
+ATLAS_WIDTH = 512
+
+
+def _source_key(background_spec, sprite_specs):
+    """Kaynak dosyaların mtime/boyutlarından ve hedef ölçülerden önbellek anahtarı üretir."""
+    entries = []
+    for name, path, size in [background_spec] + list(sprite_specs):
+        st = os.stat(path)
+        entries.append([name, path, st.st_mtime_ns, st.st_size, list(size)])
+    blob = json.dumps([ATLAS_VERSION, entries], sort_keys=True).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()
+
+
+def _pack(sprite_specs, width=ATLAS_WIDTH):
+    """Kareleri raf (shelf) yöntemiyle yerleştirir; {ad: (x, y, w, h)} ve atlas boyunu döndürür."""
+    placements = {}
+    x = y = shelf_height = 0
+    for name, _path, (w, h) in sorted(sprite_specs, key=lambda spec: -spec[2][1]):
+        if x + w > width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        placements[name] = (x, y, w, h)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return placements, (width, y + shelf_height)
+
+
+def _build(background_spec, sprite_specs):
+    """Kaynak PNG'leri çözer, ölçekler ve (arka plan, atlas, yerleşim) üretir (convert edilmeden)."""
+    _name, path, size = background_spec
+    background = pygame.transform.scale(pygame.image.load(path), size)
+    placements, atlas_size = _pack(sprite_specs)
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    for name, path, size in sprite_specs:
+        frame = pygame.transform.scale(pygame.image.load(path), size)
+        atlas.blit(frame, placements[name][:2])
+    return background, atlas, placements
+
+
+def _write_cache(cache_path, key, background, atlas, placements):
+    header = {
+        "key": key,
+        "background_size": list(background.get_size()),
+        "atlas_size": list(atlas.get_size()),
+        "frames": {name: list(rect) for name, rect in placements.items()},
+    }
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(pygame.image.tostring(background, "RGB"))
+            f.write(pygame.image.tostring(atlas, "RGBA"))
+        os.replace(tmp_path, cache_path)  # Yarım yazılmış önbellek hiç görünmesin
+    except OSError:
+        # Salt okunur disk vb.: Önbelleksiz devam edilir
+        pass
+
+
+def _read_cache(cache_path, key):
+    try:
+        with open(cache_path, "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("key") != key:
+                return None
+            data = f.read()
+    except (OSError, ValueError):
+        return None
+    bw, bh = header["background_size"]
+    aw, ah = header["atlas_size"]
+    split = bw * bh * 3
+    if len(data) != split + aw * ah * 4:
+        return None
+    background = pygame.image.frombuffer(data[:split], (bw, bh), "RGB")
+    atlas = pygame.image.frombuffer(data[split:], (aw, ah), "RGBA")
+    placements = {name: tuple(rect) for name, rect in header["frames"].items()}
+    return background, atlas, placements
+
+
+def load_scaled(path, size):
+    """Tek bir PNG'yi çözüp ölçekler; convert() çağrılmadığı için arka plan iş parçacığında kullanılabilir."""
+    return pygame.transform.scale(pygame.image.load(path), size)
+
+
+def read_atlas(background_spec, sprite_specs, cache_path):
+    """Atlası önbellekten okur veya üretir; (arka plan, atlas, yerleşim) döndürür.
+
+    Yüzeyler convert edilmez, bu yüzden arka plan iş parçacığında (açılışta)
+    çağrılabilir; sonuç ana iş parçacığında `finish_atlas()` ile kullanıma hazırlanır.
+    Önbellek kaynak dosyalar veya hedef boyutlar değişmedikçe geçerlidir; bu
+    durumda PNG çözme ve ölçekleme yapılmaz, tek dosya okunur. Kaynak dosya
+    eksikse OSError veya pygame.error fırlatılır.
+    """
+    key = _source_key(background_spec, sprite_specs)
+    cached = _read_cache(cache_path, key)
+    if cached is None:
+        cached = _build(background_spec, sprite_specs)
+        _write_cache(cache_path, key, *cached)
+    return cached
+
+
+def finish_atlas(background, atlas, placements):
+    """Ana iş parçacığı: Yüzeyleri ekran biçimine çevirir; (arka plan, {ad: Surface}) döndürür."""
+    atlas = atlas.convert_alpha()
+    frames = {name: atlas.subsurface(rect) for name, rect in placements.items()}
+    return background.convert(), frames
+
+
+def load_atlas(background_spec, sprite_specs, cache_path):
+    """Ölçeklenmiş arka planı ve atlas alt yüzeylerini ({ad: Surface}) döndürür.
+
+    background_spec: (ad, yol, boyut); sprite_specs: [(ad, yol, boyut), ...].
+    """
+    return finish_atlas(*read_atlas(background_spec, sprite_specs, cache_path))
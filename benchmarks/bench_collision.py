@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collision import LaneSweep, linear_query  # noqa: E402
+from game_logic import FishPool, FISH_SIZE, HOOK_SIZE, WIDTH, LINE_Y, HEIGHT  # noqa: E402
+
+
+def make_school(count, rng):
+    fishes = FishPool(rng, count).fishes
+    for f in fishes:
+        f.x = rng.uniform(-FISH_SIZE[0], WIDTH + 100)
+    return fishes
+
+
+def random_hooks(count, rng):
+    w, h = HOOK_SIZE
+    return [(rng.randint(0, WIDTH), rng.randint(LINE_Y, HEIGHT - 30), w, h) for _ in range(count)]
+
+
+def run(fish_count, hook_count, frames, rng):
+    """Aynı balık sürüsü üzerinde iki yöntemin kare başına çarpışma süresini (µs) ölçer.
+
+    Balık hareketi ölçüme dahil değildir; şerit yapısında yeniden doğan
+    balıkların şerit güncellemesi (bakım maliyeti) dahildir.
+    """
+    fishes = make_school(fish_count, rng)
+    sweep = LaneSweep(FISH_SIZE, fishes)
+    linear_time = sweep_time = 0.0
+    for _ in range(frames):
+        respawned = []
+        for f in fishes:
+            f.x += f.speed
+            if f.x > WIDTH + 100:
+                f.reset_offscreen()
+                respawned.append(f)
+        hooks = random_hooks(hook_count, rng)
+
+        start = time.perf_counter()
+        expected = [linear_query(fishes, FISH_SIZE, *hook) for hook in hooks]
+        linear_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for f in respawned:
+            sweep.sync(f)
+        sweep.next_frame()
+        got = [sweep.query(*hook) for hook in hooks]
+        sweep_time += time.perf_counter() - start
+
+        # İki yöntem her kanca için aynı balığı bulmalı
+        assert all(a is b for a, b in zip(expected, got))
+    return linear_time / frames * 1e6, sweep_time / frames * 1e6
+
+
+def main(frames=300):
+    """Kanca/balık çarpışmasında doğrusal tarama ile şerit süpürmeyi balık ve kanca sayısına göre karşılaştırır."""
+    rng = random.Random(1)
+    print(f"{'balık':>6} {'kanca':>6} {'doğrusal µs':>12} {'şerit µs':>10} {'hızlanma':>9}")
+    for fish_count in (7, 50, 200, 500, 2000):
+        for hook_count in (1, 4, 8):
+            old, new = run(fish_count, hook_count, frames, rng)
+            print(f"{fish_count:>6} {hook_count:>6} {old:>12.1f} {new:>10.1f} {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from console_session import ConsoleSession  # noqa: E402
+from game_logic import GameState, ControlInput  # noqa: E402
+from question_bank import load_question_bank  # noqa: E402
+from tests.fake_console import FakeConsole, BINARY_BAUD  # noqa: E402
+
+
+def main(consoles=8, seconds=3.0, fps=60, unplug_at=1.0, unplugged_for=0.5):
+    """Sahte konsollarla çok oyunculu oturumu 60 FPS'te çalıştırır ve kare başına girdi+adım maliyetini ölçer.
+
+    `unplug_at` saniyede ilk konsolun kablosu çekilir (pty kapatılır) ve
+    `unplugged_for` saniye sonra aynı adla yeniden takılır; oturumun arka
+    planda yeniden bağlanırken kareleri bekletmediği doğrulanır.
+    """
+    fakes = [FakeConsole(i) for i in range(consoles)]
+    for fake in fakes:
+        fake.start()
+    # Mantıksal port adı -> güncel pty yolu (yeniden takılan konsolun pty'si değişir)
+    paths = {f"konsol{i + 1}": fake.path for i, fake in enumerate(fakes)}
+    session = ConsoleSession(list(paths), 9600, BINARY_BAUD, reset_delay=0.05,
+                             open_port=lambda port, baud, timeout: serial.Serial(paths[port], baud, timeout=timeout))
+    start = time.perf_counter()
+    session.open()
+    session.start()
+    open_ms = (time.perf_counter() - start) * 1000.0
+    game = GameState(load_question_bank(), seed=0, players=len(session))
+
+    frame_times = []
+    frames = int(seconds * fps)
+    unplug_frame = int(unplug_at * fps)
+    replug_frame = int((unplug_at + unplugged_for) * fps)
+    next_frame = time.perf_counter()
+    for frame in range(frames):
+        if frame == unplug_frame:
+            fakes[0].stop()
+        elif frame == replug_frame:
+            fakes[0] = FakeConsole(0)
+            paths["konsol1"] = fakes[0].path
+            fakes[0].start()
+        t0 = time.perf_counter()
+        session.events()
+        inputs = [ControlInput(False, False, False, False, pull, pot) for pull, pot in session.poll()]
+        game.step(inputs=inputs)
+        session.frame_presented()
+        frame_times.append(time.perf_counter() - t0)
+        next_frame += 1.0 / fps
+        time.sleep(max(0.0, next_frame - time.perf_counter()))
+
+    session.close()
+    for fake in fakes:
+        fake.stop()
+
+    frame_times.sort()
+    print(f"{len(session)}/{consoles} konsol bağlandı, açılış {open_ms:.0f} ms")
+    print(f"girdi+adım: ort {sum(frame_times) / len(frame_times) * 1e6:.0f} µs, "
+          f"p99 {frame_times[int(len(frame_times) * 0.99)] * 1e6:.0f} µs, "
+          f"maks {frame_times[-1] * 1e6:.0f} µs (bütçe {1e6 / fps:.0f} µs)")
+    for controller, fake in zip(session.controllers, fakes):
+        print(f"  {controller.decoder.summary()}, gönderilen {fake.sent}, "
+              f"gecikme ort {controller.latency.avg_ms:.1f} ms, {controller.dropouts} kopma, "
+              f"{controller.reconnects} yeniden bağlanma ({controller.reconnect_latency.last_ms:.0f} ms)")
+    for player in game.players:
+        print(f"  oyuncu {player.index + 1}: kanca x {player.hook_pos[0]:.0f}, skor {player.score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import FishPool, FISH_SIZE, FISH_FRAME_COUNTS, WIDTH, HEIGHT, LINE_Y  # noqa: E402
+
+
+class ObjectFish:
+    """Karşılaştırma için ilk Fish sınıfının güncelleme mantığı (nesne başına __dict__)."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.type = rng.randint(0, len(FISH_FRAME_COUNTS) - 1)
+        self.x = -FISH_SIZE[0]
+        self.y = rng.randint(LINE_Y + 100, HEIGHT - 100)
+        self.speed = rng.uniform(1.5, 3.5)
+        self.anim_frame = 0
+        self.anim_timer = 0
+        self.caught = False
+
+    def update(self, hook_pos):
+        if self.caught:
+            self.x = hook_pos[0] + 5
+            self.y = hook_pos[1] - 10
+            return
+        self.x += self.speed
+        if self.x > WIDTH + 100:
+            self.reset_offscreen()
+        self.anim_timer += 1
+        if self.anim_timer >= 20:
+            self.anim_frame = (self.anim_frame + 1) % FISH_FRAME_COUNTS[self.type]
+            self.anim_timer = 0
+
+    def reset_offscreen(self):
+        self.x = -FISH_SIZE[0]
+        self.y = self.rng.randint(LINE_Y + 100, HEIGHT - 100)
+        self.speed = self.rng.uniform(1.5, 3.5)
+        self.caught = False
+
+
+def main(frames=300):
+    """Balık başına nesne güncellemesi ile dizi tabanlı havuzun toplu güncellemesini karşılaştırır."""
+    hook_pos = [500.0, 300.0]
+    print(f"{'balık':>6} {'nesne µs':>10} {'havuz µs':>10} {'hızlanma':>9}")
+    for count in (7, 50, 200, 500, 2000):
+        objects = [ObjectFish(random.Random(count)) for _ in range(count)]
+        pool = FishPool(random.Random(count), count)
+
+        def object_frame():
+            for f in objects:
+                f.update(hook_pos)
+
+        old = timeit.timeit(object_frame, number=frames) / frames * 1e6
+        new = timeit.timeit(lambda: pool.update(hook_pos), number=frames) / frames * 1e6
+        print(f"{count:>6} {old:>10.1f} {new:>10.1f} {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+from particles import ParticlePool, build_particle_sprites, burst_correct, PARTICLE_KINDS  # noqa: E402
+
+
+class ObjectParticle:
+    """Karşılaştırma için parçacık başına nesne ve tek tek blit kullanan basit uygulama."""
+
+    def __init__(self, sprites, x, y, vx, vy, ay, life):
+        self.sprites = sprites
+        self.x, self.y, self.vx, self.vy, self.ay = x, y, vx, vy, ay
+        self.age = 0
+        self.life = life
+
+    def update(self):
+        self.vy += self.ay
+        self.x += self.vx
+        self.y += self.vy
+        self.age += 1
+        return self.age < self.life
+
+    def draw(self, surf):
+        frame = self.sprites[self.age * len(self.sprites) // self.life]
+        surf.blit(frame, (int(self.x), int(self.y)))
+
+
+def fill_pool(pool, target):
+    while pool.count < target:
+        burst_correct(pool, pool.rng.uniform(100, 900), pool.rng.uniform(100, 500))
+
+
+def object_particles(sprites, rng, target):
+    particles = []
+    while len(particles) < target:
+        kind = rng.choice(list(PARTICLE_KINDS))
+        life, _ax, ay, _steps = PARTICLE_KINDS[kind]
+        particles.append(ObjectParticle(sprites[kind], rng.uniform(100, 900), rng.uniform(100, 500),
+                                        rng.uniform(-3, 3), rng.uniform(-3, 3), ay, life * 100))
+    return particles
+
+
+def main(frames=120):
+    """Havuz ile nesne tabanlı parçacıkların güncelleme ve çizim hızını (parçacık/ms) karşılaştırır."""
+    pygame.display.init()
+    screen = pygame.display.set_mode((1024, 600))
+    sprites = {kind: [s.convert_alpha() for s in frames] for kind, frames in build_particle_sprites().items()}
+    print(f"{'parçacık':>8} {'havuz güncelleme':>17} {'havuz +çizim':>13} {'nesne +çizim':>13}  (parçacık/ms)")
+    for count in (500, 1000, 2000, 5000, 10000):
+        pool = ParticlePool(count + 200, random.Random(count), sprites)
+        # Ömürleri çok uzun tut ki ölçüm boyunca parçacık sayısı sabit kalsın
+        pool.kinds = {kind: (life * 100, ax, ay, steps) for kind, (life, ax, ay, steps) in PARTICLE_KINDS.items()}
+        fill_pool(pool, count)
+        n = pool.count
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            pool.update()
+        update_ms = (time.perf_counter() - start) * 1000 / frames
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            pool.update()
+            pool.draw(screen)
+        pool_ms = (time.perf_counter() - start) * 1000 / frames
+
+        objects = object_particles(sprites, random.Random(count), n)
+        start = time.perf_counter()
+        for _ in range(frames):
+            for p in objects:
+                p.update()
+                p.draw(screen)
+        object_ms = (time.perf_counter() - start) * 1000 / frames
+
+        print(f"{n:>8} {n / update_ms:>17.0f} {n / pool_ms:>13.0f} {n / object_ms:>13.0f}"
+              f"   (kare başına havuz {pool_ms:.2f} ms, nesne {object_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import load_question_bank, cache_path_for  # noqa: E402
+
+
+def _write_bank(path, count):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(f"SORU:Soru {i}?|CEVAP:Cevap {i}|YANCILAR:a{i},b{i},c{i},d{i}"
+                    f"|KATEGORI:ders{i % 8}|ZORLUK:{i % 3 + 1}\n")
+
+
+def _measure(path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    bank = load_question_bank(path)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    peak = tracemalloc.get_traced_memory()[1] / 1024.0
+    tracemalloc.stop()
+    return bank, elapsed, peak
+
+
+def main():
+    """İlk derleme ile önbellekten açılışın süre ve bellek maliyetini soru sayısına göre karşılaştırır."""
+    rng = random.Random(0)
+    print(f"{'soru':>7} {'derleme ms':>11} {'açılış ms':>10} {'açılış KiB':>11} {'örnek µs':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (100, 10000, 100000):
+            path = os.path.join(tmp, f"questions_{count}.txt")
+            _write_bank(path, count)
+            bank, compile_ms, _ = _measure(path)
+            bank.close()
+            bank, open_ms, open_kib = _measure(path)
+            start = time.perf_counter()
+            for _ in range(1000):
+                bank.sample(rng, category="ders3")
+            sample_us = (time.perf_counter() - start) * 1000.0
+            bank.close()
+            os.remove(cache_path_for(path))
+            print(f"{count:>7} {compile_ms:>11.1f} {open_ms:>10.2f} {open_kib:>11.1f} {sample_us:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from question_bank import load_question_bank  # noqa: E402
+from bench_replay import QUESTIONS_FILE, record_scenario  # noqa: E402
+
+# (ekran, çizim ölçeği, tamsayı büyütme)
+SETTINGS = [
+    ("1024x600", "1", "0"),
+    ("1920x1080", "1", "0"),
+    ("1920x1080", "0.75", "0"),
+    ("1920x1080", "0.5", "0"),
+    ("1920x1080", "0.5", "1"),
+    ("3840x2160", "1", "0"),
+    ("3840x2160", "0.5", "0"),
+    ("3840x2160", "0.25", "1"),
+]
+
+
+def replay_at(path, display, scale, integer):
+    """Kaydı verilen görüntü ayarlarıyla fish.py'de sınırsız hızda oynatır; (kare, ekrana verme) p50/p99 döndürür."""
+    with tempfile.TemporaryDirectory() as tmp:
+        profile_path = os.path.join(tmp, "profile.json")
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", FISH_REPLAY=path,
+                   FISH_REPLAY_UNCAPPED="1", FISH_PROFILE_OUT=profile_path, FISH_DISPLAY=display,
+                   FISH_RENDER_SCALE=scale, FISH_INTEGER_SCALE=integer)
+        result = subprocess.run([sys.executable, "fish.py"], cwd=ROOT, env=env, check=False,
+                                capture_output=True, text=True, timeout=600)
+        with open(profile_path, encoding="utf-8") as f:
+            percentiles = json.load(f)["percentiles_ms"]
+    view = next((line.split(": ", 1)[1] for line in result.stdout.splitlines() if line.startswith("Görüntü:")), "?")
+    return view, percentiles["frame"], percentiles["present"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aynı kaydı farklı ekran boyutu ve çizim ölçekleriyle oynatıp kare sürelerini karşılaştırır.")
+    parser.add_argument("--frames", type=int, default=1800)
+    args = parser.parse_args()
+
+    questions = load_question_bank(QUESTIONS_FILE)
+    print(f"{'ekran':<10} {'ölçek':>5} {'tam':>4} {'kare p50':>9} {'kare p99':>9} {'verme p50':>10}  görünüm  (ms)")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "render.rec")
+        record_scenario(path, questions, "seeker", 7, args.frames, 1)
+        for display, scale, integer in SETTINGS:
+            view, frame, present = replay_at(path, display, scale, integer)
+            print(f"{display:<10} {scale:>5} {'evet' if integer == '1' else '':>4} {frame['p50']:>9.2f} "
+                  f"{frame['p99']:>9.2f} {present['p50']:>10.2f}  {view}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game_logic import GameState, run_frame  # noqa: E402
+from input_log import InputRecorder, replay, file_digest  # noqa: E402
+from profiler import FrameProfiler  # noqa: E402
+from question_bank import load_question_bank  # noqa: E402
+from simulate import POLICIES  # noqa: E402
+
+QUESTIONS_FILE = os.path.join(ROOT, "questions.txt")
+
+# Sabit senaryolar: (ad, politika, tohum, kare sayısı, oyuncu sayısı)
+SCENARIOS = [
+    ("bosta", "idle", 1, 1800, 1),
+    ("rastgele", "random", 2, 3600, 1),
+    ("avci", "seeker", 3, 3600, 1),
+    ("avci_4_oyuncu", "seeker", 4, 3600, 4),
+]
+
+
+def record_scenario(path, questions, policy, seed, frames, players):
+    """Politikayı kaydederek oynatır (kare başına bir adım, menüden hemen başlanır)."""
+    game = GameState(questions, seed=seed, players=players)
+    recorder = InputRecorder(path, seed, players, len(game.fishes), None, file_digest(QUESTIONS_FILE))
+    game.reset()
+    recorder.reset()
+    policy_fn = POLICIES[policy]
+    # Politika oyunun rng'sini kullanmamalı: Tekrarda politika çalışmadığı için oyun farklı sayılar çekerdi
+    policy_rng = random.Random(seed)
+    for _ in range(frames):
+        # Politikalar ilk oyuncunun durumuna bakar; diğer oyuncular aynı girdiyi kendi kancasıyla oynar
+        inputs = [policy_fn(game, policy_rng)] * players
+        recorder.frame(1, inputs)
+        run_frame(game, 1, inputs)
+    recorder.close(game)
+
+
+def replay_timed(path, questions):
+    profiler = FrameProfiler(window=10 ** 6)
+
+    def on_frame(game, events):
+        profiler.mark("step")
+        profiler.begin_frame()
+
+    profiler.begin_frame()
+    game, expected = replay(path, questions, on_frame)
+    p50, p95, p99 = profiler.report()["step"]
+    return game, expected, p50, p99
+
+
+def replay_rendered(path):
+    """fish.py'yi görüntü sürücüsü olmadan, kaydı sınırsız hızda oynatarak çalıştırır; kare süresi yüzdeliklerini döndürür."""
+    with tempfile.TemporaryDirectory() as tmp:
+        profile_path = os.path.join(tmp, "profile.json")
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", FISH_REPLAY=path,
+                   FISH_REPLAY_UNCAPPED="1", FISH_PROFILE_OUT=profile_path)
+        subprocess.run([sys.executable, "fish.py"], cwd=ROOT, env=env, check=False,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=600)
+        with open(profile_path, encoding="utf-8") as f:
+            frame = json.load(f)["percentiles_ms"]["frame"]
+    return frame["p50"], frame["p99"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sabit senaryoları kaydedip deterministik olarak yeniden oynatır.")
+    parser.add_argument("--render", action="store_true", help="tekrarı fish.py ile çizerek de ölç (dummy ekran)")
+    args = parser.parse_args()
+
+    questions = load_question_bank(QUESTIONS_FILE)
+    header = f"{'senaryo':<14} {'kare':>5} {'skorlar':<16} {'aynı':>4} {'adım p50':>9} {'adım p99':>9}"
+    if args.render:
+        header += f" {'çizim p50':>10} {'çizim p99':>10}"
+    print(header + "  (ms)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, policy, seed, frames, players in SCENARIOS:
+            path = os.path.join(tmp, f"{name}.rec")
+            record_scenario(path, questions, policy, seed, frames, players)
+            game, expected, p50, p99 = replay_timed(path, questions)
+            same = expected is not None and expected["players"] == [[p.score, p.correct_count, p.wrong_count]
+                                                                     for p in game.players]
+            scores = ",".join(str(p.score) for p in game.players)
+            line = f"{name:<14} {frames:>5} {scores:<16} {'evet' if same else 'HAYIR':>4} {p50:>9.3f} {p99:>9.3f}"
+            if args.render:
+                r50, r99 = replay_rendered(path)
+                line += f" {r50:>10.2f} {r99:>10.2f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Soğuk açılışta silinen önbellekler (atlas ve derlenmiş soru bankası yeniden üretilir)
+CACHE_FILES = ["assets/.atlas_cache.bin", "questions.txt.qbc"]
+
+
+def measure(cold):
+    """fish.py'yi görüntü sürücüsü olmadan başlatır; süreç başlangıcından itibaren (ilk kare, hazır, işler) döndürür."""
+    if cold:
+        for name in CACHE_FILES:
+            try:
+                os.remove(os.path.join(ROOT, name))
+            except OSError:
+                pass
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "startup.json")
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", FISH_STARTUP_OUT=out,
+                   FISH_TELEMETRY="0")
+        start = time.time()
+        subprocess.run([sys.executable, "fish.py"], cwd=ROOT, env=env, check=False,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+        with open(out, encoding="utf-8") as f:
+            result = json.load(f)
+    return result["first_frame"] - start, result["ready"] - start, result["tasks"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oyunun ilk menü karesine ve hazır olmasına kadar geçen süreyi ölçer.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cold", action="store_true", help="her çalıştırmadan önce atlas ve soru önbelleklerini sil")
+    args = parser.parse_args()
+
+    first_frames, readies, tasks = [], [], {}
+    for _ in range(args.runs):
+        first_frame, ready, timings = measure(args.cold)
+        first_frames.append(first_frame * 1000)
+        readies.append(ready * 1000)
+        for name, seconds in timings.items():
+            tasks.setdefault(name, []).append(seconds * 1000)
+
+    print(f"{args.runs} çalıştırma ({'soğuk' if args.cold else 'sıcak'} önbellek), süreç başlangıcından itibaren:")
+    print(f"  ilk menü karesi: medyan {statistics.median(first_frames):.0f} ms, maks {max(first_frames):.0f} ms")
+    print(f"  oyun hazır     : medyan {statistics.median(readies):.0f} ms, maks {max(readies):.0f} ms")
+    total = sum(statistics.median(times) for times in tasks.values())
+    for name, times in sorted(tasks.items()):
+        print(f"  {name:<10}: medyan {statistics.median(times):.0f} ms")
+    print(f"  arka plan işlerinin toplamı {total:.0f} ms (sırayla yapılsaydı ilk kareden önce beklenecek süre)")
+
+
+if __name__ == "__main__":
+    main()
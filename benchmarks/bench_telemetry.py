@@ -0,0 +1,91 @@
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import GameState  # noqa: E402
+from question_bank import load_question_bank  # noqa: E402
+from simulate import seeker_policy  # noqa: E402
+from telemetry import TelemetryWriter  # noqa: E402
+from telemetry_report import question_accuracy  # noqa: E402
+
+
+class _Counter:
+    def __init__(self):
+        self.events = 0
+
+    def __call__(self, event):
+        self.events += 1
+
+
+def run_sessions(questions, sessions, frames, sink_factory):
+    """`sessions` oyunu seeker politikasıyla oynatır; toplam adım süresini döndürür."""
+    step_time = 0.0
+    for seed in range(sessions):
+        game = GameState(questions, seed=seed)
+        sink = sink_factory(seed)
+        game.telemetry = sink
+        game.reset()
+        policy_rng = random.Random(seed)
+        for _ in range(frames):
+            inp = seeker_policy(game, policy_rng)
+            t0 = time.perf_counter()
+            game.step(inp)
+            step_time += time.perf_counter() - t0
+        if hasattr(sink, "close"):
+            sink.close()
+    return step_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Telemetri yazımının oyun adımına maliyetini ve rapor süresini ölçer.")
+    parser.add_argument("--sessions", type=int, default=200, help="her turda oynatılan oturum sayısı")
+    parser.add_argument("--frames", type=int, default=900)
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="tur sayısı; her turda üç ölçüm sırası değişerek art arda yapılır")
+    args = parser.parse_args()
+
+    questions = load_question_bank()
+    counter = _Counter()
+    base, counted, written = [], [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for repeat in range(args.repeats):
+            path = os.path.join(tmp, f"telemetry{repeat}.jsonl")
+            writers = []
+
+            def writer(seed):
+                w = TelemetryWriter(path, session=f"s{seed}").start(seed=seed)
+                writers.append(w)
+                return w
+
+            counter.events = 0
+            runs = [(base, lambda seed: None), (counted, lambda seed: counter), (written, writer)]
+            # Sıra her turda kaydırılır ki ısınma ve saat hızı değişimi hep aynı ölçüme binmesin
+            for times, sink_factory in runs[repeat % 3:] + runs[:repeat % 3]:
+                times.append(run_sessions(questions, args.sessions, args.frames, sink_factory))
+            events = sum(w.written for w in writers)
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        stats, sessions = question_accuracy([path])
+        query = time.perf_counter() - start
+
+    steps = args.sessions * args.frames
+    # Turlar içindeki farkların ortancası; gürültü farkı eksiye çekerse maliyet ölçülemeyecek kadar küçüktür
+    overhead = statistics.median(w - b for w, b in zip(written, base)) / max(1, counter.events)
+    overhead = f"{overhead * 1e6:.1f} µs" if overhead > 0 else "ölçülemeyecek kadar küçük"
+    print(f"{args.repeats} tur x {args.sessions} oturum x {args.frames} adım, turda {counter.events} oyun olayı")
+    print(f"adım süresi (ortanca): telemetrisiz {statistics.median(base) / steps * 1e6:.2f} µs, "
+          f"olay üretimi {statistics.median(counted) / steps * 1e6:.2f} µs, "
+          f"yazıcıyla {statistics.median(written) / steps * 1e6:.2f} µs")
+    print(f"yazıcı: turda {events} olay ({size / 1024:.0f} KiB), olay başına ek adım maliyeti {overhead}")
+    print(f"rapor: {sessions} oturum, {len(stats)} soru, {query * 1000:.0f} ms "
+          f"({events / query / 1000:.0f} bin olay/s)")
+
+if __name__ == "__main__":
+    main()
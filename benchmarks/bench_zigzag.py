@@ -0,0 +1,28 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import LINE_X, LINE_Y, HEIGHT  # noqa: E402
+from line_geometry import ZigzagLine, reference_zigzag_points  # noqa: E402
+
+
+def main(repeat=2000):
+    """İlk zikzak hesaplamasını tablolu ZigzagLine ile ip boylarına göre karşılaştırır."""
+    line = ZigzagLine()
+    start = (LINE_X, LINE_Y)
+    print(f"{'ip boyu':>8} {'nokta':>6} {'eski µs':>9} {'yeni µs':>9} {'hızlanma':>9} {'maks fark':>10}")
+    for depth in (50, 100, 200, 300, 400, HEIGHT - LINE_Y - 30):
+        end = (LINE_X + 150, LINE_Y + depth)
+        t = 1.234
+        old = timeit.timeit(lambda: reference_zigzag_points(start, end, t), number=repeat) / repeat * 1e6
+        new = timeit.timeit(lambda: line.points(start, end, t), number=repeat) / repeat * 1e6
+        ref = reference_zigzag_points(start, end, t)
+        got = line.points(start, end, t)
+        diff = max(max(abs(a[0] - b[0]), abs(a[1] - b[1])) for a, b in zip(ref, got))
+        print(f"{depth:>8} {len(ref):>6} {old:>9.1f} {new:>9.1f} {old / new:>8.1f}x {diff:>9} px")
+
+
+if __name__ == "__main__":
+    main()
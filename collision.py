@@ -0,0 +1,115 @@
+from bisect import bisect_left
+from operator import attrgetter
+
+_fish_x = attrgetter("x")
+
+
+def rects_overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """pygame.Rect.colliderect ile aynı kural: Kenarların sadece değmesi çarpışma sayılmaz."""
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class LaneSweep:
+    """Balıkları y şeritlerine ayırıp şerit içinde x'e göre süpüren geniş faz (broad-phase) yapısı.
+
+    Balıklar sadece yatay hareket ettiği için şeritleri yalnızca ekran dışından
+    yeniden doğduklarında değişir; bu durumda `sync()` çağrılır, diğer
+    karelerde bakım maliyeti yoktur. Sorgu sadece kancanın kestiği şeritlere
+    bakar; şerit listesi x'e göre sıralanır (balıklar aynı yöne gittiği için
+    liste neredeyse sıralıdır ve sıralama doğrusal sürer) ve ikili arama ile
+    kancanın x aralığındaki balıklara gidilir. Her şerit karede en fazla bir
+    kez sıralanır.
+    """
+
+    def __init__(self, fish_size, fishes=(), lane_height=None):
+        self.fish_size = fish_size
+        self.lane_height = lane_height or fish_size[1]
+        self._lanes = {}
+        self._lane_of = {}  # id(balık) -> şerit
+        self._order = {}  # id(balık) -> liste sırası (çakışma önceliği)
+        self._sorted_at = {}  # şerit -> en son sıralandığı kare
+        self.frame = 0
+        self.rebuild(fishes)
+
+    def rebuild(self, fishes):
+        """Yapıyı balık listesinden baştan kurar (liste sırası çakışma önceliğidir)."""
+        self._lanes.clear()
+        self._lane_of.clear()
+        self._order.clear()
+        self._sorted_at.clear()
+        for order, fish in enumerate(fishes):
+            self._order[id(fish)] = order
+            self._insert(fish)
+
+    def _insert(self, fish):
+        lane = int(fish.y) // self.lane_height
+        self._lanes.setdefault(lane, []).append(fish)
+        self._lane_of[id(fish)] = lane
+        self._sorted_at.pop(lane, None)
+
+    def sync(self, fish):
+        """Balığın y konumu (yeniden doğunca) değiştiyse şeridini günceller."""
+        lane = int(fish.y) // self.lane_height
+        old_lane = self._lane_of[id(fish)]
+        if lane == old_lane:
+            return
+        bucket = self._lanes[old_lane]
+        bucket.remove(fish)
+        if not bucket:
+            del self._lanes[old_lane]
+        self._insert(fish)
+
+    def next_frame(self):
+        """Balıklar hareket ettikten sonra çağrılır; şeritler bir sonraki sorguda yeniden sıralanır."""
+        self.frame += 1
+
+    def query(self, hx, hy, hw, hh, exclude=()):
+        """Kanca dikdörtgenine değen, yakalanmamış ve liste sırası en küçük balığı döndürür."""
+        fw, fh = self.fish_size
+        lh = self.lane_height
+        best_order = None
+        best = None
+        # int() kesmesi yüzünden sınırlar bir piksel gevşek tutulur; kesin kontrol rects_overlap ile
+        x_min = hx - fw - 1
+        x_max = hx + hw + 1
+        for lane in range((hy - fh + 1) // lh, (hy + hh - 1) // lh + 1):
+            bucket = self._lanes.get(lane)
+            if not bucket:
+                continue
+            if self._sorted_at.get(lane) != self.frame:
+                bucket.sort(key=_fish_x)
+                self._sorted_at[lane] = self.frame
+            for i in range(bisect_left(bucket, x_min, key=_fish_x), len(bucket)):
+                fish = bucket[i]
+                if fish.x >= x_max:
+                    break
+                if fish.caught or fish in exclude:
+                    continue
+                if rects_overlap(hx, hy, hw, hh, int(fish.x), int(fish.y), fw, fh):
+                    order = self._order[id(fish)]
+                    if best_order is None or order < best_order:
+                        best_order, best = order, fish
+        return best
+
+    def query_many(self, hook_rects):
+        """Birden fazla kanca için çarpışmaları bulur; bir balık en fazla bir kancaya gider.
+
+        Dönüş: Her kanca için balık veya None listesi.
+        """
+        claimed = set()
+        result = []
+        for hx, hy, hw, hh in hook_rects:
+            fish = self.query(hx, hy, hw, hh, claimed)
+            if fish is not None:
+                claimed.add(fish)
+            result.append(fish)
+        return result
+
+
+def linear_query(fishes, fish_size, hx, hy, hw, hh):
+    """Karşılaştırma için ilk (doğrusal tarama) yöntem."""
+    fw, fh = fish_size
+    for fish in fishes:
+        if not fish.caught and rects_overlap(hx, hy, hw, hh, int(fish.x), int(fish.y), fw, fh):
+            return fish
+    return None
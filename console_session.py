@@ -0,0 +1,312 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import serial
+
+from serial_input import SerialReader, ControlConsumer, AsciiDecoder, LatencyStats, negotiate_protocol
+
+try:
+    from serial.tools import list_ports
+except ImportError:  # pyserial'in araçları olmayan eski/küçültülmüş kurulumlar
+    list_ports = None
+
+# Otomatik taramada aday sayılan USB seri dönüştürücülerin üretici kimlikleri (VID):
+# Arduino, Arduino.org, CH340 (klonlar), FTDI, CP210x
+ARDUINO_VIDS = {0x2341, 0x2A03, 0x1A86, 0x0403, 0x10C4}
+
+
+def discover_ports():
+    """Bağlı USB seri aygıtlarından Arduino olabilecek portların listesi."""
+    if list_ports is None:
+        return []
+    try:
+        return [p.device for p in list_ports.comports() if p.vid in ARDUINO_VIDS]
+    except Exception:
+        return []
+
+
+class _Disconnected:
+    """Bağlantısı kopmuş konsolun oyun döngüsü tarafı: Girdi yok, klavyeye düşülür."""
+
+    @staticmethod
+    def poll():
+        return 0, -1
+
+    @staticmethod
+    def frame_presented():
+        pass
+
+
+DISCONNECTED = _Disconnected()
+
+
+class Controller:
+    """Oturumdaki tek bir konsol yuvası: seri port, okuyucu iş parçacığı ve oyun döngüsü tarafı.
+
+    Yuva bağlantı koptuğunda da oturumda kalır (oyuncu sırası değişmez);
+    yeniden bağlanınca aynı yuvaya yeni bir okuyucu takılır. Oyun döngüsü
+    sadece `consumer` özniteliğini okur; bu öznitelik tek atamayla değişir.
+    """
+
+    def __init__(self, port):
+        self.port = port
+        self.ser = None
+        self.reader = None
+        self.consumer = DISCONNECTED
+        self.latency = LatencyStats()
+        self.connected = False
+        self.dropouts = 0
+        self.reconnects = 0
+        self.reconnect_latency = LatencyStats(smoothing=0.3)
+        self.disconnected_at = None
+        self.retry_delay = 0.0
+        self.next_attempt = 0.0
+
+    @property
+    def decoder(self):
+        return self.reader.decoder if self.reader else None
+
+    def attach(self, port, ser, decoder):
+        self.port = port
+        self.ser = ser
+        self.reader = SerialReader(ser, decoder, self.latency).start()
+        self.connected = True
+        self.consumer = ControlConsumer(self.reader)
+
+    def detach(self):
+        self.consumer = DISCONNECTED
+        self.connected = False
+        if self.reader:
+            self.reader.stop()
+        try:
+            self.ser.close()
+        except Exception:
+            pass
+
+
+class ConsoleSession:
+    """Birden fazla Arduino konsolunu aynı anda yöneten ve kopan bağlantıları onaran oturum.
+
+    Her konsolun kendi okuyucu iş parçacığı vardır (SerialReader); okuyucular
+    porttan bloklanarak okur ve oyun döngüsü her karede sadece anlık
+    görüntüleri toplar, yani kare başına maliyet konsol sayısıyla doğrusal ve
+    küçüktür. Açılışta tüm portlar önce açılır, Arduino'ların resetlenmesi
+    için bir kez beklenir ve protokol müzakereleri paralel yapılır; böylece
+    açılış süresi konsol sayısıyla büyümez.
+
+    `start()` ile arka planda bir gözetmen iş parçacığı çalışır: Okuyucusu
+    hata veren konsolu kopmuş sayar (oyuncu hemen klavyeye düşer), portu
+    artan bekleme süreleriyle (`retry_min` → `retry_max`) yeniden dener ve
+    `discover` açıksa yeni takılan Arduino'ları bulup el sıkışmasından
+    geçirir. Bağlanma ve kopmalar `events()` ile oyun döngüsüne bildirilir.
+
+    Kopmuş bir yuva sadece kendi portu geri gelince bağlanır; yeni aygıtlar
+    yeni yuva alır. `max_controllers` verilirse (örn. oyuncu sayısı sabitse)
+    yuva sayısı bununla sınırlıdır ve fazla aygıtlar hiç açılmaz.
+    """
+
+    def __init__(self, ports, baud_rate, binary_baud=None, reset_delay=0.5, open_port=serial.Serial,
+                 discover=False, scan_interval=0.25, discover_interval=2.0, retry_min=0.25, retry_max=5.0,
+                 probe_timeout=0.5, max_controllers=None):
+        self.ports = list(ports)
+        self.baud_rate = baud_rate
+        self.binary_baud = binary_baud
+        self.reset_delay = reset_delay
+        self.open_port = open_port
+        self.discover = discover
+        self.scan_interval = scan_interval
+        self.discover_interval = discover_interval
+        self.retry_min = retry_min
+        self.retry_max = retry_max
+        self.probe_timeout = probe_timeout
+        self.max_controllers = max_controllers
+        self.controllers = []
+        self.failed_ports = []
+        self._rejected = {}  # port -> tekrar denenebileceği an (el sıkışmayan aygıtlar)
+        self._events = queue.SimpleQueue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ConsoleSupervisor", daemon=True)
+
+    def open(self):
+        """Portları açar ve okuyucuları başlatır; bağlanan konsol sayısını döndürür."""
+        candidates = list(self.ports)
+        if self.discover:
+            candidates += [port for port in discover_ports() if port not in candidates]
+        opened = []
+        for port in candidates:
+            try:
+                opened.append((port, self.open_port(port, self.baud_rate, timeout=0.05)))
+            except (serial.SerialException, OSError):
+                if port in self.ports:
+                    self.failed_ports.append(port)
+        if not opened:
+            return 0
+
+        time.sleep(self.reset_delay)  # Arduino'ların resetlenmesini bekle (hepsi için bir kez)
+        with ThreadPoolExecutor(max_workers=len(opened)) as executor:
+            decoders = list(executor.map(lambda item: self._handshake(*item), opened))
+
+        for (port, ser), decoder in zip(opened, decoders):
+            if decoder is None:
+                self._reject(port, ser)
+                continue
+            controller = Controller(port)
+            controller.attach(port, ser, decoder)
+            self.controllers.append(controller)
+        return len(self.controllers)
+
+    def start(self):
+        """Kopma/yeniden bağlanma gözetmenini başlatır."""
+        self._thread.start()
+        return self
+
+    def __len__(self):
+        return len(self.controllers)
+
+    @property
+    def connected_count(self):
+        return sum(1 for c in self.controllers if c.connected)
+
+    def poll(self):
+        """Her konsol için (ky040_pull_down, pot_value) listesi döndürür; kopmuş konsollar (0, -1) verir."""
+        return [c.consumer.poll() for c in self.controllers]
+
+    def frame_presented(self):
+        for c in self.controllers:
+            c.consumer.frame_presented()
+
+    def events(self):
+        """Gözetmenin bildirdiği [(tür, port)] listesi; tür "connected" | "reconnected" | "dropped"."""
+        ready = []
+        while True:
+            try:
+                ready.append(self._events.get_nowait())
+            except queue.Empty:
+                return ready
+
+    def close(self):
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join(1.0)
+        for c in self.controllers:
+            if c.reader:
+                c.reader.stop()
+        for c in self.controllers:
+            try:
+                c.ser.close()
+            except Exception:
+                pass
+
+    def summary(self):
+        """Kapanışta yazdırılacak konsol başına protokol, gecikme ve bağlantı satırları."""
+        lines = []
+        for c in self.controllers:
+            if c.decoder:
+                lines.append(f"{c.port}: {c.decoder.summary()}")
+            lines.append(f"{c.port}: {c.latency.summary()}")
+            if c.dropouts:
+                lines.append(f"{c.port}: {c.dropouts} kopma, {c.reconnects} yeniden bağlanma, "
+                             f"süre ort {c.reconnect_latency.avg_ms:.0f} ms, maks {c.reconnect_latency.max_ms:.0f} ms")
+        return lines
+
+    # -------------------------
+    # Gözetmen (arka plan iş parçacığı)
+    # -------------------------
+    def _handshake(self, port, ser):
+        """Protokolü müzakere eder; çözücü veya (taramayla bulunan sessiz aygıtta) None döndürür.
+
+        Elle verilen portlar eskisi gibi yanıt olmasa da ASCII kabul edilir;
+        taramayla bulunan portta ise ikili el sıkışma ya da geçerli bir ASCII
+        satırı görülmeden aygıt konsol sayılmaz.
+        """
+        decoder = negotiate_protocol(ser, self.binary_baud) if self.binary_baud else AsciiDecoder()
+        if port in self.ports or decoder.name != "ascii":
+            return decoder
+        deadline = time.perf_counter() + self.probe_timeout
+        try:
+            while time.perf_counter() < deadline:
+                if decoder.feed(ser.read(ser.in_waiting or 1)):
+                    return decoder
+        except Exception:
+            pass
+        return None
+
+    def _reject(self, port, ser):
+        self._rejected[port] = time.perf_counter() + self.retry_max
+        try:
+            ser.close()
+        except Exception:
+            pass
+
+    def _connect(self, port):
+        try:
+            ser = self.open_port(port, self.baud_rate, timeout=0.05)
+        except (serial.SerialException, OSError):
+            return None
+        self._stopped.wait(self.reset_delay)
+        decoder = self._handshake(port, ser)
+        if decoder is None:
+            self._reject(port, ser)
+            return None
+        return ser, decoder
+
+    def _run(self):
+        next_discover = 0.0
+        while not self._stopped.wait(self.scan_interval):
+            now = time.perf_counter()
+            for c in self.controllers:
+                if c.connected and c.reader.error is not None:
+                    c.detach()
+                    c.dropouts += 1
+                    c.disconnected_at = now
+                    c.retry_delay = self.retry_min
+                    c.next_attempt = now  # İlk deneme hemen, sonrakiler artan aralıklarla
+                    self._events.put(("dropped", c.port))
+            for c in self.controllers:
+                if not c.connected and now >= c.next_attempt and not self._stopped.is_set():
+                    self._retry(c)
+                    now = time.perf_counter()
+            if self.discover and now >= next_discover:
+                next_discover = now + self.discover_interval
+                self._discover_new()
+
+    def _retry(self, c):
+        link = self._connect(c.port)
+        if link is None:
+            c.next_attempt = time.perf_counter() + c.retry_delay
+            c.retry_delay = min(c.retry_delay * 2 or self.retry_min, self.retry_max)
+            return
+        self._attach(c, c.port, *link)
+
+    def _attach(self, c, port, ser, decoder):
+        c.attach(port, ser, decoder)
+        if c.disconnected_at is not None:
+            c.reconnects += 1
+            c.reconnect_latency.add(time.perf_counter() - c.disconnected_at)
+            c.disconnected_at = None
+            self._events.put(("reconnected", port))
+        else:
+            self._events.put(("connected", port))
+
+    def _discover_new(self):
+        """Yeni takılan aygıtları dener ve her birini yeni bir yuvaya yerleştirir.
+
+        Bilinen portlar (kopmuş olanlar dahil) atlanır; onları `_retry` kendi
+        yuvalarına bağlar, böylece bir oyuncunun yuvasını başka aygıt almaz.
+        """
+        now = time.perf_counter()
+        known = {c.port for c in self.controllers}
+        for port in discover_ports():
+            if self.max_controllers is not None and len(self.controllers) >= self.max_controllers:
+                return
+            if port in known or self._rejected.get(port, 0.0) > now or self._stopped.is_set():
+                continue
+            link = self._connect(port)
+            if link is None:
+                continue
+            controller = Controller(port)
+            self.controllers.append(controller)
+            self._attach(controller, port, *link)
+            known.add(port)
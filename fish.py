@@ -1,180 +1,310 @@
 import pygame
-import random
-import math
 import sys
+import json
 import os
-import serial
+import random
 import time
+from collections import OrderedDict
+
+import asset_atlas
+import hot_reload
+import input_log
+import telemetry
+import question_bank
+from frame_pacing import FramePacer, QUALITY_FULL, QUALITY_REDUCED, QUALITY_MINIMAL
+from hud import AllocationCounter, HudLayer, FeedbackPanels
+import particles
+from startup import StartupLoader
+from line_geometry import ZigzagLine, SEGMENT_LENGTH
+from render_scale import RenderScale, parse_size
+from profiler import FrameProfiler
+from console_session import ConsoleSession
+import game_logic
+from game_logic import (GameState, ControlInput, NO_INPUT, FixedTimestep, run_frame, WIDTH, HEIGHT, FISH_SIZE,
+                        HOOK_SIZE, LINE_X, LINE_Y, FEEDBACK_FRAMES, ZIGZAG_FREQUENCY, ZIGZAG_AMPLITUDE)
 
 # --- SERİ PORT AYARLARI ---
 SERIAL_PORT = 'COM7'  # <--- BURAYI ARDUINO'NUZA UYGUN PORT İLE DEĞİŞTİRİNİZ!
+# Çok oyunculu mod: Her konsol için bir port ekleyin, örn. ['COM7', 'COM8', 'COM9']
+# Her konsol kendi kancasını ve skorunu kontrol eder; balıklar ve soru ortaktır.
+SERIAL_PORTS = [SERIAL_PORT]
 BAUD_RATE = 9600
+# İkili protokolü destekleyen konsollarla açılışta müzakere edilir; olmazsa "D/P" ASCII kullanılır
+USE_BINARY_PROTOCOL = True
+BINARY_BAUD_RATE = 115200
 
-ser = None
+session = None
 SERIAL_ENABLED = False
+telemetry_writer = None
 
 
 def init_serial():
-    """Seri port bağlantısını kurar ve global değişkenleri ayarlar."""
-    global ser, SERIAL_ENABLED
-    try:
-        # Bağlantıyı kur (Kısa zaman aşımı, oyunun kilitlenmesini önler)
-        ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=0.01)
-        time.sleep(0.5)  # Arduino'nun resetlenmesini bekle (2 saniye çok uzun olabilir)
-        print(f"✅ Seri port {SERIAL_PORT} başarıyla bağlandı. Kontroller aktif.")
-        SERIAL_ENABLED = True
-    except serial.SerialException:
-        print(f"❌ HATA: Seri port {SERIAL_PORT} bulunamadı. Klavye kontrolü kullanılacak.")
-        SERIAL_ENABLED = False
+    """Konsolların seri portlarına bağlanır, okuyucu iş parçacıklarını başlatır ve global değişkenleri ayarlar."""
+    global session, SERIAL_ENABLED
+    # Bağlantıları kur (Okuma arka plan iş parçacıklarında yapılır, oyun döngüsü beklemez).
+    # Ayarlı portlara ek olarak takılı Arduino'lar taranır; kopan konsollar arka planda
+    # yeniden bağlanır ve sonradan takılan konsollar da oyuna katılır.
+    session = ConsoleSession(SERIAL_PORTS, BAUD_RATE, BINARY_BAUD_RATE if USE_BINARY_PROTOCOL else None,
+                             discover=True)
+    session.open()
+    session.start()
+    for controller in session.controllers:
+        print(f"✅ Seri port {controller.port} başarıyla bağlandı ({controller.decoder.name} protokolü). "
+              f"Kontroller aktif.")
+    for port in session.failed_ports:
+        print(f"❌ HATA: Seri port {port} bulunamadı.")
+    SERIAL_ENABLED = session.connected_count > 0
+    if not SERIAL_ENABLED:
+        print("Klavye kontrolü kullanılacak.")
+
+
+def handle_console_events():
+    """Arka plandaki bağlantı gözetmeninin bildirimlerini işler; durum değiştiyse True döner."""
+    global SERIAL_ENABLED
+    events = session.events()
+    for kind, port in events:
+        if kind == "dropped":
+            print(f"⚠️ Seri port {port} bağlantısı koptu; klavyeye geçildi, yeniden bağlanılıyor...")
+        else:
+            print(f"🔄 Seri port {port} {'yeniden ' if kind == 'reconnected' else ''}bağlandı.")
+    SERIAL_ENABLED = session.connected_count > 0
+    return bool(events)
 
 
 # Güvenli çıkış için tüm kodu bir try bloğuna alıyoruz.
 try:
-    init_serial()  # Program başlarken seri bağlantıyı dene
-
-    # Pygame'i başlat
-    pygame.init()
+    # Pygame'in sadece ekran ve font modüllerini başlat (ses vb. kullanılmıyor).
+    # Seri bağlantı, görseller ve sorular menü açıldıktan sonra arka planda yüklenir.
+    pygame.display.init()
+    pygame.font.init()
 
     # -------------------------
     # Sabitler ve Ayarlar
     # -------------------------
-    WIDTH, HEIGHT = 1024, 600
-    win = pygame.display.set_mode((WIDTH, HEIGHT))
+    # Çizim çözünürlüğü: Oyun kuralları her zaman WIDTH x HEIGHT dünya koordinatlarındadır.
+    # FISH_DISPLAY=1920x1080 pencere/panel boyutu ("native": masaüstü boyutunda tam ekran),
+    # FISH_RENDER_SCALE=0.5 tuvalin ekrandaki alana oranı (küçük = hızlı, bulanık),
+    # FISH_INTEGER_SCALE=1 tuvali tamsayı katlarla büyütür (render_scale.py).
+    DISPLAY_SETTING = os.environ.get("FISH_DISPLAY", f"{WIDTH}x{HEIGHT}")
+    display_flags = 0
+    if DISPLAY_SETTING == "native":
+        info = pygame.display.Info()
+        DISPLAY_SIZE = (info.current_w, info.current_h)
+        display_flags = pygame.FULLSCREEN
+    else:
+        DISPLAY_SIZE = parse_size(DISPLAY_SETTING)
+    VIEW = RenderScale(DISPLAY_SIZE, (WIDTH, HEIGHT), float(os.environ.get("FISH_RENDER_SCALE", "1")),
+                       os.environ.get("FISH_INTEGER_SCALE") == "1")
+    SCALE = VIEW.scale  # Dünya -> tuval pikseli
+    CANVAS_W, CANVAS_H = VIEW.canvas_size
+    FISH_DRAW_SIZE = VIEW.size(FISH_SIZE)
+    HOOK_DRAW_SIZE = VIEW.size(HOOK_SIZE)
+    screen = pygame.display.set_mode(DISPLAY_SIZE, display_flags)
     pygame.display.set_caption("Eğitsel Balık Tutma Oyunu")
+    # Tüm çizimler bu yüzeye yapılır; VIEW.present() onu ekrana verir
+    win = VIEW.canvas_for(screen)
+    print(f"Görüntü: {VIEW.summary()}")
+    if VIEW.render_scale != VIEW.requested_scale:
+        print(f"⚠️ FISH_RENDER_SCALE={VIEW.requested_scale} tamsayı büyütmeyle kullanılamıyor; {VIEW.render_scale:.3g} uygulandı.")
 
     CLOCK = pygame.time.Clock()
 
-    # Font ayarları
-    FONT = pygame.font.SysFont(None, 28, bold=True)
-    FONT_QUESTION = pygame.font.SysFont(None, 36, bold=True)
-    FONT_FISH = pygame.font.SysFont(None, 20)
-    FONT_FEEDBACK = pygame.font.SysFont(None, 40, bold=True)
+    # Kirli dikdörtgen (dirty-rect) çizimi: Sadece değişen bölgeler arka plandan
+    # geri yüklenir ve ekrana gönderilir. False ise her kare tam ekran çizilir.
+    DIRTY_RECT_RENDERING = True
+    SCREEN_RECT = win.get_rect()
+
+    # Ekran yenileme hızı: Oyun kuralları her zaman 60 adım/sn ilerler, ekran
+    # FISH_FPS hızında (örn. 120 Hz ekran için 120, 0 = sınırsız) çizilir ve
+    # adımlar arası konumlar ara değerlenir. Kare bütçesi sürekli aşılırsa
+    # çizim kalitesi kendiliğinden düşürülür (frame_pacing.py).
+    TARGET_FPS = int(os.environ.get("FISH_FPS", "60"))
+    pacer = FramePacer(TARGET_FPS)
+
+    # Kare profili: F3 ile ekran üstü panel açılır/kapanır. FISH_PROFILE_OUT ortam
+    # değişkeni bir dosya yolu (.csv veya .json) verirse ölçümler çıkışta oraya yazılır
+    # (kare kare kayıt son 36000 kareyi, 60 FPS'te 10 dakikayı tutar).
+    PROFILE_OUTPUT = os.environ.get("FISH_PROFILE_OUT")
+    profiler = FrameProfiler(budget=pacer.budget, record=bool(PROFILE_OUTPUT))
+    show_profiler = False
+    profiler_surf = None
+
+    # Girdi kaydı / tekrar oynatma: FISH_RECORD=oturum.rec oyunun tohumunu ve kare kare
+    # girdilerini kaydeder; FISH_REPLAY=oturum.rec canlı girdi yerine kaydı aynen oynatır.
+    # FISH_REPLAY_UNCAPPED=1 tekrarı 60 FPS sınırı olmadan çalıştırır (ölçüm için).
+    RECORD_PATH = os.environ.get("FISH_RECORD")
+    REPLAY_PATH = os.environ.get("FISH_REPLAY")
+    REPLAY_UNCAPPED = os.environ.get("FISH_REPLAY_UNCAPPED") == "1"
+
+    # Telemetri: Her soru, yakalama ve cevap arka planda FISH_TELEMETRY dosyasının
+    # (varsayılan telemetry.jsonl) sonuna eklenir; FISH_TELEMETRY=0 kapatır.
+    # Tekrar oynatmada aynı oturum ikinci kez yazılmasın diye kapalıdır.
+    TELEMETRY_PATH = os.environ.get("FISH_TELEMETRY", "telemetry.jsonl")
 
-    # Hız Ayarları
-    AUTO_SINK_SPEED = 0.5
-    PULL_SPEED = 10.0
-    HORIZONTAL_SPEED = 6.0
+    # Açılış ölçümü: FISH_STARTUP_OUT=dosya.json ilk menü karesinin ve yüklemelerin
+    # bitiş zamanlarını yazar ve oyun hazır olunca çıkar (benchmarks/bench_startup.py).
+    STARTUP_OUTPUT = os.environ.get("FISH_STARTUP_OUT")
 
-    # Zikzak İp Efekti Ayarları
-    ZIGZAG_AMPLITUDE = 10
-    ZIGZAG_FREQUENCY = 0.1
 
-    # İp Salınım Efekti Ayarları
-    SWAY_AMPLITUDE = 80.0
-    SWAY_SPEED = 0.1
+    # Font ayarları: Varsayılan font doğrudan açılır; SysFont(None, ...) aynı fontu
+    # verir ama önce sistemdeki tüm fontları tarar (fc-list), bu da açılışı geciktirir.
+    def default_font(size, bold=False):
+        font = pygame.font.Font(None, max(8, int(size * SCALE)))
+        font.set_bold(bold)
+        return font
+
+
+    FONT = default_font(28, bold=True)
+    FONT_QUESTION = default_font(36, bold=True)
+    FONT_FISH = default_font(20)
+    FONT_FEEDBACK = default_font(40, bold=True)
+
+    # Çizim yolunda oluşturulan yüzeylerin sayacı (F3 panelinde ve çıkışta gösterilir)
+    ALLOCATIONS = AllocationCounter()
+
+
+    # -------------------------
+    # Yazı Yüzeyi Önbelleği
+    # -------------------------
+    class TextCache:
+        """(font, metin, renk) anahtarlı, sınırlı boyutlu LRU yazı yüzeyi önbelleği.
+
+        Aynı metin her karede yeniden rasterleştirilmez; hits/misses sayaçları
+        önbelleğin ne kadar işe yaradığını gösterir.
+        """
+
+        def __init__(self, max_size=256):
+            self.max_size = max_size
+            self._surfaces = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+        def render(self, font, text, color):
+            key = (font, text, tuple(color))
+            surf = self._surfaces.get(key)
+            if surf is not None:
+                self._surfaces.move_to_end(key)
+                self.hits += 1
+                return surf
+            self.misses += 1
+            ALLOCATIONS.add()
+            surf = font.render(text, True, color)
+            self._surfaces[key] = surf
+            if len(self._surfaces) > self.max_size:
+                self._surfaces.popitem(last=False)  # En eski kullanılanı at
+            return surf
+
+        def clear(self):
+            self._surfaces.clear()
+
+
+    TEXT_CACHE = TextCache()
 
     # -------------------------
     # EĞİTSEL VERİLERİ DOSYADAN YÜKLEME
     # -------------------------
+    QUESTIONS_FILE = "questions.txt"
     QUESTION_DATA = []
-    ALL_ANSWERS_AND_DISTRACTORS = []
 
 
-    def load_questions_from_file(filename="questions.txt"):
-        """Soruları, cevapları ve çeldiricileri dosyadan okur ve QUESTION_DATA'yı doldurur."""
-        global QUESTION_DATA, ALL_ANSWERS_AND_DISTRACTORS
-        QUESTION_DATA = []
-        all_answers = set()
+    def report_question_errors(bank, filename):
+        for error in bank.errors[:10]:
+            print(f"⚠️ {filename}: {error}")
+        if len(bank.errors) > 10:
+            print(f"⚠️ {filename}: {len(bank.errors) - 10} hatalı satır daha atlandı.")
 
-        # --- Yedek (Fallback) Soru Verileri ---
-        DEFAULT_QUESTIONS = [
-            {"question": "Yedek Soru: 1 + 1 kaç eder?", "answer": "2", "distractors": ["3", "4", "5", "6"]},
-            {"question": "Yedek Soru: Pygame ne dilidir?", "answer": "Python",
-             "distractors": ["C++", "Java", "Ruby", "C#"]},
-        ]
 
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        parts = line.split('|')
-                        if len(parts) < 3:
-                            continue
-
-                        question_text = parts[0].replace("SORU:", "").strip()
-                        answer_text = parts[1].replace("CEVAP:", "").strip()
-                        distractors_text = parts[2].replace("YANCILAR:", "").strip()
-                        distractors_list = [d.strip() for d in distractors_text.split(',')]
-
-                        if question_text and answer_text:
-                            QUESTION_DATA.append({
-                                "question": question_text,
-                                "answer": answer_text,
-                                "distractors": distractors_list
-                            })
-                            all_answers.add(answer_text)
-                            all_answers.update(distractors_list)
-
-                    except IndexError:
-                        pass
-
-        except FileNotFoundError:
-            pass
-        except Exception:
-            pass
-
-        # Yedek verileri kullan
-        if not QUESTION_DATA:
-            QUESTION_DATA = DEFAULT_QUESTIONS
-            for q in QUESTION_DATA:
-                all_answers.add(q["answer"])
-                all_answers.update(q["distractors"])
-
-        ALL_ANSWERS_AND_DISTRACTORS = list(all_answers)
+    def load_questions_from_file(filename=QUESTIONS_FILE):
+        """Soru bankasını (derlenmiş önbellekten) yükler ve hatalı satırları raporlar."""
+        global QUESTION_DATA
+        QUESTION_DATA = question_bank.load_question_bank(filename)
+        report_question_errors(QUESTION_DATA, filename)
 
 
     # -------------------------
     # Görsellerin Ölçeklendirilmesi ve Yüklenmesi
     # -------------------------
-    FISH_SIZE = (80, 40)
     background = None
     hook_img = None
     fish_sprites = []
+    asset_frames = {}  # Atlas kareleri (ad -> Surface); sıcak yeniden yüklemede güncellenir
 
 
     def create_fallback_fish(color):
         """Basit bir ok/üçgen şekliyle yedek balık yüzeyleri oluşturur."""
-        surf1 = pygame.Surface(FISH_SIZE, pygame.SRCALPHA)
-        surf2 = pygame.Surface(FISH_SIZE, pygame.SRCALPHA)
-        pygame.draw.polygon(surf1, color, [(0, FISH_SIZE[1] // 2), (FISH_SIZE[0], 0), (FISH_SIZE[0], FISH_SIZE[1])])
-        pygame.draw.polygon(surf2, color,
-                            [(5, FISH_SIZE[1] // 2), (FISH_SIZE[0] - 5, 0), (FISH_SIZE[0] - 5, FISH_SIZE[1])])
+        w, h = FISH_DRAW_SIZE
+        inset = VIEW.px(5)
+        surf1 = pygame.Surface(FISH_DRAW_SIZE, pygame.SRCALPHA)
+        surf2 = pygame.Surface(FISH_DRAW_SIZE, pygame.SRCALPHA)
+        pygame.draw.polygon(surf1, color, [(0, h // 2), (w, 0), (w, h)])
+        pygame.draw.polygon(surf2, color, [(inset, h // 2), (w - inset, 0), (w - inset, h)])
         return [surf1, surf2]
 
 
-    def load_assets():
-        """Tüm oyun görsellerini yükler veya yedeklerini oluşturur."""
-        global background, hook_img, fish_sprites
+    # Kullanılan, ölçeklenmiş kareler tek bir atlas önbelleğinde tutulur.
+    # Önbellek kaynak PNG'lerin değişme zamanı ve hedef boyutlara göre geçersiz olur.
+    ATLAS_CACHE_PATH = "assets/.atlas_cache.bin"
+    # Görseller tuval çözünürlüğünde ölçeklenir (boyut önbellek anahtarına dahildir)
+    BACKGROUND_SPEC = ("background", "assets/background.png", VIEW.canvas_size)
+    SPRITE_SPECS = [
+        ("hook", "assets/hook.png", HOOK_DRAW_SIZE),
+        ("fish1_1", "assets/fish1_1.png", FISH_DRAW_SIZE),
+        ("fish1_2", "assets/fish1_2.png", FISH_DRAW_SIZE),
+        ("fish3_1", "assets/fish3_1.png", FISH_DRAW_SIZE),
+        ("fish3_2", "assets/fish3_2.png", FISH_DRAW_SIZE),
+    ]
+    FISH_ANIMATIONS = [["fish1_1", "fish1_2"], ["fish3_1", "fish3_2"]]
+
+
+    def read_assets():
+        """Arka plan iş parçacığı: Atlası önbellekten okur veya üretir (convert ana iş parçacığında yapılır)."""
+        return asset_atlas.read_atlas(BACKGROUND_SPEC, SPRITE_SPECS, ATLAS_CACHE_PATH)
+
+
+    def apply_assets(atlas, error):
+        """Okunan atlası kullanıma hazırlar; okunamadıysa görselleri tek tek yükler."""
+        global background, hook_img, fish_sprites, asset_frames
+        if error is not None:
+            if not isinstance(error, (pygame.error, OSError)):
+                raise error
+            load_assets_individually()
+            return
+        background, frames = asset_atlas.finish_atlas(*atlas)
+        asset_frames = frames
+        hook_img = frames["hook"]
+        fish_sprites = [[frames[name] for name in animation] for animation in FISH_ANIMATIONS]
+
+
+    def load_assets_individually():
+        """Görselleri tek tek yükler; eksik olanların yerine yedeklerini oluşturur."""
+        global background, hook_img
 
         # Arka plan
         try:
             background = pygame.image.load("assets/background.png").convert()
-            background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+            background = pygame.transform.scale(background, VIEW.canvas_size)
         except pygame.error:
-            background = pygame.Surface((WIDTH, HEIGHT))
+            background = pygame.Surface(VIEW.canvas_size)
             background.fill((0, 100, 150))
 
         # Olta/Kanca görseli
         try:
             hook_img = pygame.image.load("assets/hook.png").convert_alpha()
-            hook_img = pygame.transform.scale(hook_img, (40, 40))
+            hook_img = pygame.transform.scale(hook_img, HOOK_DRAW_SIZE)
         except pygame.error:
-            hook_img = pygame.Surface((40, 40), pygame.SRCALPHA)
-            pygame.draw.circle(hook_img, (200, 200, 200), (20, 20), 15)
+            hook_img = pygame.Surface(HOOK_DRAW_SIZE, pygame.SRCALPHA)
+            pygame.draw.circle(hook_img, (200, 200, 200), (HOOK_DRAW_SIZE[0] // 2, HOOK_DRAW_SIZE[1] // 2),
+                               VIEW.px(15))
 
         # Balık görselleri
         try:
             fish_sprites.append([
-                pygame.transform.scale(pygame.image.load("assets/fish1_1.png").convert_alpha(), FISH_SIZE),
-                pygame.transform.scale(pygame.image.load("assets/fish1_2.png").convert_alpha(), FISH_SIZE)
+                pygame.transform.scale(pygame.image.load("assets/fish1_1.png").convert_alpha(), FISH_DRAW_SIZE),
+                pygame.transform.scale(pygame.image.load("assets/fish1_2.png").convert_alpha(), FISH_DRAW_SIZE)
             ])
             fish_sprites.append([
-                pygame.transform.scale(pygame.image.load("assets/fish3_1.png").convert_alpha(), FISH_SIZE),
-                pygame.transform.scale(pygame.image.load("assets/fish3_2.png").convert_alpha(), FISH_SIZE)
+                pygame.transform.scale(pygame.image.load("assets/fish3_1.png").convert_alpha(), FISH_DRAW_SIZE),
+                pygame.transform.scale(pygame.image.load("assets/fish3_2.png").convert_alpha(), FISH_DRAW_SIZE)
             ])
         except pygame.error:
             if not fish_sprites:
@@ -182,382 +312,600 @@ try:
                 fish_sprites.append(create_fallback_fish((255, 192, 203)))
 
 
-    load_assets()
-    load_questions_from_file()
-
     # -------------------------
-    # Oyun değişkenleri
+    # Menü
     # -------------------------
-    line_x = WIDTH // 2
-    line_y = 50
-    HOOK_INITIAL_X = WIDTH - 150
-    hook_x_anchor = float(HOOK_INITIAL_X)
-    hook_pos = [float(HOOK_INITIAL_X), float(line_y)]
-    score = 0
-    game_state = "MENU"
-    caught_fish = None
-    time_counter = 0
-    feedback_timer = 0
-    current_question_data = {}
-    current_question = ""
-    current_answer = ""
+    STARTUP_LABELS = {"serial": "konsollar", "assets": "görseller", "questions": "sorular"}
+
+
+    def draw_menu(loading=()):
+        """Menüyü çizer; `loading` boş değilse SPACE yerine yüklenmekte olan işler gösterilir."""
+        win.fill((20, 20, 40))
+        title = TEXT_CACHE.render(FONT, "Eğitsel Balık Tutma Oyunu", (255, 255, 255))
+
+        if loading:
+            text = TEXT_CACHE.render(FONT, "Yükleniyor: " + ", ".join(STARTUP_LABELS[name] for name in loading),
+                                     (200, 200, 200))
+        elif QUESTION_DATA:
+            text = TEXT_CACHE.render(FONT, "Başlamak için BOŞLUK (SPACE)", (200, 200, 200))
+        else:
+            text = TEXT_CACHE.render(FONT, "HATA: Soru dosyası yüklenemedi. Kontrol edin.", (255, 50, 50))
+
+        # Kontrol metnini seri bağlantı durumuna göre ayarla
+        control_method_dikey = "KY-040'ı çevirerek" if SERIAL_ENABLED else "Yukarı/Aşağı ok tuşları"
+        control_method_yatay = "Sürgülü Potansiyometre" if SERIAL_ENABLED else "Sol/Sağ ok tuşları"
+
+        instruction1 = TEXT_CACHE.render(FONT, f"Dikey (Çek/Sal): {control_method_dikey}", (150, 150, 150))
+        instruction2 = TEXT_CACHE.render(FONT, f"Yatay (Sağ/Sol): {control_method_yatay} veya Farenin Sol/Sağ Tuşları",
+                                         (150, 150, 150))
+        instruction3 = TEXT_CACHE.render(FONT, "Doğru cevabı yakalayıp yüzeye çıkarın.", (150, 150, 150))
+
+        title_rect = title.get_rect(center=VIEW.point(WIDTH // 2, 150))
+        text_rect = text.get_rect(center=VIEW.point(WIDTH // 2, 300))
+        inst1_rect = instruction1.get_rect(center=VIEW.point(WIDTH // 2, 400))
+        inst2_rect = instruction2.get_rect(center=VIEW.point(WIDTH // 2, 450))
+        inst3_rect = instruction3.get_rect(center=VIEW.point(WIDTH // 2, 500))
+
+        win.blit(title, title_rect)
+        win.blit(text, text_rect)
+        win.blit(instruction1, inst1_rect)
+        win.blit(instruction2, inst2_rect)
+        win.blit(instruction3, inst3_rect)
 
 
     # -------------------------
-    # FONKSİYONLAR
+    # Aşamalı Açılış
     # -------------------------
+    # Ekran ve fontlar hazır olur olmaz menü çizilir. Konsol bağlantısı (Arduino
+    # reset beklemesi dahil), görseller ve soru bankası arka planda aynı anda
+    # yüklenir; yüzeylerin convert edilmesi burada, ana iş parçacığında yapılır.
+    # Yüklemeler bitmeden basılan SPACE hatırlanır ve oyun hazır olunca başlar.
+    def apply_startup(name, result, error):
+        if name == "assets":
+            apply_assets(result, error)
+        elif error is not None:
+            raise error
+
+
+    startup = StartupLoader()
+    startup.add("serial", init_serial)
+    startup.add("assets", read_assets)
+    startup.add("questions", load_questions_from_file)
+    startup.start()
+    startup_times = {}
+    running = True
+    start_requested = False
+    while not startup.done:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                start_requested = True
+        if not running:
+            break
+        finished = startup.poll()
+        for name, result, error in finished:
+            apply_startup(name, result, error)
+        if finished or "first_frame" not in startup_times:
+            draw_menu(startup.pending)
+            VIEW.present(win)
+            startup_times.setdefault("first_frame", time.time())
+        CLOCK.tick(60)
+    for name, result, error in startup.wait():
+        apply_startup(name, result, error)
+    startup_times["ready"] = time.time()
+    task_times = ", ".join(f"{STARTUP_LABELS[name]} {seconds * 1000:.0f} ms" for name, seconds in startup.timings.items())
+    print(f"Açılış: {task_times} (toplam {(time.perf_counter() - startup.started_at) * 1000:.0f} ms).")
+    if STARTUP_OUTPUT:
+        with open(STARTUP_OUTPUT, "w", encoding="utf-8") as f:
+            json.dump({**startup_times, "tasks": startup.timings}, f)
+        running = False
+    if not running:
+        # Pencere yükleme sırasında kapatıldı (veya sadece açılış ölçüldü): Oyun kurulmadan çık;
+        # telemetri oturumu açılmaz, dosya izleyici başlatılmaz
+        if session is not None:
+            session.close()
+        pygame.quit()
+        sys.exit()
 
-    def new_question():
-        global current_question_data, current_question, current_answer
-        if not QUESTION_DATA:
-            global game_state
-            game_state = "MENU"
-            return
-        current_question_data = random.choice(QUESTION_DATA)
-        current_question = current_question_data["question"]
-        current_answer = current_question_data["answer"]
-        possible_texts = [current_answer] + current_question_data["distractors"]
-        texts_to_assign = possible_texts[:len(fishes)]
-        while len(texts_to_assign) < len(fishes):
-            if current_question_data["distractors"]:
-                texts_to_assign.append(random.choice(current_question_data["distractors"]))
-            else:
-                texts_to_assign.append("...")
-        random.shuffle(texts_to_assign)
-        correct_fish_assigned = False
-        for fish, text in zip(fishes, texts_to_assign):
-            fish.text = text
-            fish.is_correct = (text == current_answer)
-            if fish.is_correct:
-                correct_fish_assigned = True
-        if not correct_fish_assigned and fishes:
-            chosen_fish = random.choice(fishes)
-            chosen_fish.text = current_answer
-            chosen_fish.is_correct = True
+    # -------------------------
+    # Oyun değişkenleri
+    # -------------------------
+    # Kanca, balıklar, soru ve skor kuralları game_logic.GameState içindedir;
+    # burada sadece çizim ve sunuma ait durum tutulur.
+    line_x = LINE_X
+    line_y = LINE_Y
+    game_state = "MENU"
+    feedback_timer = 0
 
 
     # -------------------------
     # BALIK SINIFI
     # -------------------------
-    class Fish:
-        def __init__(self, text=""):
-            self.type = random.randint(0, len(fish_sprites) - 1)
-            self.x = -FISH_SIZE[0]
-            self.y = random.randint(line_y + 100, HEIGHT - 100)
-            self.speed = random.uniform(1.5, 3.5)
-            self.anim_frame = 0
-            self.anim_timer = 0
-            self.rect = pygame.Rect(self.x, self.y, FISH_SIZE[0], FISH_SIZE[1])
-            self.caught = False
-            self.fish_score_value = 1
-            self.text = text
-            self.is_correct = False
-
-        def update(self):
-            if self.caught:
-                self.x = hook_pos[0] + 5
-                self.y = hook_pos[1] - 10
-                self.rect.topleft = (int(self.x), int(self.y))
-                return
-            self.x += self.speed
-            self.rect.topleft = (int(self.x), int(self.y))
-            if self.x > WIDTH + 100:
-                self.reset_offscreen()
-            self.anim_timer += 1
-            if self.anim_timer >= 20:
-                self.anim_frame = (self.anim_frame + 1) % len(fish_sprites[self.type])
-                self.anim_timer = 0
-
-        def draw(self, surf):
-            img = fish_sprites[self.type][self.anim_frame]
-            surf.blit(img, (int(self.x), int(self.y)))
-            text_surf = FONT_FISH.render(self.text, True, (0, 0, 0))
-            text_rect = text_surf.get_rect(midbottom=(int(self.x) + FISH_SIZE[0] // 2, int(self.y) - 5))
-            surf.blit(text_surf, text_rect)
+    class Fish(game_logic.Fish):
+        """game_logic.Fish görünümüne çizim ve etiket yüzeyi ekler."""
 
-        def reset_offscreen(self):
-            self.x = -FISH_SIZE[0]
-            self.y = random.randint(line_y + 100, HEIGHT - 100)
-            self.speed = random.uniform(1.5, 3.5)
-            self.caught = False
+        __slots__ = ("text_surf",)
 
+        def __init__(self, pool, index):
+            super().__init__(pool, index)
+            self.text_surf = TEXT_CACHE.render(FONT_FISH, "", (0, 0, 0))
 
-    fishes = [Fish() for _ in range(7)]
-    new_question()
+        def set_text(self, text):
+            """Balık etiketini ayarlar ve yazı yüzeyini önceden hazırlar."""
+            super().set_text(text)
+            self.text_surf = TEXT_CACHE.render(FONT_FISH, text, (0, 0, 0))
+
+        def draw(self, surf, alpha=1.0):
+            """Balığı ve etiketini (adımlar arası ara değerlenmiş konumda) çizer, kapladığı alanı döndürür."""
+            x, y = self.render_pos(alpha)
+            x, y = int(x * SCALE), int(y * SCALE)
+            img = fish_sprites[self.type][self.anim_frame]
+            img_rect = surf.blit(img, (x, y))
+            text_rect = self.text_surf.get_rect(midbottom=(x + FISH_DRAW_SIZE[0] // 2, y - LABEL_GAP))
+            surf.blit(self.text_surf, text_rect)
+            return img_rect.union(text_rect)
+
+
+    # Tuval pikseline çevrilmiş sabit çizim ölçüleri
+    LABEL_GAP = VIEW.px(5)
+    LINE_WIDTH = VIEW.px(4)
+    CATCH_RING_RADIUS = VIEW.px(25)
+    CATCH_RING_WIDTH = VIEW.px(3)
+
+
+    # Her bağlı konsol bir oyuncudur; konsol yoksa tek oyuncu klavyeyle oynar
+    PLAYER_COUNT = max(1, len(session))
+    FRAME_COUNTS = [len(frames) for frames in fish_sprites]
+    if REPLAY_PATH:
+        # Tohum ve oyuncu sayısı kayıttan gelir; oyun aynı başlangıç durumundan oynatılır
+        replay_header, replay_records = input_log.read_log(REPLAY_PATH)
+        game_seed = replay_header["seed"]
+        PLAYER_COUNT = replay_header["players"]
+        FRAME_COUNTS = replay_header.get("frame_counts") or FRAME_COUNTS
+        if replay_header.get("questions_sha1") != input_log.file_digest(QUESTIONS_FILE):
+            print(f"⚠️ {QUESTIONS_FILE} kayıttakinden farklı; tekrar oynatma aynı sonucu vermeyebilir.")
+    else:
+        game_seed = random.randrange(2 ** 32)
+    # Oyuncu sayısı oyun boyunca sabittir (kayıt başlığı da buna göre yazılır): Sonradan takılan
+    # konsollar sadece boş oyuncu yuvası varsa alınır, kopan konsol ise yine kendi yuvasına döner
+    session.max_controllers = PLAYER_COUNT
+    game = GameState(QUESTION_DATA, seed=game_seed, fish_factory=Fish, frame_counts=FRAME_COUNTS,
+                     players=PLAYER_COUNT)
+    timestep = FixedTimestep()
+    # Adım çalışmayan karelerde (FISH_FPS > 60 veya zamanlayıcı sapması) okunan KY-040 adımları
+    # kaybolmasın diye oyuncu başına biriktirilir ve adım çalışan ilk karede uygulanır
+    pending_pull = [0] * PLAYER_COUNT
+    recorder = None
+    if RECORD_PATH:
+        recorder = input_log.InputRecorder(RECORD_PATH, game_seed, PLAYER_COUNT, len(game.fishes), FRAME_COUNTS,
+                                           input_log.file_digest(QUESTIONS_FILE))
+    if TELEMETRY_PATH not in ("", "0") and not REPLAY_PATH:
+        telemetry_writer = telemetry.TelemetryWriter(TELEMETRY_PATH).start(
+            seed=game_seed, players=PLAYER_COUNT, questions=len(QUESTION_DATA))
+        game.telemetry = telemetry_writer
 
 
     # -------------------------
-    # Yakalama kontrolü
+    # Sıcak Yeniden Yükleme (questions.txt ve görseller)
     # -------------------------
-    def check_catch():
-        """Kanca ve balık çarpışmasını kontrol eder."""
-        global caught_fish
-        if caught_fish:
-            return False
-        HOOK_WIDTH, HOOK_HEIGHT = hook_img.get_size()
-        hook_rect = pygame.Rect(hook_pos[0] - HOOK_WIDTH // 2, hook_pos[1] - HOOK_HEIGHT // 2, HOOK_WIDTH, HOOK_HEIGHT)
-        for fish in fishes:
-            if not fish.caught and hook_rect.colliderect(fish.rect):
-                fish.caught = True
-                caught_fish = fish
-                return True
-        return False
+    # Dosyalar arka planda izlenir; sadece değişen dosya ayrıştırılır/çözülür ve
+    # sonuç oyun döngüsünde kareler arasında tek atamayla yerine konur.
+    def reload_questions(changed_paths):
+        """Arka plan iş parçacığı: Soru dosyasını yeniden derler ve soruları eskileriyle eşler."""
+        old_bank = QUESTION_DATA
+        bank = question_bank.load_question_bank(QUESTIONS_FILE)
+        return bank, old_bank, game_logic.match_questions(old_bank, bank)
+
+
+    def reload_sprites(changed_paths):
+        """Arka plan iş parçacığı: Sadece değişen PNG'leri çözer ve ölçekler (convert ana döngüde yapılır)."""
+        return {name: asset_atlas.load_scaled(path, size)
+                for name, path, size in [BACKGROUND_SPEC] + SPRITE_SPECS if path in changed_paths}
+
+
+    def apply_questions(result):
+        global QUESTION_DATA
+        bank, matched_from, matches = result
+        old_bank = QUESTION_DATA
+        QUESTION_DATA = bank
+        game.set_questions(bank, matches, matched_from)
+        report_question_errors(bank, QUESTIONS_FILE)
+        old_bank.close()
+        print(f"🔄 {QUESTIONS_FILE} yeniden yüklendi ({len(bank)} soru).")
+
+
+    def apply_sprites(surfaces):
+        """Yeni görselleri yerine koyar; arka plan değiştiyse True döner."""
+        global background, hook_img, fish_sprites
+        for name, surf in surfaces.items():
+            if name == "background":
+                background = surf.convert()
+            else:
+                asset_frames[name] = surf.convert_alpha()
+        hook_img = asset_frames.get("hook", hook_img)
+        if all(name in asset_frames for animation in FISH_ANIMATIONS for name in animation):
+            fish_sprites = [[asset_frames[name] for name in animation] for animation in FISH_ANIMATIONS]
+        print(f"🔄 Görseller yeniden yüklendi: {', '.join(sorted(surfaces))}")
+        return "background" in surfaces
+
+
+    file_watcher = hot_reload.FileWatcher()
+    if not (RECORD_PATH or REPLAY_PATH):
+        # Kayıt/tekrar sırasında soru bankası değişirse oturum yeniden üretilemez
+        file_watcher.watch("questions", [QUESTIONS_FILE], reload_questions)
+    file_watcher.watch("sprites", [path for _name, path, _size in [BACKGROUND_SPEC] + SPRITE_SPECS], reload_sprites)
+    file_watcher.start()
 
 
     # -------------------------
     # Zikzaklı İpi Çizme
     # -------------------------
+    # Kalite seviyesine göre ip: Seyrek noktalı ipte dalga boyu aynı kalsın diye frekans da ölçeklenir
+    # Genlik ve nokta aralığı tuval ölçeğiyle çarpılır; ip her çözünürlükte aynı şekilde görünür
+    ZIGZAG_LINES = [ZigzagLine(amplitude=ZIGZAG_AMPLITUDE * SCALE, segment_length=SEGMENT_LENGTH * SCALE),
+                    ZigzagLine(amplitude=ZIGZAG_AMPLITUDE * SCALE, frequency=ZIGZAG_FREQUENCY * 2,
+                               segment_length=2 * SEGMENT_LENGTH * SCALE)]
+
+
     def draw_zigzag_line(surf, start_pos, end_pos, color, width, time_counter):
-        """Başlangıç noktasından bitiş noktasına zikzaklı ip çizer."""
-        dx = end_pos[0] - start_pos[0]
-        dy = end_pos[1] - start_pos[1]
-        distance = math.sqrt(dx ** 2 + dy ** 2)
-        segment_length = 10
-        num_points = max(2, int(distance / segment_length))
-        points = [start_pos]
-        for i in range(1, num_points):
-            ratio = i / (num_points - 1)
-            px = start_pos[0] + dx * ratio
-            py = start_pos[1] + dy * ratio
-            if distance > 0:
-                angle = math.atan2(dy, dx)
-                offset_x = ZIGZAG_AMPLITUDE * math.sin(ZIGZAG_FREQUENCY * i + time_counter) * math.sin(angle)
-                offset_y = ZIGZAG_AMPLITUDE * math.sin(ZIGZAG_FREQUENCY * i + time_counter) * -math.cos(angle)
-            else:
-                offset_x, offset_y = 0, 0
-            points.append((int(px + offset_x), int(py + offset_y)))
-        points[-1] = end_pos
-        if len(points) > 1:
-            pygame.draw.lines(surf, color, False, points, width)
+        """Başlangıç noktasından bitiş noktasına zikzaklı ip çizer ve kapladığı alanı döndürür."""
+        if pacer.level >= QUALITY_MINIMAL:
+            return pygame.draw.line(surf, color, start_pos, end_pos, width)
+        points = ZIGZAG_LINES[pacer.level].points(start_pos, end_pos, time_counter)
+        return pygame.draw.lines(surf, color, False, points, width)
 
 
     # -------------------------
-    # Menü
+    # Kirli Dikdörtgen Yardımcıları
     # -------------------------
-    def draw_menu():
-        win.fill((20, 20, 40))
-        title = FONT.render("Eğitsel Balık Tutma Oyunu", True, (255, 255, 255))
+    prev_dirty_rects = []
+    full_redraw = True
+    menu_drawn = False
 
-        if QUESTION_DATA:
-            text = FONT.render("Başlamak için BOŞLUK (SPACE)", True, (200, 200, 200))
-        else:
-            text = FONT.render("HATA: Soru dosyası yüklenemedi. Kontrol edin.", True, (255, 50, 50))
+    # -------------------------
+    # HUD ve Geri Bildirim Katmanları
+    # -------------------------
+    # Soru çubuğu sadece soru/skor değişince yeniden çizilir; geri bildirim
+    # panelleri baştan hazırlanır. Böylece oyun sırasında kare başına yeni yüzey oluşturulmaz.
+    HUD = HudLayer((CANVAS_W, VIEW.px(50)), FONT_QUESTION, FONT, ALLOCATIONS, score_pos=VIEW.point(20, 20))
+    FEEDBACK = FeedbackPanels(VIEW.size((450, 80)), (CANVAS_W // 2, CANVAS_H // 2), FONT_FEEDBACK, ALLOCATIONS)
+    FEEDBACK_MESSAGES = {
+        "correct": ("DOĞRU! (+1 Puan)", (0, 255, 0)),
+        "wrong": ("YANLIŞ! (-1 Puan)", (255, 0, 0)),
+    }
 
-        # Kontrol metnini seri bağlantı durumuna göre ayarla
-        control_method_dikey = "KY-040'ı çevirerek" if SERIAL_ENABLED else "Yukarı/Aşağı ok tuşları"
-        control_method_yatay = "Sürgülü Potansiyometre" if SERIAL_ENABLED else "Sol/Sağ ok tuşları"
 
-        instruction1 = FONT.render(f"Dikey (Çek/Sal): {control_method_dikey}", True, (150, 150, 150))
-        instruction2 = FONT.render(f"Yatay (Sağ/Sol): {control_method_yatay} veya Farenin Sol/Sağ Tuşları", True,
-                                   (150, 150, 150))
-        instruction3 = FONT.render("Doğru cevabı yakalayıp yüzeye çıkarın.", True, (150, 150, 150))
+    def feedback_message(kind, player):
+        text, color = FEEDBACK_MESSAGES[kind]
+        if PLAYER_COUNT > 1:
+            text = f"Oyuncu {player + 1}: {text}"
+        return text, color
 
-        title_rect = title.get_rect(center=(WIDTH // 2, 150))
-        text_rect = text.get_rect(center=(WIDTH // 2, 300))
-        inst1_rect = instruction1.get_rect(center=(WIDTH // 2, 400))
-        inst2_rect = instruction2.get_rect(center=(WIDTH // 2, 450))
-        inst3_rect = instruction3.get_rect(center=(WIDTH // 2, 500))
 
-        win.blit(title, title_rect)
-        win.blit(text, text_rect)
-        win.blit(instruction1, inst1_rect)
-        win.blit(instruction2, inst2_rect)
-        win.blit(instruction3, inst3_rect)
+    FEEDBACK.prebuild(feedback_message(kind, player) for kind in FEEDBACK_MESSAGES for player in range(PLAYER_COUNT))
+    feedback_panel = None
+
+    # -------------------------
+    # Parçacık Efektleri
+    # -------------------------
+    # Kabarcık, sıçrama ve parıltılar sabit kapasiteli bir havuzda tutulur ve
+    # önceden çizilmiş yüzeylerle tek blits çağrısında çizilir. Efektler oyunun
+    # rastgele sayı üretecini kullanmaz (tekrar oynatma etkilenmez); kare bütçesi
+    # aşılınca daha az parçacık, en düşük kalitede hiç parçacık üretilmez.
+    PARTICLE_CAPACITY = 4000
+    PARTICLE_SPRITES = {kind: [surf.convert_alpha() for surf in frames]
+                        for kind, frames in particles.build_particle_sprites(scale=SCALE).items()}
+    PARTICLE_SCALE = {QUALITY_FULL: 1.0, QUALITY_REDUCED: 0.5, QUALITY_MINIMAL: 0.0}
+    effects = particles.ParticlePool(PARTICLE_CAPACITY, random.Random(), PARTICLE_SPRITES, scale=SCALE)
+
+
+    def spawn_effect(kind, fish, player_index):
+        """Oyun olayına uygun parçacık efektini başlatır."""
+        scale = PARTICLE_SCALE[pacer.level]
+        if not scale:
+            return
+        if kind == "catch":
+            particles.burst_catch(effects, fish.x + FISH_SIZE[0] // 2, fish.y + FISH_SIZE[1] // 2, scale)
+            return
+        # Balık yüzeye çıktığı an kanca sıfırlanır; efekt kancanın son konumunda, su yüzeyinde başlar
+        x = game.players[player_index].prev_hook_pos[0]
+        if kind == "correct":
+            particles.burst_correct(effects, x, line_y, scale)
+        else:
+            particles.burst_wrong(effects, x, line_y, scale)
+
+
+    def start_game():
+        """Menüden oyuna geçer (SPACE veya kayıttaki yeni oyun); soru yoksa False döner."""
+        global game_state, feedback_timer, full_redraw, pending_pull
+        if not game.reset():
+            return False
+        if recorder:
+            recorder.reset()
+        game_state = "PLAY"
+        feedback_timer = 0
+        pending_pull = [0] * PLAYER_COUNT
+        # Menüde (okunmayan) çevrilen KY-040 adımları ilk karede kancayı zıplatmasın
+        session.poll()
+        effects.clear()
+        timestep.accumulator = 0.0
+        full_redraw = True
+        return True
+
+
+    def restore_background(rects):
+        """Verilen bölgelerde arka planı geri yükler."""
+        for r in rects:
+            win.blit(background, r, r)
+
+
+    def clip_rects(rects):
+        """Ekran dışına taşan ve boş kalan dikdörtgenleri ayıklar."""
+        clipped = []
+        for r in rects:
+            if r is None:
+                continue
+            r = r.clip(SCREEN_RECT)
+            if r.width and r.height:
+                clipped.append(r)
+        return clipped
+
+
+    def build_profiler_overlay():
+        """Profil panelini yeniden oluşturur (her karede değil, yarım saniyede bir)."""
+        lines = profiler.overlay_lines()
+        lines.append(f"yazı önbelleği {TEXT_CACHE.hits}/{TEXT_CACHE.misses}")
+        lines.append(f"kalite seviyesi {pacer.level} ({pacer.level_changes} değişim)")
+        lines.append(f"yeni Surface {ALLOCATIONS.last_frame}/kare, toplam {ALLOCATIONS.total}")
+        lines.append(f"parçacık {effects.count}/{effects.capacity} ({effects.dropped} atılan)")
+        for controller in session.controllers:
+            lines.append(f"girdi gecikmesi {controller.port} {controller.latency.avg_ms:.1f} ms"
+                         f"{'' if controller.connected else ' (kopuk)'}, {controller.dropouts} kopma")
+        rendered = [FONT_FISH.render(line, True, (255, 255, 0)) for line in lines]
+        width = max(r.get_width() for r in rendered) + 10
+        height = sum(r.get_height() for r in rendered) + 10
+        ALLOCATIONS.add(len(rendered))
+        panel = ALLOCATIONS.surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 200))
+        y = 5
+        for r in rendered:
+            panel.blit(r, (5, y))
+            y += r.get_height()
+        return panel
 
 
     # -------------------------
     # OYUN DÖNGÜSÜ
     # -------------------------
-    running = True
+    if start_requested and not REPLAY_PATH:
+        start_game()
     while running:
-        CLOCK.tick(60)
-        time_counter += 1 * ZIGZAG_FREQUENCY
+        profiler.begin_frame()
+        elapsed = CLOCK.tick(0 if REPLAY_PATH and REPLAY_UNCAPPED else TARGET_FPS) / 1000.0
+        profiler.mark("wait")
+        pacer.begin_work()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_profiler = not show_profiler
+                profiler_surf = None
+
+            # Pencere yeniden açığa çıktıysa her şeyi tekrar çiz
+            if event.type == pygame.VIDEOEXPOSE:
+                menu_drawn = False
+                full_redraw = True
+
             # Menüden oyuna geçiş
             if game_state == "MENU" and event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                if not QUESTION_DATA:
-                    continue
-
-                game_state = "PLAY"
-                hook_x_anchor = float(HOOK_INITIAL_X)
-                hook_pos = [float(HOOK_INITIAL_X), float(line_y)]
-                score = 0
-                caught_fish = None
-                for f in fishes:
-                    f.reset_offscreen()
-                new_question()
+                if not REPLAY_PATH:
+                    start_game()
+
+        # Arka planda yeniden yüklenen dosyaları kareler arasında yerine koy
+        for name, result, error in file_watcher.poll():
+            if error is not None:
+                print(f"⚠️ Yeniden yükleme başarısız ({name}): {error}")
+            elif name == "questions":
+                apply_questions(result)
+            elif apply_sprites(result):
+                menu_drawn = False
+                full_redraw = True
+
+        profiler.mark("events")
+
+        # Tekrar oynatma: Bu karenin adım sayısı ve girdileri kayıttan gelir
+        replay_frame = None
+        if REPLAY_PATH:
+            record = next(replay_records, ("end", None))
+            if record[0] == "reset":
+                start_game()
+                record = next(replay_records, ("end", None))
+            if record[0] == "end":
+                if record[1] is None:
+                    print("Tekrar oynatma bitti (kayıt yarım kalmış).")
+                elif record[1] == input_log.game_result(game):
+                    print("✅ Tekrar oynatma bitti: Sonuç kayıttakiyle aynı.")
+                else:
+                    print(f"⚠️ Tekrar oynatma sonucu farklı: {input_log.game_result(game)} != {record[1]}")
+                running = False
+                continue
+            replay_frame = record
+
+        # Konsol kopma/bağlanma bildirimleri (menüdeki kontrol açıklaması da güncellenir)
+        if handle_console_events():
+            menu_drawn = False
 
         if game_state == "MENU":
-            draw_menu()
-            pygame.display.update()
+            # Menü statiktir: Bir kez çizilir ve olduğu gibi bırakılır
+            if not menu_drawn:
+                draw_menu()
+                VIEW.present(win)
+                menu_drawn = True
             continue
+        menu_drawn = False
+        ALLOCATIONS.begin_frame()
 
-        # Arka planı çiz
-        win.blit(background, (0, 0))
+        # Arka planı çiz (tam ekran veya sadece önceki karenin kirli bölgeleri)
+        if DIRTY_RECT_RENDERING and not full_redraw:
+            restore_background(prev_dirty_rects)
+        else:
+            win.blit(background, (0, 0))
+        dirty_rects = []
 
         keys = pygame.key.get_pressed()
 
         # -------------------------------------
         # Seri Porttan Veri Oku (KY-040 ve Potansiyometre Entegrasyonu)
         # -------------------------------------
-        ky040_pull_down = 0  # Dikey hareket: 1(Yukarı), -1(Aşağı), 0(Yok)
+        # Okuma arka plandaki SerialReader'larda yapılır; burada sadece son durumlar alınır.
+        ky040_pull_down = 0  # Dikey hareket: Son kareden beri net adım (+ Yukarı, - Aşağı, 0 Yok)
         pot_value = -1  # Yatay değer: 0-1023, -1 (okunmadıysa)
 
-        if SERIAL_ENABLED and ser.in_waiting > 0:
-            try:
-                line = ser.readline().decode('utf-8').strip()
-                # Örn: Gelen veri: "D1,P512"
-
-                if line:
-                    parts = line.split(',')
-                    for part in parts:
-                        if part.startswith('D'):
-                            ky040_pull_down = int(part[1:])
-                        elif part.startswith('P'):
-                            pot_value = int(part[1:])
-
-            except Exception:
-                ky040_pull_down = 0
-                pot_value = -1
+        console_values = session.poll()
+        if console_values:
+            ky040_pull_down, pot_value = console_values[0]
+        profiler.mark("serial")
 
         # -------------------------------------
-        # Kanca Hareketi (Yatay ve Dikey Kontroller)
+        # Kanca Hareketi, Yakalama ve Skor (game_logic.GameState.step)
         # -------------------------------------
-
         mouse_buttons = pygame.mouse.get_pressed()
-
-        # YATAY HAREKET: Potansiyometre VEYA Klavye/Fare
-        if pot_value != -1:
-            # Potansiyometre değerini (0-1023) ekran genişliğine (WIDTH) map'le
-            target_x_anchor = 10 + (pot_value / 1023.0) * (WIDTH - 20)
-
-            # Hareketi yumuşatma
-            smoothing_factor = 0.2
-            hook_x_anchor = hook_x_anchor * (1 - smoothing_factor) + target_x_anchor * smoothing_factor
-
-        else:
-            # Klavye/Fare yatay kontrolü (Potansiyometre kapalı/okunamazsa)
-            if mouse_buttons[0] or keys[pygame.K_LEFT]:
-                hook_x_anchor -= HORIZONTAL_SPEED
-            if mouse_buttons[2] or keys[pygame.K_RIGHT]:
-                hook_x_anchor += HORIZONTAL_SPEED
-
-        # İp Salınımı
-        sway_offset = SWAY_AMPLITUDE * math.sin(time_counter * SWAY_SPEED)
-        hook_pos[0] = hook_x_anchor + sway_offset
-        # DİKEY HAREKET: KY-040 VEYA Klavye
-
-        # KY-040 için çekme/salma faktörünü PULL_SPEED'den farklı ayarlayabilirsiniz
-        KY040_PULL_FACTOR = PULL_SPEED  # Şu anki örnekte 20.0
-
-        # YUKARI ÇEKME: Klavye (UP) VEYA KY-040 (1)
-        if keys[pygame.K_UP]:
-            hook_pos[1] -= PULL_SPEED
-        elif ky040_pull_down == 1:
-            hook_pos[1] -= KY040_PULL_FACTOR
-
-        # AŞAĞI SALMA: Klavye (DOWN) VEYA KY-040 (-1)
-        elif not caught_fish and keys[pygame.K_DOWN]:
-            hook_pos[1] += PULL_SPEED
-        elif not caught_fish and ky040_pull_down == -1:
-            hook_pos[1] += KY040_PULL_FACTOR
-
-        elif not caught_fish:
-            hook_pos[1] += AUTO_SINK_SPEED  # Otomatik batma
-
-        # Sınırlar
-        hook_x_anchor = max(10, min(hook_x_anchor, WIDTH - 10))
-        hook_pos[1] = max(line_y, min(hook_pos[1], HEIGHT - 30))
-
-        # -------------------------------------
-        # Yakalama ve Skor Kontrolü
-        # -------------------------------------
-
-        if caught_fish:
-            if hook_pos[1] <= line_y:
-                if caught_fish.is_correct:
-                    score += caught_fish.fish_score_value
-                    feedback_text = "DOĞRU! (+1 Puan)"
-                    feedback_color = (0, 255, 0)
-                    new_question()
-                else:
-                    score -= caught_fish.fish_score_value
-                    feedback_text = "YANLIŞ! (-1 Puan)"
-                    feedback_color = (255, 0, 0)
-
-                feedback_timer = 90
-                caught_fish.reset_offscreen()
-                caught_fish = None
-                hook_pos[1] = float(line_y)
-                hook_x_anchor = float(HOOK_INITIAL_X)
+        inp = ControlInput(keys[pygame.K_UP], keys[pygame.K_DOWN],
+                           mouse_buttons[0] or keys[pygame.K_LEFT], mouse_buttons[2] or keys[pygame.K_RIGHT],
+                           ky040_pull_down, pot_value)
+        # Klavye ilk oyuncuyu, diğer konsollar kendi oyuncularını yönetir
+        inputs = [inp] + [ControlInput(False, False, False, False, pull, pot) for pull, pot in console_values[1:]]
+        inputs = inputs[:PLAYER_COUNT] + [NO_INPUT] * (PLAYER_COUNT - len(inputs))
+
+        if replay_frame is not None:
+            steps, inputs = replay_frame[1], replay_frame[2]
         else:
-            check_catch()
-
-        # Balıkları güncelle ve çiz
-        for f in fishes:
-            f.update()
-            f.draw(win)
-
-        # Kancanın çizim koordinatlarını hesapla
-        hook_x_draw = int(hook_pos[0] - hook_img.get_width() / 2)
-        hook_y_draw = int(hook_pos[1] - hook_img.get_height() / 2)
-        hook_connection_x = hook_x_draw + hook_img.get_width() / 2
-        hook_connection_y = hook_y_draw + 5
-
-        # İp ve Kanca Görselini çiz
-        draw_zigzag_line(win, (line_x, line_y), (int(hook_connection_x), hook_connection_y), (255, 255, 255), 4,
-                         time_counter)
-        win.blit(hook_img, (hook_x_draw, hook_y_draw))
-
-        # Yakalanmış balık etrafında Geri Bildirim Dairesi
-        if caught_fish:
-            circle_color = (0, 200, 0) if caught_fish.is_correct else (200, 0, 0)
-            pygame.draw.circle(win, circle_color,
-                               (int(hook_connection_x), int(hook_y_draw + hook_img.get_height() / 2)), 25, 3)
+            steps = timestep.advance(elapsed)
+            pending_pull = [pending + inp.pull for pending, inp in zip(pending_pull, inputs)]
+            inputs = [inp._replace(pull=pull) for inp, pull in zip(inputs, pending_pull)]
+            if steps:
+                pending_pull = [0] * PLAYER_COUNT
+        # Birleştirilmiş adımlar kaydedilir; tekrar oynatma aynı girdileri görür
+        if recorder:
+            recorder.frame(steps, inputs)
+
+        for kind, fish, player in run_frame(game, steps, inputs):
+            spawn_effect(kind, fish, player)
+            if kind in FEEDBACK_MESSAGES:
+                feedback_panel = FEEDBACK.get(*feedback_message(kind, player))
+                feedback_timer = FEEDBACK_FRAMES
+        for _ in range(steps):
+            effects.update()
+        profiler.mark("update")
+
+        # Çizim son iki adım arasında ara değerlenir (tekrar oynatmada kare tam adım sınırındadır)
+        alpha = 1.0 if replay_frame is not None else timestep.alpha
+        render_time = game.render_time_counter(alpha)
+
+        # Balıkları çiz
+        for f in game.fishes:
+            dirty_rects.append(f.draw(win, alpha))
+        profiler.mark("fish_draw")
+
+        for player in game.players:
+            # Kancanın çizim koordinatlarını (tuval pikseli) hesapla
+            hook_x, hook_y = player.render_hook_pos(alpha)
+            hook_x_draw = int(hook_x * SCALE - hook_img.get_width() / 2)
+            hook_y_draw = int(hook_y * SCALE - hook_img.get_height() / 2)
+            hook_connection_x = hook_x_draw + hook_img.get_width() / 2
+            hook_connection_y = hook_y_draw + LABEL_GAP
+
+            # İp ve Kanca Görselini çiz
+            dirty_rects.append(draw_zigzag_line(win, VIEW.point(player.line_x, line_y),
+                                                (int(hook_connection_x), hook_connection_y),
+                                                (255, 255, 255), LINE_WIDTH, render_time))
+            dirty_rects.append(win.blit(hook_img, (hook_x_draw, hook_y_draw)))
+            if PLAYER_COUNT > 1:
+                label = TEXT_CACHE.render(FONT_FISH, str(player.index + 1), (255, 255, 255))
+                dirty_rects.append(win.blit(label, (hook_x_draw + hook_img.get_width(), hook_y_draw)))
+
+            # Yakalanmış balık etrafında Geri Bildirim Dairesi
+            caught_fish = player.caught_fish
+            if caught_fish and pacer.level < QUALITY_MINIMAL:
+                circle_color = (0, 200, 0) if caught_fish.is_correct else (200, 0, 0)
+                dirty_rects.append(pygame.draw.circle(win, circle_color,
+                                                      (int(hook_connection_x),
+                                                       int(hook_y_draw + hook_img.get_height() / 2)),
+                                                      CATCH_RING_RADIUS, CATCH_RING_WIDTH))
+        dirty_rects.append(effects.draw(win))
+        profiler.mark("line")
 
         # -------------------------------------
         # EĞİTSEL UI ÇİZİMİ
         # -------------------------------------
-        question_bg = pygame.Rect(0, 0, WIDTH, 50)
-        pygame.draw.rect(win, (0, 0, 0), question_bg)
-        question_text_surf = FONT_QUESTION.render(f"SORU: {current_question}", True, (255, 255, 255))
-        question_rect = question_text_surf.get_rect(center=(WIDTH // 2, 25))
-        win.blit(question_text_surf, question_rect)
-        score_text = FONT.render(f"Skor: {score}", True, (255, 255, 0))
-        win.blit(score_text, (20, 20))
+        # Soru çubuğu katmanı her kare üstüne kopyalanır; sadece içerik değişince ekrana gönderilir
+        if HUD.update(game.current_question, tuple(player.score for player in game.players)):
+            dirty_rects.append(HUD.rect)
+        win.blit(HUD.surface, HUD.rect)
 
         if feedback_timer > 0:
-            feedback_bg = pygame.Surface((450, 80), pygame.SRCALPHA)
-            feedback_bg.fill((0, 0, 0, 180))
-            feedback_surf = FONT_FEEDBACK.render(feedback_text, True, feedback_color)
-            bg_rect = feedback_bg.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            feedback_rect = feedback_surf.get_rect(center=bg_rect.center)
-            win.blit(feedback_bg, bg_rect)
-            win.blit(feedback_surf, feedback_rect)
-            feedback_timer -= 1
-
-        pygame.display.update()
+            win.blit(feedback_panel, FEEDBACK.rect)
+            # Yarı saydam panelin üst üste birikmemesi için alanı her kare yenilenir
+            dirty_rects.append(FEEDBACK.rect)
+            # Süre sabit adımla sayılır: Panel her ekran hızında aynı saniye kadar görünür
+            feedback_timer -= steps
+
+        if show_profiler:
+            if profiler_surf is None or profiler.frames % 30 == 0:
+                profiler_surf = build_profiler_overlay()
+            dirty_rects.append(win.blit(profiler_surf, (CANVAS_W - profiler_surf.get_width() - 10, HUD.rect.bottom + 10)))
+        profiler.mark("hud")
+        ALLOCATIONS.end_frame()
+
+        dirty_rects = clip_rects(dirty_rects)
+        if DIRTY_RECT_RENDERING and not full_redraw:
+            VIEW.present(win, prev_dirty_rects + dirty_rects)
+        else:
+            VIEW.present(win)
+        profiler.mark("present")
+        prev_dirty_rects = dirty_rects
+        full_redraw = False
+        session.frame_presented()
+        if pacer.end_work(timestep.skipped and replay_frame is None):
+            print(f"Kare bütçesi: Çizim kalitesi seviyesi {pacer.level}"
+                  f"{' (tam kalite)' if pacer.level == QUALITY_FULL else ''}.")
+
+    if PROFILE_OUTPUT:
+        profiler.dump(PROFILE_OUTPUT)
+        print(f"Kare profili {PROFILE_OUTPUT} dosyasına yazıldı.")
+
+    print(f"{ALLOCATIONS.summary()}.")
+    file_watcher.stop()
+    if recorder:
+        recorder.close(game)
+        print(f"Girdi kaydı {RECORD_PATH} dosyasına yazıldı ({recorder.frames} kare).")
+    if telemetry_writer:
+        telemetry_writer.close()
+        print(f"Telemetri: {telemetry_writer.summary()}.")
 
     # Oyun döngüsü bittiğinde Pygame'i kapat ve Seri Portu temizle
-    if SERIAL_ENABLED and ser:
-        ser.close()
-        print("Seri port kapatıldı.")
+    if session is not None:
+        session.close()
+        for line in session.summary():
+            print(line)
+        print("Seri portlar kapatıldı.")
 
     pygame.quit()
     sys.exit()
 
 except Exception as e:
     # Hata oluşursa, konsola hatayı yazdırıp kapat ve Seri Portu temizle
-    if 'ser' in locals() and ser and SERIAL_ENABLED:
+    if session is not None:
         try:
-            ser.close()
-            print("Seri port hata sonrası kapatıldı.")
+            session.close()
+            print("Seri portlar hata sonrası kapatıldı.")
         except:
             pass
+    if telemetry_writer:
+        telemetry_writer.close()
 
     print(f"Oyun başlatılırken veya çalışırken kritik bir hata oluştu: {e}")
     pygame.quit()
@@ -0,0 +1,79 @@
+import time
+from collections import deque
+
+# -------------------------
+# Kalite Seviyeleri
+# -------------------------
+# Kare bütçesi sürekli aşılırsa bir alt seviyeye inilir:
+#   0: Tam kalite
+#   1: İp daha az noktayla çizilir (segment 10 -> 20 piksel)
+#   2: İp düz çizgi, yakalanan balık halkası çizilmez
+QUALITY_FULL = 0
+QUALITY_REDUCED = 1
+QUALITY_MINIMAL = 2
+
+
+class FramePacer:
+    """Çizim hızını oyun adımlarından ayıran ve yük altında kaliteyi düşüren kare temposu.
+
+    Oyun mantığı FixedTimestep ile sabit adımlarla ilerler; ekran ise
+    `target_fps` hızında (0 ise sınırsız) çizilir ve iki adım arası
+    konumlar `alpha` ile ara değerlenir. Her karenin meşgul süresi (bekleme
+    hariç) `window` karelik pencerelerde değerlendirilir: Karelerin
+    `miss_ratio` kadarı bütçeyi aşarsa kalite bir seviye düşer; art arda
+    `recover_windows` pencere boyunca süre bütçenin yarısının altında
+    kalırsa bir seviye geri yükselir.
+    """
+
+    def __init__(self, target_fps=60, window=60, miss_ratio=0.1, recover_windows=3, max_level=QUALITY_MINIMAL):
+        self.target_fps = target_fps
+        self.budget = 1.0 / target_fps if target_fps else 1.0 / 60.0
+        self.window = window
+        self.miss_ratio = miss_ratio
+        self.recover_windows = recover_windows
+        self.max_level = max_level
+        self.level = QUALITY_FULL
+        self.level_changes = 0
+        self._busy = deque(maxlen=window)
+        self._misses = 0
+        self._calm_windows = 0
+        self._busy_start = None
+
+    def begin_work(self):
+        """Bekleme bittikten (clock.tick) hemen sonra çağrılır."""
+        self._busy_start = time.perf_counter()
+
+    def end_work(self, skipped_steps=False):
+        """Kare ekrana verildikten sonra çağrılır; kalite seviyesi değiştiyse True döner.
+
+        skipped_steps: FixedTimestep geride kalıp zaman attıysa bu kare kaçırılmış sayılır.
+        """
+        if self._busy_start is None:
+            return False
+        busy = time.perf_counter() - self._busy_start
+        self._busy_start = None
+        self._busy.append(busy)
+        if busy > self.budget or skipped_steps:
+            self._misses += 1
+        if len(self._busy) < self.window:
+            return False
+        return self._evaluate()
+
+    def _evaluate(self):
+        misses = self._misses
+        calm = max(self._busy) < self.budget * 0.5
+        self._busy.clear()
+        self._misses = 0
+        if misses > self.window * self.miss_ratio and self.level < self.max_level:
+            self.level += 1
+            self._calm_windows = 0
+            self.level_changes += 1
+            return True
+        self._calm_windows = self._calm_windows + 1 if calm else 0
+        if self._calm_windows >= self.recover_windows and self.level > QUALITY_FULL:
+            self.level -= 1
+            self._calm_windows = 0
+            self.level_changes += 1
+            return True
+        return False
+
@@ -0,0 +1,668 @@
+import math
+import random
+from array import array
+from collections import namedtuple
+from operator import add
+
+from collision import LaneSweep
+from scheduler import QuestionScheduler
+
+# -------------------------
+# Oyun Kuralları Sabitleri (Ekrandan bağımsız)
+# -------------------------
+WIDTH, HEIGHT = 1024, 600
+FISH_SIZE = (80, 40)
+HOOK_SIZE = (40, 40)
+FISH_COUNT = 7
+FISH_FRAME_COUNTS = [2, 2]  # Her balık türünün animasyon kare sayısı
+
+# Hız Ayarları (birimler: piksel / adım, bir adım = FIXED_DT saniye)
+FIXED_DT = 1.0 / 60.0
+AUTO_SINK_SPEED = 0.5
+PULL_SPEED = 10.0
+HORIZONTAL_SPEED = 6.0
+POT_SMOOTHING = 0.2
+
+# Zikzak İp Efekti Ayarları
+ZIGZAG_AMPLITUDE = 10
+ZIGZAG_FREQUENCY = 0.1
+
+# İp Salınım Efekti Ayarları
+SWAY_AMPLITUDE = 80.0
+SWAY_SPEED = 0.1
+
+LINE_X = WIDTH // 2
+LINE_Y = 50
+HOOK_INITIAL_X = WIDTH - 150
+FEEDBACK_FRAMES = 90
+
+# Bir adımlık oyuncu girdisi.
+# pull: KY-040 net adımı (+ yukarı, - aşağı), pot: 0-1023 veya -1 (yok)
+ControlInput = namedtuple("ControlInput", "up down left right pull pot")
+NO_INPUT = ControlInput(False, False, False, False, 0, -1)
+
+# -------------------------
+# BALIK HAVUZU (Structure-of-Arrays)
+# -------------------------
+class FishPool:
+    """Tüm balıkların durumunu nesne başına değil sütun dizilerinde tutan havuz.
+
+    Her karede toplu güncellenen x ve speed sütunları `map` ile C seviyesinde
+    tek geçişte toplanabilsin diye liste; küçük tamsayı sütunları (type,
+    anim_frame, caught) `array` olarak tutulur. Kare başına iş sabit tutulur:
+
+    - Hareket: x += speed tüm havuz için tek bir `map(add, ...)` çağrısıdır.
+    - Yeniden doğma: Her balığın ekrandan çıkacağı kare doğduğunda tahmin
+      edilip bir zaman çarkına (kare -> sıra numaraları) yazılır; her karede
+      sadece o karenin kovası kontrol edilir.
+    - Animasyon: Sayaçlar 20 karede bir sarar, balıklar sayaç evresine göre
+      20 kovaya ayrılır ve her karede yalnızca bir kova ilerletilir.
+
+    Çizim ve yakalama kodu `Fish` görünümleri üzerinden eskisi gibi balık
+    nesneleriyle çalışır.
+    """
+
+    ANIM_PERIOD = 20
+
+    def __init__(self, rng, count, frame_counts=FISH_FRAME_COUNTS, view_factory=None):
+        self.rng = rng
+        self.count = count
+        self.frame_counts = array('b', frame_counts)
+        self.x = [0.0] * count
+        self.y = [0.0] * count
+        # Bir önceki adımın konumları (çizimde adımlar arası ara değerleme için)
+        self.prev_x = [0.0] * count
+        self.prev_y = [0.0] * count
+        self.speed = [0.0] * count
+        self.type = array('b', bytes(count))
+        self.anim_frame = array('b', bytes(count))
+        self.caught = array('b', bytes(count))
+        self.caught_indices = set()
+        self.hooks = {}  # Yakalanan balık -> onu tutan kancanın konumu (çok oyunculu)
+        self.text = [""] * count
+        self.is_correct = [False] * count
+        self.fish_score_value = 1
+        self.tick = 0
+        # Animasyon: Sayaç = (tick - anim_base) % ANIM_PERIOD; yakalıyken sayaç anim_paused'da durur
+        self.anim_base = array('q', bytes(8 * count))
+        self.anim_paused = array('b', bytes(count))
+        self._anim_buckets = [set() for _ in range(self.ANIM_PERIOD)]
+        self._anim_buckets[0].update(range(count))
+        # Yeniden doğma çarkı: kare -> [(sıra, nesil)]; nesil eski kayıtları geçersiz kılar
+        self._generation = array('q', bytes(8 * count))
+        self._exit_wheel = {}
+        for i in range(count):
+            self.type[i] = rng.randint(0, len(frame_counts) - 1)
+            self.spawn(i)
+        view_factory = view_factory or Fish
+        self.fishes = [view_factory(self, i) for i in range(count)]
+
+    def spawn(self, i):
+        """i. balığı ekranın solunda rastgele bir şeritte yeniden doğurur."""
+        self.x[i] = self.prev_x[i] = -FISH_SIZE[0]
+        self.y[i] = self.prev_y[i] = self.rng.randint(LINE_Y + 100, HEIGHT - 100)
+        self.speed[i] = self.rng.uniform(1.5, 3.5)
+        self.set_caught(i, False)
+        self.schedule_exit(i)
+
+    def set_x(self, i, x):
+        self.x[i] = self.prev_x[i] = x
+        self.schedule_exit(i)
+
+    def schedule_exit(self, i):
+        """Balığın sağdan çıkacağı kareyi tahmin edip çarka yazar (tahmin geç kalmaz, erken olabilir)."""
+        self._generation[i] += 1
+        frames = int((WIDTH + 100 - self.x[i]) / self.speed[i]) - 1
+        due = self.tick + max(1, frames)
+        self._exit_wheel.setdefault(due, []).append((i, self._generation[i]))
+
+    def set_caught(self, i, caught):
+        if bool(self.caught[i]) == bool(caught):
+            return
+        period = self.ANIM_PERIOD
+        self.caught[i] = caught
+        if caught:
+            # Animasyon sayacını dondur
+            self.caught_indices.add(i)
+            self.anim_paused[i] = (self.tick - self.anim_base[i]) % period
+            self._anim_buckets[self.anim_base[i] % period].discard(i)
+        else:
+            self.caught_indices.discard(i)
+            self.hooks.pop(i, None)
+            self.anim_base[i] = self.tick - self.anim_paused[i]
+            self._anim_buckets[self.anim_base[i] % period].add(i)
+
+    def anim_timer(self, i):
+        if self.caught[i]:
+            return self.anim_paused[i]
+        return (self.tick - self.anim_base[i]) % self.ANIM_PERIOD
+
+    def update(self, hook_pos):
+        """Tüm havuzu bir adım ilerletir; yeniden doğan balıkların sıra numaralarını döndürür.
+
+        Yakalanan balıklar `hooks` içinde kayıtlı kancayı, yoksa `hook_pos`'u izler.
+        """
+        self.tick += 1
+        tick = self.tick
+        # Eski x listesi olduğu gibi önceki konum olur; yeni liste map ile kurulur
+        self.prev_x = self.x
+        self.prev_y = self.y[:]
+        xs = self.x = list(map(add, self.x, self.speed))
+        caught = self.caught_indices
+        hooks = self.hooks
+        for i in caught:
+            # Yakalanan balık kendi kancasıyla hareket eder
+            hx, hy = hooks.get(i, hook_pos)
+            xs[i] = hx + 5
+            self.y[i] = hy - 10
+
+        respawned = []
+        due = self._exit_wheel.pop(tick, None)
+        if due:
+            limit = WIDTH + 100
+            generation = self._generation
+            for i, gen in due:
+                if gen != generation[i] or i in caught:
+                    continue  # Eski kayıt veya kancadaki balık
+                if xs[i] > limit:
+                    respawned.append(i)
+                else:
+                    self._exit_wheel.setdefault(tick + 1, []).append((i, gen))
+            respawned.sort()  # Rastgele sayı sırası balık sırasını izlesin
+            for i in respawned:
+                self.spawn(i)
+
+        frame_counts, types, frames = self.frame_counts, self.type, self.anim_frame
+        for i in self._anim_buckets[tick % self.ANIM_PERIOD]:
+            frames[i] = (frames[i] + 1) % frame_counts[types[i]]
+        return respawned
+
+
+class Fish:
+    """Havuzdaki bir balığa bakan ince görünüm; eski Fish özniteliklerini ve metotlarını sunar."""
+
+    __slots__ = ("pool", "index", "__weakref__")
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    # Sütun erişimleri sık kullanıldığı için her özellik açıkça yazılmıştır
+    @property
+    def x(self):
+        return self.pool.x[self.index]
+
+    @x.setter
+    def x(self, value):
+        self.pool.set_x(self.index, value)
+
+    @property
+    def y(self):
+        return self.pool.y[self.index]
+
+    @y.setter
+    def y(self, value):
+        self.pool.y[self.index] = value
+
+    @property
+    def speed(self):
+        return self.pool.speed[self.index]
+
+    @speed.setter
+    def speed(self, value):
+        self.pool.speed[self.index] = value
+
+    @property
+    def anim_frame(self):
+        return self.pool.anim_frame[self.index]
+
+    @property
+    def anim_timer(self):
+        return self.pool.anim_timer(self.index)
+
+    @property
+    def type(self):
+        return self.pool.type[self.index]
+
+    @property
+    def text(self):
+        return self.pool.text[self.index]
+
+    @property
+    def is_correct(self):
+        return self.pool.is_correct[self.index]
+
+    @is_correct.setter
+    def is_correct(self, value):
+        self.pool.is_correct[self.index] = value
+
+    @property
+    def caught(self):
+        return self.pool.caught[self.index] != 0
+
+    @caught.setter
+    def caught(self, value):
+        self.pool.set_caught(self.index, value)
+
+    @property
+    def fish_score_value(self):
+        return self.pool.fish_score_value
+
+    def render_pos(self, alpha):
+        """Son iki adım arasında `alpha` oranındaki çizim konumu."""
+        pool, i = self.pool, self.index
+        px, py = pool.prev_x[i], pool.prev_y[i]
+        return px + (pool.x[i] - px) * alpha, py + (pool.y[i] - py) * alpha
+
+    def set_text(self, text):
+        self.pool.text[self.index] = text
+
+    def reset_offscreen(self):
+        self.pool.spawn(self.index)
+
+
+# -------------------------
+# OYUNCULAR
+# -------------------------
+def player_home_x(index, count):
+    """Oyuncunun kancasının başlangıç x konumu; tek oyuncuda eski konum korunur."""
+    if count == 1:
+        return float(HOOK_INITIAL_X)
+    return float(WIDTH * (index + 1) // (count + 1))
+
+
+class Player:
+    """Bir konsola (veya klavyeye) bağlı oyuncunun kancası ve skoru."""
+
+    __slots__ = ("index", "home_x", "line_x", "hook_x_anchor", "hook_pos", "prev_hook_pos", "score",
+                 "correct_count", "wrong_count", "caught_fish", "catch_frame", "catch_question")
+
+    def __init__(self, index, count):
+        self.index = index
+        self.home_x = player_home_x(index, count)
+        # Tek oyuncuda ip ekranın ortasından sarkar, çok oyunculuda her oyuncunun kendi noktasından
+        self.line_x = LINE_X if count == 1 else int(self.home_x)
+        self.reset()
+
+    def reset(self):
+        self.hook_x_anchor = self.home_x
+        self.hook_pos = [self.home_x, float(LINE_Y)]
+        self.prev_hook_pos = (self.home_x, float(LINE_Y))
+        self.score = 0
+        self.correct_count = 0
+        self.wrong_count = 0
+        self.caught_fish = None
+        self.catch_frame = 0
+        # Yakalanan balığın etiketinin ait olduğu soru: (soru no, soru metni, sorunun gösterildiği adım)
+        self.catch_question = None
+
+    def render_hook_pos(self, alpha):
+        """Son iki adım arasında `alpha` oranındaki kanca çizim konumu."""
+        (px, py), (x, y) = self.prev_hook_pos, self.hook_pos
+        return px + (x - px) * alpha, py + (y - py) * alpha
+
+    def hook_rect(self):
+        """Kancanın çarpışma dikdörtgeni (x, y, w, h)."""
+        w, h = HOOK_SIZE
+        return int(self.hook_pos[0] - w // 2), int(self.hook_pos[1] - h // 2), w, h
+
+
+# -------------------------
+# OYUN DURUMU VE ADIM FONKSİYONU
+# -------------------------
+class GameState:
+    """Kancalar, balıklar, soru ve skorlardan oluşan oyun durumu.
+
+    `step()` tek bir sabit zaman adımını ilerletir ve ekrana, saate veya
+    gerçek girdiye bağlı değildir; bu sayede oyun görüntüsüz ve gerçek
+    zamandan hızlı simüle edilebilir. Çok oyunculu modda her oyuncunun kendi
+    kancası ve skoru vardır; balık havuzu ve soru ortaktır.
+    """
+
+    def __init__(self, questions, seed=None, fish_count=FISH_COUNT, fish_factory=Fish,
+                 frame_counts=FISH_FRAME_COUNTS, players=1):
+        self.rng = random.Random(seed)
+        self.questions = questions
+        self.scheduler = QuestionScheduler(len(questions), self.rng)
+        self.pool = FishPool(self.rng, fish_count, frame_counts, view_factory=fish_factory)
+        self.fishes = self.pool.fishes
+        self.broadphase = LaneSweep(FISH_SIZE)
+        self.players = [Player(i, players) for i in range(players)]
+        self.time_counter = 0.0
+        self.frame = 0
+        # Olay sözlüklerini alan çağrılabilir (örn. telemetry.TelemetryWriter); None ise olay üretilmez
+        self.telemetry = None
+        self.question_frame = 0
+        self.reset()
+
+    # Tek oyunculu kod ve simülasyon için ilk oyuncunun durumu
+    @property
+    def hook_pos(self):
+        return self.players[0].hook_pos
+
+    @property
+    def hook_x_anchor(self):
+        return self.players[0].hook_x_anchor
+
+    @property
+    def score(self):
+        return self.players[0].score
+
+    @property
+    def correct_count(self):
+        return self.players[0].correct_count
+
+    @property
+    def wrong_count(self):
+        return self.players[0].wrong_count
+
+    @property
+    def caught_fish(self):
+        return self.players[0].caught_fish
+
+    def reset(self):
+        """Yeni bir oyun başlatır (menüde SPACE'e basılınca)."""
+        for player in self.players:
+            player.reset()
+        self.current_question_data = {}
+        self.current_index = None
+        self.current_question = ""
+        self.current_answer = ""
+        for f in self.fishes:
+            f.reset_offscreen()
+        self.broadphase.rebuild(self.fishes)
+        return self.new_question()
+
+    def set_questions(self, questions, matches=None, matched_from=None):
+        """Soru bankasını değiştirir (sıcak yeniden yükleme); ekrandaki soru bir sonraki soruya kadar kalır.
+
+        Sorular eskileriyle eşlenir (match_questions): Eşleşenlerin Leitner
+        kutusu ve deste durumu korunur, ekrandaki ve kancalardaki soruların
+        numaraları yeni bankaya çevrilir. Eşleşme arka planda hesaplandıysa
+        `matched_from` hangi bankaya göre hesaplandığını belirtir; banka o
+        arada değiştiyse yeniden hesaplanır.
+        """
+        if matches is None or matched_from is not self.questions:
+            matches = match_questions(self.questions, questions)
+        new_index = {old: q for q, old in enumerate(matches) if old >= 0}
+        self.questions = questions
+        self.scheduler = self.scheduler.remap(matches)
+        if self.current_index is not None:
+            self.current_index = new_index.get(self.current_index)
+        for player in self.players:
+            if player.catch_question is not None:
+                index, question, question_frame = player.catch_question
+                player.catch_question = (new_index.get(index), question, question_frame)
+
+    def new_question(self):
+        """Yeni soruyu zamanlayıcıdan alır ve cevap/çeldiricileri balıklara dağıtır; soru yoksa False döner.
+
+        `questions` bir QuestionBank veya sözlük listesi olabilir; sadece seçilen
+        soru çözülür.
+        """
+        if not self.questions:
+            return False
+        rng = self.rng
+        fishes = self.fishes
+        self.current_index = self.scheduler.next()
+        self.current_question_data = self.questions[self.current_index]
+        self.current_question = self.current_question_data["question"]
+        self.current_answer = self.current_question_data["answer"]
+        self.question_frame = self.frame
+        if self.telemetry is not None:
+            self.telemetry({"type": "question", "frame": self.frame, "question_index": self.current_index,
+                            "question": self.current_question})
+        # Başka oyuncuların kancasındaki balıkların etiketi yüzeye çıkana kadar değişmez
+        held = [p.caught_fish for p in self.players if p.caught_fish is not None]
+        if held:
+            fishes = [f for f in fishes if f not in held]
+        texts_to_assign = self._fish_texts(len(fishes))
+        rng.shuffle(texts_to_assign)
+        correct_fish_assigned = False
+        for fish, text in zip(fishes, texts_to_assign):
+            fish.set_text(text)
+            fish.is_correct = (text == self.current_answer)
+            if fish.is_correct:
+                correct_fish_assigned = True
+        if not correct_fish_assigned and fishes:
+            chosen_fish = rng.choice(fishes)
+            chosen_fish.set_text(self.current_answer)
+            chosen_fish.is_correct = True
+        return True
+
+    def _fish_texts(self, count):
+        """Cevap ve çeldiricilerden `count` balık etiketi üretir.
+
+        Balık sayısı seçenekten fazlaysa eksikler önce başka soruların
+        cevaplarıyla (ekranda tekrar olmasın diye), onlar da yetmezse
+        çeldiricileri sırayla dolaşarak doldurulur.
+        """
+        answer = self.current_answer
+        distractors = self.current_question_data["distractors"]
+        texts = ([answer] + distractors)[:count]
+        used = set(texts)
+        questions = self.questions
+        for _ in range(2 * (count - len(texts))):
+            if len(texts) >= count:
+                break
+            other = questions[self.rng.randrange(len(questions))]["answer"]
+            if other not in used:
+                used.add(other)
+                texts.append(other)
+        fill = distractors or ["..."]
+        i = 0
+        while len(texts) < count:
+            texts.append(fill[i % len(fill)])
+            i += 1
+        return texts
+
+    def render_time_counter(self, alpha):
+        """Zikzak dalgasının `alpha` oranında ara değerlenmiş zamanı."""
+        return self.time_counter - (1.0 - alpha) * ZIGZAG_FREQUENCY
+
+    def hook_rect(self):
+        """İlk oyuncunun kancasının çarpışma dikdörtgeni (x, y, w, h)."""
+        return self.players[0].hook_rect()
+
+    def check_catch(self, players=None):
+        """Balık tutmayan kancalar için çarpışmayı kontrol eder; [(oyuncu, balık)] döndürür.
+
+        Bir balığa birden fazla kanca değerse oyuncu sırası önceliklidir.
+        """
+        free = [p for p in (players or self.players) if not p.caught_fish]
+        if not free:
+            return []
+        caught = []
+        hooks = self.pool.hooks
+        for player, fish in zip(free, self.broadphase.query_many([p.hook_rect() for p in free])):
+            if fish is not None:
+                fish.caught = True
+                hooks[fish.index] = player.hook_pos
+                player.caught_fish = fish
+                player.catch_frame = self.frame
+                player.catch_question = (self.current_index, self.current_question, self.question_frame)
+                caught.append((player, fish))
+                if self.telemetry is not None:
+                    self.telemetry(self._answer_event("catch", player, fish))
+        return caught
+
+    def _answer_event(self, kind, player, fish):
+        """Yakalama/puanlama telemetri olayı; süreler soru gösterildiğinden beri geçen oyun süresidir.
+
+        Soru, balık yakalandığında ekranda olan sorudur (balık tutulurken soru değişmiş olabilir).
+        """
+        index, question, question_frame = player.catch_question
+        event = {"type": kind, "frame": self.frame, "player": player.index, "question_index": index,
+                 "question": question, "chosen": fish.text, "correct": fish.is_correct,
+                 "catch_time": round((player.catch_frame - question_frame) * FIXED_DT, 3)}
+        if kind == "answer":
+            event["answer_time"] = round((self.frame - question_frame) * FIXED_DT, 3)
+        return event
+
+    def _move_hook(self, player, inp, sway):
+        """Bir oyuncunun kancasını girdisine göre hareket ettirir."""
+        # YATAY HAREKET: Potansiyometre VEYA Klavye/Fare
+        if inp.pot != -1:
+            target_x_anchor = 10 + (inp.pot / 1023.0) * (WIDTH - 20)
+            player.hook_x_anchor = player.hook_x_anchor * (1 - POT_SMOOTHING) + target_x_anchor * POT_SMOOTHING
+        else:
+            if inp.left:
+                player.hook_x_anchor -= HORIZONTAL_SPEED
+            if inp.right:
+                player.hook_x_anchor += HORIZONTAL_SPEED
+
+        # İp Salınımı
+        hook_pos = player.hook_pos
+        hook_pos[0] = player.hook_x_anchor + sway
+
+        # DİKEY HAREKET: Klavye VEYA KY-040 (her adım için bir kez)
+        caught_fish = player.caught_fish
+        if inp.up:
+            hook_pos[1] -= PULL_SPEED
+        elif inp.pull > 0:
+            hook_pos[1] -= PULL_SPEED * inp.pull
+        elif not caught_fish and inp.down:
+            hook_pos[1] += PULL_SPEED
+        elif not caught_fish and inp.pull < 0:
+            hook_pos[1] += PULL_SPEED * -inp.pull
+        elif not caught_fish:
+            hook_pos[1] += AUTO_SINK_SPEED  # Otomatik batma
+
+        # Sınırlar
+        player.hook_x_anchor = max(10, min(player.hook_x_anchor, WIDTH - 10))
+        hook_pos[1] = max(LINE_Y, min(hook_pos[1], HEIGHT - 30))
+
+    def _land(self, player, events):
+        """Balığı yüzeye çıkaran oyuncunun skorunu işler.
+
+        Cevap, balığın yakalandığı andaki soruya sayılır. O sırada soru
+        değiştiyse balık yeniden doğarken yeni sorunun bir çeldiricisini alır.
+        """
+        caught_fish = player.caught_fish
+        player.caught_fish = None  # Yeni soru bu balığı da etiketlesin
+        index, _question, question_frame = player.catch_question
+        if index is not None:
+            self.scheduler.record(index, caught_fish.is_correct)
+        if self.telemetry is not None:
+            self.telemetry(self._answer_event("answer", player, caught_fish))
+        stale = question_frame != self.question_frame
+        if caught_fish.is_correct:
+            player.score += caught_fish.fish_score_value
+            player.correct_count += 1
+            events.append(("correct", caught_fish, player.index))
+            if not stale:
+                self.new_question()
+        else:
+            player.score -= caught_fish.fish_score_value
+            player.wrong_count += 1
+            events.append(("wrong", caught_fish, player.index))
+        if stale:
+            distractors = self.current_question_data.get("distractors") or ["..."]
+            caught_fish.set_text(distractors[caught_fish.index % len(distractors)])
+            caught_fish.is_correct = False
+        caught_fish.reset_offscreen()
+        self.broadphase.sync(caught_fish)
+        player.hook_pos[1] = float(LINE_Y)
+        player.hook_x_anchor = player.home_x
+
+    def step(self, inp=NO_INPUT, inputs=None):
+        """Oyunu bir sabit adım ilerletir ve olay listesini döndürür.
+
+        `inputs` her oyuncu için bir ControlInput içerir; verilmezse tek
+        oyuncu `inp` ile oynar. Olaylar: ("catch" | "correct" | "wrong", balık, oyuncu no).
+        """
+        if inputs is None:
+            inputs = (inp,)
+        events = []
+        self.frame += 1
+        self.time_counter += 1 * ZIGZAG_FREQUENCY
+        sway = SWAY_AMPLITUDE * math.sin(self.time_counter * SWAY_SPEED)
+
+        # Bu adımda balığı çıkaran kanca aynı adımda yeni balık yakalamaz
+        free = []
+        for player, player_inp in zip(self.players, inputs):
+            player.prev_hook_pos = (player.hook_pos[0], player.hook_pos[1])
+            self._move_hook(player, player_inp, sway)
+            if not player.caught_fish:
+                free.append(player)
+            elif player.hook_pos[1] <= LINE_Y:
+                self._land(player, events)
+
+        # Yakalama Kontrolü
+        if free:
+            for player, fish in self.check_catch(free):
+                events.append(("catch", fish, player.index))
+
+        broadphase = self.broadphase
+        fishes = self.fishes
+        for i in self.pool.update(self.players[0].hook_pos):
+            broadphase.sync(fishes[i])
+        broadphase.next_frame()
+        return events
+
+
+def match_questions(old, new):
+    """Yeni bankadaki her soru için eski bankadaki aynı sorunun numarası; yeni veya değişmişse -1.
+
+    Sorular metinleriyle eşlenir; cevabı değişen soru değişmiş sayılır
+    (çeldirici düzeltmeleri ilerlemeyi silmez). Sorular sırayla çözüldüğü
+    için büyük bankalarda arka plan iş parçacığında çağrılmalıdır.
+    """
+    by_text = {}
+    for i in range(len(old)):
+        q = old[i]
+        by_text.setdefault(q["question"], (i, q["answer"]))
+    matches = array('l', [-1]) * len(new)
+    for i in range(len(new)):
+        q = new[i]
+        found = by_text.get(q["question"])
+        if found is not None and found[1] == q["answer"]:
+            matches[i] = found[0]
+            del by_text[q["question"]]  # Aynı metinli ikinci soru aynı kutuyu paylaşmasın
+    return matches
+
+
+class FixedTimestep:
+    """Gerçek geçen süreyi sabit adımlara bölen biriktirici (accumulator).
+
+    Oyun kuralları her zaman FIXED_DT'lik adımlarla ilerlediği için hızlar
+    ekranın yenileme hızından bağımsızdır; artan süre `alpha` ile çizimde
+    adımlar arası ara değerlemeye kullanılır.
+    """
+
+    def __init__(self, dt=FIXED_DT, max_steps=5):
+        self.dt = dt
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.skipped = False  # Son karede geride kalınıp zaman atıldı mı
+
+    def advance(self, elapsed):
+        """Geçen süreyi ekler ve bu karede çalıştırılacak adım sayısını döndürür."""
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.dt)
+        self.skipped = steps > self.max_steps
+        if self.skipped:
+            # Çok geride kalındıysa yetişmeye çalışmak yerine fazlasını at
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """Son adımdan bu yana geçen sürenin adım süresine oranı (0-1)."""
+        return min(1.0, self.accumulator / self.dt)
+
+
+def run_frame(game, steps, inputs):
+    """Bir karede `steps` sabit adım çalıştırır ve olayları döndürür.
+
+    KY-040 adımları sadece ilk adımda uygulanır. Canlı oyun ve kayıt tekrarı
+    aynı fonksiyonu kullandığı için tekrar oynatma birebir aynı sonucu verir.
+    """
+    events = []
+    for _ in range(steps):
+        events.extend(game.step(inputs=inputs))
+        inputs = [inp._replace(pull=0) for inp in inputs]
+    return events
@@ -0,0 +1,77 @@
+import os
+import queue
+import threading
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileWatcher:
+    """Dosyaları arka planda yoklayan ve değişenleri yeniden yükleyen iş parçacığı.
+
+    Her izleme grubu bir dosya listesi ve bir yükleyiciden oluşur; yükleyici
+    sadece değişen yollarla, arka plan iş parçacığında çağrılır. Sonuçlar bir
+    kuyruğa yazılır ve oyun döngüsü kareler arasında `poll()` ile alıp tek
+    atamayla yerine koyar; böylece ayrıştırma ve görsel çözme kareyi
+    bekletmez. Yarım kaydedilmiş dosyaları okumamak için bir dosya ancak iki
+    yoklama boyunca değişmeden kalınca yüklenir.
+    """
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self._groups = []
+        self._results = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+
+    def watch(self, name, paths, loader):
+        """`paths` değişince `loader(değişen_yollar)` sonucunu `name` adıyla yayınlar."""
+        stamps = {path: _stamp(path) for path in paths}
+        self._groups.append((name, loader, stamps, dict(stamps)))
+        return self
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=0.5):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        """Tüm grupları bir kez yoklar (arka planda periyodik olarak çağrılır)."""
+        for name, loader, loaded, seen in self._groups:
+            changed = []
+            for path, old in loaded.items():
+                stamp = _stamp(path)
+                if stamp != seen[path]:
+                    seen[path] = stamp  # Yazma sürüyor olabilir: Bir sonraki yoklamayı bekle
+                elif stamp != old and stamp is not None:
+                    changed.append(path)
+            if not changed:
+                continue
+            for path in changed:
+                loaded[path] = seen[path]
+            try:
+                self._results.put((name, loader(changed), None))
+            except Exception as e:
+                self._results.put((name, None, e))
+
+    def poll(self):
+        """Hazır sonuçları [(ad, sonuç, hata)] olarak döndürür; oyun döngüsünden çağrılır."""
+        ready = []
+        while True:
+            try:
+                ready.append(self._results.get_nowait())
+            except queue.Empty:
+                return ready
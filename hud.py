@@ -0,0 +1,111 @@
+import pygame
+
+
+class AllocationCounter:
+    """Çizim yolunda oluşturulan yüzeyleri (Surface) sayar.
+
+    Yüzey oluşturan çizim kodu `surface()` veya `add()` kullanır; böylece
+    oyun sırasında kare başına yeni yüzey ayrılıp ayrılmadığı F3 panelinden
+    ve çıkıştaki özetten doğrulanabilir. Sadece bildirilen yüzeyler sayılır:
+    blit ve pygame.draw'ın döndürdüğü Rect'ler gibi diğer nesneler bu sayaçta
+    görünmez.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.last_frame = 0
+        self.frames = 0
+        self.frames_with_allocations = 0
+        self._frame_start = 0
+
+    def surface(self, size, flags=0):
+        self.total += 1
+        return pygame.Surface(size, flags)
+
+    def add(self, count=1):
+        self.total += count
+
+    def begin_frame(self):
+        self._frame_start = self.total
+
+    def end_frame(self):
+        self.last_frame = self.total - self._frame_start
+        self.frames += 1
+        if self.last_frame:
+            self.frames_with_allocations += 1
+
+    def summary(self):
+        return (f"Yeni Surface: toplam {self.total}, {self.frames} karenin "
+                f"{self.frames_with_allocations} tanesinde yeni yüzey oluşturuldu")
+
+
+class HudLayer:
+    """Soru çubuğu ve skorun önceden çizilmiş katmanı.
+
+    Katman sadece soru veya skor değişince yeniden çizilir; diğer karelerde
+    ekrana tek bir blit ile kopyalanır.
+    """
+
+    BACKGROUND = (0, 0, 0)
+
+    def __init__(self, size, question_font, score_font, allocations, score_pos=(20, 20)):
+        self.question_font = question_font
+        self.score_pos = score_pos
+        self.score_font = score_font
+        self.allocations = allocations
+        self.surface = allocations.surface(size)
+        self.rect = self.surface.get_rect()
+        self._key = None
+
+    def update(self, question, scores):
+        """İçerik değiştiyse katmanı yeniden çizer ve True döndürür."""
+        key = (question, scores)
+        if key == self._key:
+            return False
+        self._key = key
+        surf = self.surface
+        surf.fill(self.BACKGROUND)
+        question_surf = self.question_font.render(f"SORU: {question}", True, (255, 255, 255))
+        surf.blit(question_surf, question_surf.get_rect(center=(self.rect.width // 2, self.rect.height // 2)))
+        if len(scores) == 1:
+            label = f"Skor: {scores[0]}"
+        else:
+            label = "Skor: " + "  ".join(f"{i + 1}) {score}" for i, score in enumerate(scores))
+        surf.blit(self.score_font.render(label, True, (255, 255, 0)), self.score_pos)
+        self.allocations.add(2)
+        return True
+
+
+class FeedbackPanels:
+    """DOĞRU/YANLIŞ geri bildirimi için önceden hazırlanmış yarı saydam paneller.
+
+    Her (metin, renk) için arka plan ve yazı tek bir yüzeyde birleştirilir;
+    panel gösterilirken her kare sadece bu yüzey kopyalanır.
+    """
+
+    def __init__(self, size, center, font, allocations, background=(0, 0, 0, 180)):
+        self.size = size
+        self.font = font
+        self.allocations = allocations
+        self.background = background
+        self.rect = pygame.Rect((0, 0), size)
+        self.rect.center = center
+        self._panels = {}
+
+    def get(self, text, color):
+        panel = self._panels.get((text, color))
+        if panel is None:
+            panel = self._panels[(text, color)] = self._build(text, color)
+        return panel
+
+    def prebuild(self, items):
+        for text, color in items:
+            self.get(text, color)
+
+    def _build(self, text, color):
+        panel = self.allocations.surface(self.size, pygame.SRCALPHA)
+        panel.fill(self.background)
+        text_surf = self.font.render(text, True, color)
+        self.allocations.add()
+        panel.blit(text_surf, text_surf.get_rect(center=(self.size[0] // 2, self.size[1] // 2)))
+        return panel
@@ -0,0 +1,134 @@
+import gzip
+import hashlib
+import json
+import struct
+
+from game_logic import GameState, ControlInput, run_frame
+
+# -------------------------
+# Girdi Kaydı Biçimi (gzip ile sıkıştırılmış)
+# -------------------------
+# İlk satır JSON başlık: tohum, oyuncu ve balık sayısı, balık türü kare sayıları,
+# soru dosyasının özeti. Ardından kayıtlar (1 baytlık etiket + veri):
+#   R                     : Yeni oyun (menüde SPACE, GameState.reset)
+#   F adım(u8) + oyuncu başına [bayraklar(u8), D(i8), P(i16)] : Bir kare
+#   E + JSON satırı       : Kayıt sonu ve oyunun sonucu (doğrulama için)
+# Bayraklar: 1 yukarı, 2 aşağı, 4 sol, 8 sağ (klavye ve fare tuşlarının yön karşılıkları)
+LOG_VERSION = 1
+_STEPS = struct.Struct("<B")
+_PLAYER_INPUT = struct.Struct("<Bbh")
+
+
+def file_digest(path):
+    """Dosyanın SHA-1 özeti; dosya yoksa None (yedek sorular)."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def game_result(game):
+    """Kaydın sonunda saklanan ve tekrar oynatmada karşılaştırılan sonuç."""
+    return {
+        "frame": game.frame,
+        "question": game.current_question,
+        "players": [[p.score, p.correct_count, p.wrong_count] for p in game.players],
+    }
+
+
+def _encode_input(inp):
+    flags = (inp.up and 1) | (inp.down and 2) | (inp.left and 4) | (inp.right and 8)
+    return _PLAYER_INPUT.pack(flags, max(-128, min(127, inp.pull)), inp.pot)
+
+
+def _decode_input(flags, pull, pot):
+    return ControlInput(bool(flags & 1), bool(flags & 2), bool(flags & 4), bool(flags & 8), pull, pot)
+
+
+class InputRecorder:
+    """Oyunun tohumunu ve kare kare girdilerini sıkıştırılmış bir dosyaya yazar."""
+
+    def __init__(self, path, seed, players=1, fish_count=None, frame_counts=None, questions_digest=None):
+        self.path = path
+        self.players = players
+        self._file = gzip.open(path, "wb")
+        header = {
+            "version": LOG_VERSION,
+            "seed": seed,
+            "players": players,
+            "fish_count": fish_count,
+            "frame_counts": frame_counts,
+            "questions_sha1": questions_digest,
+        }
+        self._file.write(json.dumps(header).encode("utf-8") + b"\n")
+        self.frames = 0
+
+    def reset(self):
+        self._file.write(b"R")
+
+    def frame(self, steps, inputs):
+        """Bir karenin adım sayısını ve her oyuncunun (KY-040 adımları dahil) girdisini yazar."""
+        self._file.write(b"F" + _STEPS.pack(steps) + b"".join(_encode_input(inp) for inp in inputs))
+        self.frames += 1
+
+    def close(self, game=None):
+        self._file.write(b"E" + json.dumps(game_result(game) if game else None).encode("utf-8") + b"\n")
+        self._file.close()
+
+
+def read_log(path):
+    """(başlık, kayıt üreteci) döndürür; kayıtlar ("reset",), ("frame", adım, girdiler), ("end", sonuç)."""
+    f = gzip.open(path, "rb")
+    header = json.loads(f.readline())
+    if header.get("version") != LOG_VERSION:
+        f.close()
+        raise ValueError(f"desteklenmeyen kayıt sürümü: {header.get('version')}")
+
+    def records():
+        players = header["players"]
+        size = _STEPS.size + players * _PLAYER_INPUT.size
+        with f:
+            while True:
+                tag = f.read(1)
+                if tag == b"R":
+                    yield ("reset",)
+                elif tag == b"F":
+                    data = f.read(size)
+                    if len(data) < size:
+                        return  # Yarım kalmış kayıt (oyun çökmüş olabilir)
+                    inputs = [_decode_input(*_PLAYER_INPUT.unpack_from(data, _STEPS.size + i * _PLAYER_INPUT.size))
+                              for i in range(players)]
+                    yield ("frame", data[0], inputs)
+                elif tag == b"E":
+                    yield ("end", json.loads(f.readline()))
+                    return
+                else:
+                    return
+
+    return header, records()
+
+
+def replay(path, questions, on_frame=None):
+    """Kaydı görüntüsüz ve deterministik olarak yeniden oynatır; (oyun, kayıttaki sonuç) döndürür.
+
+    `on_frame(oyun, olaylar)` her kareden sonra çağrılır (ölçüm için).
+    """
+    header, records = read_log(path)
+    kwargs = {}
+    if header.get("fish_count") is not None:
+        kwargs["fish_count"] = header["fish_count"]
+    if header.get("frame_counts"):
+        kwargs["frame_counts"] = header["frame_counts"]
+    game = GameState(questions, seed=header["seed"], players=header["players"], **kwargs)
+    expected = None
+    for record in records:
+        if record[0] == "reset":
+            game.reset()
+        elif record[0] == "frame":
+            events = run_frame(game, record[1], record[2])
+            if on_frame is not None:
+                on_frame(game, events)
+        else:
+            expected = record[1]
+    return game, expected
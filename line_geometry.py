@@ -0,0 +1,87 @@
+import math
+
+from game_logic import ZIGZAG_AMPLITUDE, ZIGZAG_FREQUENCY, WIDTH, HEIGHT
+
+SEGMENT_LENGTH = 10
+
+
+def reference_zigzag_points(start_pos, end_pos, time_counter, amplitude=ZIGZAG_AMPLITUDE,
+                            frequency=ZIGZAG_FREQUENCY, segment_length=SEGMENT_LENGTH):
+    """Zikzak ip noktalarının ilk (nokta nokta trigonometri ile) hesaplanışı; karşılaştırma için tutulur."""
+    dx = end_pos[0] - start_pos[0]
+    dy = end_pos[1] - start_pos[1]
+    distance = math.sqrt(dx ** 2 + dy ** 2)
+    num_points = max(2, int(distance / segment_length))
+    points = [start_pos]
+    for i in range(1, num_points):
+        ratio = i / (num_points - 1)
+        px = start_pos[0] + dx * ratio
+        py = start_pos[1] + dy * ratio
+        if distance > 0:
+            angle = math.atan2(dy, dx)
+            offset_x = amplitude * math.sin(frequency * i + time_counter) * math.sin(angle)
+            offset_y = amplitude * math.sin(frequency * i + time_counter) * -math.cos(angle)
+        else:
+            offset_x, offset_y = 0, 0
+        points.append((int(px + offset_x), int(py + offset_y)))
+    points[-1] = end_pos
+    return points
+
+
+class ZigzagLine:
+    """Zikzak ip noktalarını önceden hesaplanmış dalga tablolarıyla üretir.
+
+    sin(f*i + t) = sin(f*i)*cos(t) + cos(f*i)*sin(t) olduğundan sin(f*i) ve
+    cos(f*i) tabloları bir kez hesaplanır; her karede sadece sin(t) ve cos(t)
+    çağrılır. İpin yönü (atan2) döngü dışında bir kez bulunur ve nokta
+    listesi kareler arasında yeniden kullanılır.
+    """
+
+    def __init__(self, amplitude=ZIGZAG_AMPLITUDE, frequency=ZIGZAG_FREQUENCY, segment_length=SEGMENT_LENGTH):
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.segment_length = segment_length
+        self._sin = []
+        self._cos = []
+        self._points = []
+        # Ekran köşegeni kadar ip için tabloları baştan hazırla
+        self._grow(int(math.hypot(WIDTH, HEIGHT) / segment_length) + 2)
+
+    def _grow(self, size):
+        f = self.frequency
+        for i in range(len(self._sin), size):
+            self._sin.append(math.sin(f * i))
+            self._cos.append(math.cos(f * i))
+
+    def points(self, start_pos, end_pos, time_counter):
+        """Başlangıçtan bitişe zikzak noktalarını döndürür (dönen liste bir sonraki çağrıda yeniden kullanılır)."""
+        sx, sy = start_pos
+        dx = end_pos[0] - sx
+        dy = end_pos[1] - sy
+        distance = math.hypot(dx, dy)
+        num_points = max(2, int(distance / self.segment_length))
+        if num_points > len(self._sin):
+            self._grow(num_points)
+
+        pts = self._points
+        if len(pts) > num_points:
+            del pts[num_points:]
+        elif len(pts) < num_points:
+            pts.extend([start_pos] * (num_points - len(pts)))
+
+        pts[0] = start_pos
+        last = num_points - 1
+        if distance > 0 and last > 1:
+            # amplitude * sin(açı) ve amplitude * -cos(açı)
+            ux = self.amplitude * dy / distance
+            uy = -self.amplitude * dx / distance
+            st = math.sin(time_counter)
+            ct = math.cos(time_counter)
+            sin_tab = self._sin
+            cos_tab = self._cos
+            for i in range(1, last):
+                w = sin_tab[i] * ct + cos_tab[i] * st
+                ratio = i / last
+                pts[i] = (int(sx + dx * ratio + ux * w), int(sy + dy * ratio + uy * w))
+        pts[last] = end_pos
+        return pts
@@ -0,0 +1,237 @@
+import math
+from array import array
+from itertools import islice
+
+import pygame
+
+# -------------------------
+# Parçacık Türleri
+# -------------------------
+# Her tür için: ömür (adım), ivme (x, y; piksel/adım²), sönme kademesi sayısı.
+# Kabarcıklar yavaşça yükselir, su damlaları yerçekimiyle düşer, parıltılar
+# olduğu yerde kısa sürede söner.
+BUBBLE = 0
+SPLASH = 1
+SPARKLE = 2
+
+PARTICLE_KINDS = {
+    BUBBLE: (70, 0.0, -0.04, 4),
+    SPLASH: (36, 0.0, 0.25, 4),
+    SPARKLE: (28, 0.0, 0.0, 4),
+}
+
+
+def build_particle_sprites(fade_steps=4, scale=1.0):
+    """Her tür için sönme kademelerine göre önceden çizilmiş yüzeyler ({tür: [Surface, ...]}).
+
+    `scale` çizim tuvalinin ölçeğidir; boyutlar ona göre büyütülüp küçültülür.
+    """
+
+    def frames(size, draw):
+        size = max(3, round(size * scale))
+        result = []
+        for step in range(fade_steps):
+            alpha = 255 * (fade_steps - step) // fade_steps
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            draw(surf, alpha, size)
+            result.append(surf)
+        return result
+
+    def bubble(surf, alpha, size):
+        pygame.draw.circle(surf, (220, 240, 255, alpha), (size // 2, size // 2), size // 2, 1)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size // 3, size // 3), 1)
+
+    def splash(surf, alpha, size):
+        pygame.draw.circle(surf, (150, 210, 255, alpha), (size // 2, size // 2), size // 2)
+
+    def sparkle(surf, alpha, size):
+        c = size // 2
+        color = (255, 240, 120, alpha)
+        pygame.draw.line(surf, color, (c, 0), (c, size - 1))
+        pygame.draw.line(surf, color, (0, c), (size - 1, c))
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (c, c), 1)
+
+    return {BUBBLE: frames(10, bubble), SPLASH: frames(6, splash), SPARKLE: frames(9, sparkle)}
+
+
+class ParticlePool:
+    """Sabit kapasiteli, sütun dizileriyle tutulan parçacık havuzu.
+
+    Canlı parçacıklar dizilerin başında [0, count) aralığında tutulur; ölen
+    parçacığın yerine sondaki taşınır, böylece toplu güncelleme ve çizim
+    boşluk atlamadan tek geçişte yapılır. Parçacık başına nesne yoktur:
+
+    - Hareket: vx/vy += ivme, x/y += hız; yerinde güncellenen `array('d')`
+      hız sütunları ve konum listeleri üzerinde tek döngü, ara liste oluşmaz.
+    - Sönme ve ölüm: Her parçacığın kademe değişimleri doğduğunda bir zaman
+      çarkına (adım -> olaylar) yazılır; her adımda sadece o adımın kovası işlenir.
+    - Çizim: Önceden hazırlanmış yüzeylerle tek bir `Surface.blits` çağrısı;
+      çizim dizisi ([yüzey, [x, y]] girdileri) havuzla birlikte bir kez kurulur
+      ve yerinde güncellenir, karede parçacık başına demet oluşturulmaz.
+
+    Kapasite doluysa yeni parçacıklar atılır (`dropped`). Konumlar ve hızlar
+    oyun dünyası biriminde verilir ve `scale` ile tuval pikseline çevrilerek saklanır.
+    """
+
+    def __init__(self, capacity, rng, sprites=None, kinds=PARTICLE_KINDS, scale=1.0):
+        self.capacity = capacity
+        self.rng = rng
+        self.kinds = kinds
+        self.sprites = sprites
+        self.scale = scale
+        # Çizilen alanın sınırı için en büyük parçacık yüzeyi (+ kayan nokta payı)
+        self._size = max(frames[0].get_width() for frames in sprites.values()) + 2 if sprites else 0
+        self.count = 0
+        self.dropped = 0
+        self.tick = 0
+        self.vx = array('d', bytes(8 * capacity))
+        self.vy = array('d', bytes(8 * capacity))
+        self.ax = array('d', bytes(8 * capacity))
+        self.ay = array('d', bytes(8 * capacity))
+        # Yer başına [yüzey, [x, y]]: `blits`e doğrudan verilir; taşımada girdiler yer değiştirir
+        self.items = [[None, [0.0, 0.0]] for _ in range(capacity)]
+        # Canlı parçacıkların kapladığı alan (sol, üst, sağ, alt): Güncellemede yeniden hesaplanır, doğumda genişletilir
+        self._bounds = [math.inf, math.inf, -math.inf, -math.inf]
+        self.kind = array('b', bytes(capacity))
+        # Zaman çarkındaki olaylar parçacığın yerini değil kimliğini tutar (yerler taşınabilir)
+        self.id_at = array('l', range(capacity))
+        self.slot_of = array('l', range(capacity))
+        self.generation = array('l', [0]) * capacity
+        self._wheel = {}
+
+    def emit(self, kind, x, y, n, speed=(0.5, 3.0), angle=(0.0, 2 * math.pi), spread=0.0):
+        """(x, y) merkezli `n` parçacık doğurur; hız ve açı aralıklardan rastgele seçilir."""
+        life, ax, ay, steps = self.kinds[kind]
+        sprites = self.sprites[kind] if self.sprites else [None] * steps
+        half = sprites[0].get_width() / 2 if sprites[0] is not None else 0.0
+        rng = self.rng
+        s = self.scale
+        x, y, spread = x * s, y * s, spread * s
+        ax, ay = ax * s, ay * s
+        bounds = self._bounds
+        for i in range(n):
+            slot = self.count
+            if slot >= self.capacity:
+                self.dropped += n - i
+                return
+            self.count += 1
+            pid = self.id_at[slot]
+            self.generation[pid] += 1
+            a = rng.uniform(*angle)
+            v = rng.uniform(*speed)
+            item = self.items[slot]
+            pos = item[1]
+            px = pos[0] = x - half + rng.uniform(-spread, spread)
+            py = pos[1] = y - half + rng.uniform(-spread, spread)
+            if px < bounds[0]:
+                bounds[0] = px
+            if px > bounds[2]:
+                bounds[2] = px
+            if py < bounds[1]:
+                bounds[1] = py
+            if py > bounds[3]:
+                bounds[3] = py
+            self.vx[slot] = math.cos(a) * v * s
+            self.vy[slot] = math.sin(a) * v * s
+            self.ax[slot] = ax
+            self.ay[slot] = ay
+            self.kind[slot] = kind
+            item[0] = sprites[0]
+            # Ömür biraz dağıtılır ki aynı patlamanın parçacıkları aynı karede sönmesin
+            lifetime = life + rng.randint(-life // 4, life // 4)
+            gen = self.generation[pid]
+            for step in range(1, steps + 1):
+                due = self.tick + max(1, lifetime * step // steps)
+                self._wheel.setdefault(due, []).append((pid, gen, step))
+
+    def update(self):
+        """Tüm canlı parçacıkları bir adım ilerletir ve zamanı gelen sönme/ölüm olaylarını işler."""
+        self.tick += 1
+        n = self.count
+        if n:
+            vx, vy, ax, ay, items = self.vx, self.vy, self.ax, self.ay, self.items
+            left = top = math.inf
+            right = bottom = -math.inf
+            for i in range(n):
+                dx = vx[i] = vx[i] + ax[i]
+                dy = vy[i] = vy[i] + ay[i]
+                pos = items[i][1]
+                x = pos[0] = pos[0] + dx
+                y = pos[1] = pos[1] + dy
+                if x < left:
+                    left = x
+                if x > right:
+                    right = x
+                if y < top:
+                    top = y
+                if y > bottom:
+                    bottom = y
+            self._bounds[:] = left, top, right, bottom
+        events = self._wheel.pop(self.tick, None)
+        if events:
+            generation, slot_of, kind, kinds = self.generation, self.slot_of, self.kind, self.kinds
+            sprites = self.sprites
+            for pid, gen, step in events:
+                if gen != generation[pid]:
+                    continue  # Havuz temizlendi veya kimlik yeniden kullanıldı
+                slot = slot_of[pid]
+                if step >= kinds[kind[slot]][3]:
+                    self._kill(slot)
+                elif sprites:
+                    self.items[slot][0] = sprites[kind[slot]][step]
+
+    def _kill(self, slot):
+        """Parçacığı siler: Sondaki canlı parçacık boşalan yere taşınır."""
+        last = self.count - 1
+        pid = self.id_at[slot]
+        self.generation[pid] += 1
+        if slot != last:
+            moved = self.id_at[last]
+            for column in (self.vx, self.vy, self.ax, self.ay, self.kind):
+                column[slot] = column[last]
+            items = self.items
+            items[slot], items[last] = items[last], items[slot]
+            self.id_at[slot] = moved
+            self.slot_of[moved] = slot
+            self.id_at[last] = pid
+            self.slot_of[pid] = last
+        self.items[last][0] = None
+        self.count = last
+        if not last:
+            self._bounds[:] = math.inf, math.inf, -math.inf, -math.inf
+
+    def clear(self):
+        while self.count:
+            self._kill(self.count - 1)
+        self._wheel.clear()
+
+    def draw(self, surf):
+        """Canlı parçacıkları tek `blits` çağrısıyla çizer; kapladıkları alanı (veya None) döndürür."""
+        n = self.count
+        if not n:
+            return None
+        surf.blits(islice(self.items, n), False)
+        left, top, right, bottom = self._bounds
+        size = self._size
+        return pygame.Rect(int(left), int(top), int(right - left) + size, int(bottom - top) + size)
+
+
+# -------------------------
+# Hazır Efektler
+# -------------------------
+def burst_correct(pool, x, y, scale=1.0):
+    """Doğru cevap: Yüzeyde parıltı patlaması, sıçrayan damlalar ve yükselen kabarcıklar."""
+    pool.emit(SPARKLE, x, y, int(40 * scale), speed=(1.0, 4.0))
+    pool.emit(SPLASH, x, y, int(30 * scale), speed=(2.0, 5.0), angle=(math.pi * 1.15, math.pi * 1.85))
+    pool.emit(BUBBLE, x, y + 40, int(20 * scale), speed=(0.2, 1.0), angle=(math.pi * 1.3, math.pi * 1.7),
+              spread=20.0)
+
+
+def burst_wrong(pool, x, y, scale=1.0):
+    """Yanlış cevap: Sadece küçük bir su sıçraması."""
+    pool.emit(SPLASH, x, y, int(15 * scale), speed=(1.0, 3.0), angle=(math.pi * 1.2, math.pi * 1.8))
+
+
+def burst_catch(pool, x, y, scale=1.0):
+    """Balık yakalandı: Birkaç kabarcık."""
+    pool.emit(BUBBLE, x, y, int(8 * scale), speed=(0.2, 0.8), angle=(math.pi * 1.25, math.pi * 1.75), spread=8.0)
@@ -0,0 +1,112 @@
+import csv
+import json
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """Kare içindeki aşamaların sürelerini ölçen hafif profil aracı.
+
+    Her kare `begin_frame()` ile başlar; her aşamanın sonunda `mark(ad)`
+    çağrılır ve bir önceki işaretten beri geçen süre o aşamaya yazılır.
+    Son `window` karenin süreleri tutulur; p50/p95/p99 ve kaçırılan kare
+    sayısı bu pencereden hesaplanır. `budget` kare bütçesidir (saniye);
+    bunun 1.5 katını aşan kare kaçırılmış sayılır. `record=True` ise dışa
+    aktarım için kare kare kayıt tutulur; bellek sınırlı kalsın diye sadece
+    son `record_limit` kare saklanır.
+    """
+
+    def __init__(self, budget=1.0 / 60.0, window=600, enabled=True, record=False, record_limit=36000):
+        self.budget = budget
+        self.window = window
+        self.enabled = enabled
+        self.record = record
+        self.phases = {}
+        self.frame_times = deque(maxlen=window)
+        self.frames = 0
+        self.missed_frames = 0
+        self._frame_start = None
+        self._last_mark = None
+        self._current = {}
+        self._log = deque(maxlen=record_limit)  # Dışa aktarım için kare kare kayıt (sadece record=True ise)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            # Önceki karenin toplam süresi (bekleme dahil) bu ana kadardır
+            self._end_frame(now)
+        self._frame_start = now
+        self._last_mark = now
+        self._current = {}
+
+    def mark(self, phase):
+        """Son işaretten bu yana geçen süreyi `phase` aşamasına ekler."""
+        if not self.enabled or self._last_mark is None:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last_mark)
+        self._last_mark = now
+
+    def _end_frame(self, now):
+        total = now - self._frame_start
+        self.frames += 1
+        self.frame_times.append(total)
+        if total > self.budget * 1.5:
+            self.missed_frames += 1
+        for phase, seconds in self._current.items():
+            samples = self.phases.get(phase)
+            if samples is None:
+                samples = self.phases[phase] = deque(maxlen=self.window)
+            samples.append(seconds)
+        if self.record:
+            row = dict(self._current)
+            row["frame"] = total
+            self._log.append(row)
+
+    @staticmethod
+    def percentiles(samples, points=(50, 95, 99)):
+        """Örneklerin milisaniye cinsinden yüzdeliklerini döndürür."""
+        if not samples:
+            return tuple(0.0 for _ in points)
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(round(p / 100.0 * last)))] * 1000.0 for p in points)
+
+    def report(self):
+        """{aşama: (p50, p95, p99)} sözlüğü döndürür; "frame" toplam kare süresidir."""
+        result = {phase: self.percentiles(samples) for phase, samples in self.phases.items()}
+        result["frame"] = self.percentiles(self.frame_times)
+        return result
+
+    def overlay_lines(self):
+        """Ekran üstü panel için metin satırları."""
+        lines = [f"kare {self.frames}  kaçırılan {self.missed_frames}"]
+        for phase, (p50, p95, p99) in self.report().items():
+            lines.append(f"{phase:<9} {p50:5.2f} {p95:5.2f} {p99:5.2f} ms")
+        return lines
+
+    def dump(self, path):
+        """Ölçümleri .csv uzantısında kare kare, diğer uzantılarda JSON özet + kayıt olarak yazar.
+
+        Kare kare kayıt son `record_limit` kareyi içerir; özet tüm oturumu kapsar.
+        """
+        if path.endswith(".csv"):
+            columns = ["frame"] + sorted(self.phases)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                for row in self._log:
+                    writer.writerow({k: f"{row.get(k, 0.0) * 1000.0:.3f}" for k in columns})
+        else:
+            data = {
+                "frames": self.frames,
+                "missed_frames": self.missed_frames,
+                "budget_ms": self.budget * 1000.0,
+                "recorded_frames": len(self._log),
+                "percentiles_ms": {k: dict(zip(("p50", "p95", "p99"), v)) for k, v in self.report().items()},
+                "frames_ms": [{k: v * 1000.0 for k, v in row.items()} for row in self._log],
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
@@ -0,0 +1,351 @@
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from collections.abc import Sequence
+
+# -------------------------
+# Soru Dosyası Biçimi
+# -------------------------
+# Her satır: SORU:...|CEVAP:...|YANCILAR:a,b,c
+# İsteğe bağlı ek alanlar: |KATEGORI:matematik|ZORLUK:2
+# Tanınmayan ek alanlar ve geçersiz ZORLUK değerleri (eski dosyalarla uyum için) yok sayılır.
+DEFAULT_CATEGORY = "genel"
+DEFAULT_DIFFICULTY = 1
+
+DEFAULT_QUESTIONS = [
+    {"question": "Yedek Soru: 1 + 1 kaç eder?", "answer": "2", "distractors": ["3", "4", "5", "6"]},
+    {"question": "Yedek Soru: Pygame ne dilidir?", "answer": "Python",
+     "distractors": ["C++", "Java", "Ruby", "C#"]},
+]
+
+# -------------------------
+# Derlenmiş Önbellek Biçimi (<kaynak>.qbc)
+# -------------------------
+# Başlık | kayıt ofsetleri (Q x adet+1) | kategori no (H x adet) | zorluk (b x adet)
+# | kategoriye göre sıralı kayıt noları (I x adet) | zorluğa göre sıralı kayıt noları (I x adet)
+# | kategori tablosu | zorluk tablosu | kayıt verisi
+# Kayıt: soru \x1e cevap \x1e çeldirici \x1f çeldirici ... (UTF-8)
+MAGIC = b"QBNK"
+VERSION = 2  # 2: Eski ayrıştırıcının kabul ettiği satırlar yeniden derlensin diye
+_HEADER = struct.Struct("<4sHHqqIII")  # magic, sürüm, boş, kaynak mtime_ns, kaynak boyu, adet, kat. adedi, zorluk adedi
+_GROUP = struct.Struct("<iII")  # anahtar (kategori no / zorluk), başlangıç, uzunluk
+FIELD_SEP = "\x1e"
+LIST_SEP = "\x1f"
+
+
+class QuestionError(ValueError):
+    """Soru dosyasındaki hatalı bir satır."""
+
+    def __init__(self, line_no, message):
+        super().__init__(f"satır {line_no}: {message}")
+        self.line_no = line_no
+        self.message = message
+
+
+def parse_line(line, line_no):
+    """Bir soru satırını (soru, cevap, çeldiriciler, kategori, zorluk) olarak ayrıştırır.
+
+    Soru veya cevabı olmayan satırda QuestionError fırlatır. Çeldirici listesi
+    boş olabilir (balıklara başka soruların cevapları dağıtılır).
+    """
+    parts = line.split('|')
+    if len(parts) < 3:
+        raise QuestionError(line_no, "en az üç alan (SORU|CEVAP|YANCILAR) gerekli")
+
+    question_text = parts[0].replace("SORU:", "").strip()
+    answer_text = parts[1].replace("CEVAP:", "").strip()
+    distractors_text = parts[2].replace("YANCILAR:", "").strip()
+    distractors_list = [d.strip() for d in distractors_text.split(',') if d.strip()]
+    if not question_text:
+        raise QuestionError(line_no, "soru metni boş")
+    if not answer_text:
+        raise QuestionError(line_no, "cevap boş")
+
+    category = DEFAULT_CATEGORY
+    difficulty = DEFAULT_DIFFICULTY
+    for extra in parts[3:]:
+        key, _, value = extra.partition(':')
+        key = key.strip().upper()
+        value = value.strip()
+        if key == "KATEGORI" and value:
+            category = value
+        elif key == "ZORLUK":
+            try:
+                difficulty = int(value)
+            except ValueError:
+                pass
+
+    for text in [question_text, answer_text] + distractors_list:
+        if FIELD_SEP in text or LIST_SEP in text:
+            raise QuestionError(line_no, "metin kontrol karakteri içeriyor")
+    return question_text, answer_text, distractors_list, category, difficulty
+
+
+def iter_records(f, errors):
+    """Dosyayı satır satır okur; geçerli kayıtları üretir, hataları `errors` listesine ekler."""
+    for line_no, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield parse_line(line, line_no)
+        except QuestionError as e:
+            errors.append(e)
+
+
+def _grouped(keys):
+    """Anahtar dizisini (kayıt no listesi, [(anahtar, başlangıç, uzunluk)]) olarak gruplar."""
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    groups = []
+    for pos, idx in enumerate(order):
+        key = keys[idx]
+        if groups and groups[-1][0] == key:
+            groups[-1][2] += 1
+        else:
+            groups.append([key, pos, 1])
+    return array('I', order), groups
+
+
+def compile_records(records, out, source_mtime_ns=0, source_size=0):
+    """Kayıtları derlenmiş önbellek biçiminde `out` dosyasına yazar; kayıt adedini döndürür.
+
+    Kayıt verisi geçici bir dosyaya akıtılır; bellekte sadece ofset ve
+    indeks dizileri tutulur.
+    """
+    offsets = array('Q', [0])
+    category_ids = array('H')
+    difficulties = array('b')
+    category_names = {}
+    with tempfile.TemporaryFile() as blob:
+        position = 0
+        for question, answer, distractors, category, difficulty in records:
+            data = FIELD_SEP.join((question, answer, LIST_SEP.join(distractors))).encode("utf-8")
+            blob.write(data)
+            position += len(data)
+            offsets.append(position)
+            category_ids.append(category_names.setdefault(category, len(category_names)))
+            difficulties.append(max(-128, min(127, difficulty)))
+
+        count = len(category_ids)
+        by_category, category_groups = _grouped(category_ids)
+        by_difficulty, difficulty_groups = _grouped(difficulties)
+        out.write(_HEADER.pack(MAGIC, VERSION, 0, source_mtime_ns, source_size, count,
+                               len(category_groups), len(difficulty_groups)))
+        for table in (offsets, category_ids, difficulties, by_category, by_difficulty):
+            out.write(table.tobytes())
+        names = {cid: name for name, cid in category_names.items()}
+        for cid, start, length in category_groups:
+            encoded = names[cid].encode("utf-8")
+            out.write(_GROUP.pack(cid, start, length) + struct.pack("<H", len(encoded)) + encoded)
+        for level, start, length in difficulty_groups:
+            out.write(_GROUP.pack(level, start, length))
+        blob.seek(0)
+        shutil.copyfileobj(blob, out)
+    return count
+
+
+class QuestionBank(Sequence):
+    """Derlenmiş önbellek üzerinde (mmap veya bayt dizisi) çalışan soru bankası.
+
+    Sorular ancak istendiklerinde çözülür; `bank[i]` eski QUESTION_DATA
+    elemanlarıyla aynı biçimde bir sözlük döndürür. Başlangıç maliyeti ve
+    bellek kullanımı soru sayısıyla birlikte büyümez.
+    """
+
+    def __init__(self, buffer, errors=(), path=None):
+        self._buffer = buffer
+        self.errors = list(errors)
+        self.path = path
+        view = memoryview(buffer)
+        (magic, version, _, self.source_mtime_ns, self.source_size, count,
+         n_categories, n_difficulties) = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("geçersiz soru bankası önbelleği")
+        self._count = count
+        pos = _HEADER.size
+        self._offsets = view[pos:pos + 8 * (count + 1)].cast('Q')
+        pos += 8 * (count + 1)
+        self._category_ids = view[pos:pos + 2 * count].cast('H')
+        pos += 2 * count
+        self._difficulties = view[pos:pos + count].cast('b')
+        pos += count
+        self._by_category = view[pos:pos + 4 * count].cast('I')
+        pos += 4 * count
+        self._by_difficulty = view[pos:pos + 4 * count].cast('I')
+        pos += 4 * count
+        self._categories = {}
+        self._category_names = {}
+        for _ in range(n_categories):
+            cid, start, length = _GROUP.unpack_from(view, pos)
+            (name_len,) = struct.unpack_from("<H", view, pos + _GROUP.size)
+            pos += _GROUP.size + 2
+            name = bytes(view[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            self._categories[name] = (start, length)
+            self._category_names[cid] = name
+        self._difficulty_groups = {}
+        for _ in range(n_difficulties):
+            level, start, length = _GROUP.unpack_from(view, pos)
+            pos += _GROUP.size
+            self._difficulty_groups[level] = (start, length)
+        self._data = view[pos:]
+
+    @classmethod
+    def from_records(cls, records, errors=()):
+        """Kayıtlardan bellek içi (önbelleksiz) bir banka kurar."""
+        with tempfile.TemporaryFile() as f:
+            compile_records(records, f)
+            f.seek(0)
+            return cls(f.read(), errors)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("soru numarası aralık dışında")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        question, answer, distractors = bytes(self._data[start:end]).decode("utf-8").split(FIELD_SEP)
+        return {
+            "question": question,
+            "answer": answer,
+            "distractors": distractors.split(LIST_SEP) if distractors else [],
+            "category": self._category_names[self._category_ids[index]],
+            "difficulty": self._difficulties[index],
+        }
+
+    def categories(self):
+        return sorted(self._categories)
+
+    def difficulties(self):
+        return sorted(self._difficulty_groups)
+
+    def indices(self, category=None, difficulty=None):
+        """Kategori ve/veya zorluğa uyan kayıt numaraları.
+
+        Dönen dizi bir kopyadır; çağıran onu tutarken de banka kapatılabilir.
+        """
+        selected = self._indices(category, difficulty)
+        return selected if isinstance(selected, (range, list)) else array('I', selected)
+
+    def _indices(self, category, difficulty):
+        """indices() ile aynı, ancak mmap üzerinde kopyasız görünüm döndürebilir (sadece sınıf içinde kullanılır)."""
+        if category is None and difficulty is None:
+            return range(self._count)
+        if category is not None:
+            start, length = self._categories.get(category, (0, 0))
+            selected = self._by_category[start:start + length]
+            if difficulty is None:
+                return selected
+            return [i for i in selected if self._difficulties[i] == difficulty]
+        start, length = self._difficulty_groups.get(difficulty, (0, 0))
+        return self._by_difficulty[start:start + length]
+
+    def sample(self, rng, category=None, difficulty=None):
+        """Filtreye uyan rastgele bir soru döndürür (tüm bankayı çözmeden); yoksa None."""
+        candidates = self._indices(category, difficulty)
+        try:
+            if not len(candidates):
+                return None
+            return self[candidates[rng.randrange(len(candidates))]]
+        finally:
+            if isinstance(candidates, memoryview):
+                candidates.release()
+
+    def close(self):
+        """mmap'i serbest bırakır (önbellek dosyası yeniden yazılmadan önce gereklidir)."""
+        for view in (self._offsets, self._category_ids, self._difficulties, self._by_category,
+                     self._by_difficulty, self._data):
+            view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def cache_path_for(path):
+    return path + ".qbc"
+
+
+def _open_cache(cache_path, stat):
+    """Kaynakla eşleşen önbelleği mmap ile açar; yoksa veya eskiyse None döner."""
+    try:
+        with open(cache_path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            magic, version, _, mtime_ns, size, *_rest = _HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                return None
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    return QuestionBank(mm, path=cache_path)
+
+
+def load_question_bank(path="questions.txt"):
+    """Soru bankasını yükler; derlenmiş önbellek güncelse doğrudan mmap ile açar.
+
+    Önbellek yoksa kaynak dosya akış halinde okunup doğrulanır ve önbellek
+    yazılır. Hatalı satırlar derleme sırasında satır numaralarıyla
+    `bank.errors` içinde raporlanır (önbellekten açılışta dosya değişmediği
+    için liste boştur). Geçerli soru yoksa yedek sorular kullanılır.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return QuestionBank.from_records(_default_records())
+
+    cache_path = cache_path_for(path)
+    bank = _open_cache(cache_path, stat)
+    if bank is not None:
+        return bank
+
+    errors = []
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(path, 'r', encoding='utf-8') as src, open(tmp_path, "wb") as out:
+            count = compile_records(iter_records(src, errors), out, stat.st_mtime_ns, stat.st_size)
+        os.replace(tmp_path, cache_path)
+    except UnicodeDecodeError as e:
+        errors.append(QuestionError(0, f"dosya UTF-8 değil: {e}"))
+        _remove_quietly(tmp_path)
+        count = 0
+    except OSError:
+        # Önbellek yazılamıyor (salt okunur disk; Windows'ta eski önbellek başka bir bankada
+        # mmap ile açıkken os.replace başarısız olur): Yarım dosyayı sil ve bellekte derle
+        _remove_quietly(tmp_path)
+        errors.clear()
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as src:
+                bank = QuestionBank.from_records(iter_records(src, errors), errors)
+        except OSError as e:
+            # Dosya görünüyor ama okunamıyor (izin yok vb.): Yedek sorulara düş
+            errors.append(QuestionError(0, f"dosya okunamadı: {e}"))
+            return QuestionBank.from_records(_default_records(), errors)
+        return bank if len(bank) else QuestionBank.from_records(_default_records(), errors)
+
+    if not count:
+        return QuestionBank.from_records(_default_records(), errors)
+    bank = _open_cache(cache_path, stat)
+    if bank is None:
+        return QuestionBank.from_records(_default_records(), errors)
+    bank.errors = errors
+    return bank
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _default_records():
+    for q in DEFAULT_QUESTIONS:
+        yield q["question"], q["answer"], q["distractors"], DEFAULT_CATEGORY, DEFAULT_DIFFICULTY
@@ -0,0 +1,109 @@
+import math
+
+import pygame
+
+
+def parse_size(text):
+    """"1920x1080" biçimindeki boyutu (1920, 1080) ikilisine çevirir."""
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+class RenderScale:
+    """Oyun dünyasını (game_logic.WIDTH x HEIGHT) ekran dışı bir tuvale çizip ekrana tek blit ile veren görünüm.
+
+    Oyun kuralları her zaman dünya koordinatlarında çalışır; çizim kodu
+    konumları `scale` ile tuval pikseline çevirir. Tuval, dünyanın en-boy
+    oranını korur ve ekrana ortalanarak (gerekirse kenar boşluklarıyla) sığdırılır:
+
+    - render_scale < 1: Tuval ekrandaki alandan küçüktür, çizim ucuzlar ve
+      tuval her karede tek bir `transform.scale` ile büyütülür.
+    - integer=True: Çizim ölçeği istenen değere eşit veya ondan küçük ilk
+      1/n adımına yuvarlanır (örn. 0.75 → 1/2, 0.3 → 1/4), tuval n kat
+      büyütülür; pikseller bulanıklaşmadan eşit büyür ve kirli
+      dikdörtgenlerle çizimde sadece değişen bölgeler büyütülür. Uygulanan
+      ölçek `render_scale` içindedir ve `summary()` ile yazdırılır.
+    - Tuval ekrandaki alanla aynı boydaysa ekranın alt yüzeyine doğrudan
+      çizilir, ek kopya yapılmaz (varsayılan ayar).
+    """
+
+    def __init__(self, display_size, world_size, render_scale=1.0, integer=False):
+        if render_scale <= 0:
+            raise ValueError(f"çizim ölçeği pozitif olmalı: {render_scale}")
+        dw, dh = display_size
+        ww, wh = world_size
+        fit = min(dw / ww, dh / wh)
+        self.requested_scale = render_scale
+        if integer:
+            # Küçük kayan nokta hataları (örn. 1/0.2 = 5.000000001) fazladan bir adım atlatmasın
+            self.factor = max(1, math.ceil(1.0 / render_scale - 1e-9))
+            self.render_scale = 1.0 / self.factor
+            self.scale = fit / self.factor
+            self.canvas_size = (int(ww * self.scale), int(wh * self.scale))
+            present_size = (self.canvas_size[0] * self.factor, self.canvas_size[1] * self.factor)
+        else:
+            self.factor = None
+            self.render_scale = render_scale
+            self.scale = fit * render_scale
+            self.canvas_size = (max(1, round(ww * self.scale)), max(1, round(wh * self.scale)))
+            present_size = (round(ww * fit), round(wh * fit))
+        self.display_size = display_size
+        self.dest = pygame.Rect((0, 0), present_size)
+        self.dest.center = (dw // 2, dh // 2)
+        self.direct = present_size == self.canvas_size
+        self._screen = None
+        self._target = None
+
+    def px(self, value):
+        """Dünya uzunluğunu tuval pikseline çevirir (en az 1)."""
+        return max(1, int(value * self.scale))
+
+    def point(self, x, y):
+        s = self.scale
+        return int(x * s), int(y * s)
+
+    def size(self, size):
+        return self.px(size[0]), self.px(size[1])
+
+    def canvas_for(self, screen):
+        """Çizimin yapılacağı yüzey: Doğrudan modda ekranın alt yüzeyi, değilse ayrı bir tuval."""
+        self._screen = screen
+        screen.fill((0, 0, 0))  # Kenar boşlukları
+        self._target = screen.subsurface(self.dest)
+        if self.direct:
+            return screen if self.dest.size == screen.get_size() else self._target
+        return pygame.Surface(self.canvas_size).convert()
+
+    def present(self, canvas, rects=None):
+        """Tuvali ekrana verir; `rects` (tuval koordinatlarında) verilirse doğrudan modda sadece o bölgeler yenilenir."""
+        if not self.direct:
+            if rects is None or not self.factor:
+                pygame.transform.scale(canvas, self.dest.size, self._target)
+                pygame.display.update(self.dest)
+                return
+            # Tamsayı büyütmede tuval pikselleri ekrana birebir eşlenir: Sadece değişen bölgeler büyütülür
+            f = self.factor
+            bounds = canvas.get_rect()
+            updated = []
+            for rect in rects:
+                rect = rect.clip(bounds)
+                if not rect:
+                    continue
+                target = pygame.Rect(rect.x * f, rect.y * f, rect.width * f, rect.height * f)
+                pygame.transform.scale(canvas.subsurface(rect), target.size, self._target.subsurface(target))
+                updated.append(target.move(self.dest.topleft))
+            pygame.display.update(updated)
+        elif rects is None:
+            pygame.display.update(self.dest)
+        elif self.dest.topleft == (0, 0):
+            pygame.display.update(rects)
+        else:
+            pygame.display.update([r.move(self.dest.topleft) for r in rects])
+
+    def summary(self):
+        mode = "doğrudan" if self.direct else (f"{self.factor}x tamsayı" if self.factor else "ölçekli")
+        scale = f"ölçek {self.render_scale:.3g}"
+        if self.render_scale != self.requested_scale:
+            scale += f", istenen {self.requested_scale:.3g}"
+        return (f"çizim {self.canvas_size[0]}x{self.canvas_size[1]} → ekran {self.dest.width}x{self.dest.height} "
+                f"({mode}, {scale})")
@@ -0,0 +1,132 @@
+from array import array
+
+# -------------------------
+# Leitner Kutuları
+# -------------------------
+# Her soru bir kutudadır; yanlış cevapta ilk kutuya döner, doğru cevapta bir
+# sonraki kutuya geçer. Bir kutudaki her sorunun seçilme ağırlığı o kutunun
+# ağırlığıdır: İlk kutudaki (zorlanılan) sorular daha sık gelir.
+BOX_WEIGHTS = (16, 8, 4, 2, 1)
+
+
+class QuestionScheduler:
+    """Soru numaralarını tekrarsız destelerden, Leitner ağırlıklarıyla seçen zamanlayıcı.
+
+    Her kutu kendi üyelerini bir dizide tutar; dizinin başı bu turda henüz
+    çekilmemiş sorular, sonu çekilmiş sorulardır. Çekiliş kutu içinde rastgele
+    bir elemanı çekilmemiş bölümün sonuyla takas eder (adım adım
+    Fisher-Yates); kutudaki tüm sorular çekilince yeni tur başlar. Kutular
+    arası taşıma takasla yapılır. Kutu sayısı sabit olduğundan `next()` ve
+    `record()` soru sayısından bağımsız O(1) sürer.
+    """
+
+    def __init__(self, count, rng, weights=BOX_WEIGHTS):
+        self.rng = rng
+        self.count = count
+        self.weights = weights
+        self.box = array('b', bytes(count))
+        self.position = array('I', range(count))  # Sorunun kendi kutu dizisindeki yeri
+        self.members = [array('I', range(count))] + [array('I') for _ in weights[1:]]
+        self.undrawn = [count] + [0] * (len(weights) - 1)
+        self.correct = array('I', bytes(4 * count))
+        self.wrong = array('I', bytes(4 * count))
+        self.last = None
+
+    def _swap(self, members, a, b):
+        qa, qb = members[a], members[b]
+        members[a], members[b] = qb, qa
+        self.position[qa] = b
+        self.position[qb] = a
+
+    def next(self):
+        """Sıradaki soru numarasını döndürür; soru yoksa None.
+
+        Tur sınırında aynı soru art arda gelebileceği için birkaç kez yeniden
+        çekilir.
+        """
+        if not self.count:
+            return None
+        for _ in range(4):
+            q = self._draw()
+            if q != self.last:
+                break
+        self.last = q
+        return q
+
+    def _draw(self):
+        members = self.members
+        total = 0
+        for b, weight in enumerate(self.weights):
+            total += weight * len(members[b])
+        pick = self.rng.randrange(total)
+        for b, weight in enumerate(self.weights):
+            pick -= weight * len(members[b])
+            if pick < 0:
+                break
+        box_members = members[b]
+        if not self.undrawn[b]:
+            self.undrawn[b] = len(box_members)  # Kutunun destesi bitti: Yeni tur
+        last = self.undrawn[b] - 1
+        self._swap(box_members, self.rng.randrange(last + 1), last)
+        self.undrawn[b] = last
+        return box_members[last]
+
+    def _move(self, q, new_box):
+        old_box = self.box[q]
+        if old_box == new_box:
+            return
+        members = self.members[old_box]
+        pos = self.position[q]
+        if pos < self.undrawn[old_box]:
+            # Çekilmemiş bölümün sınırını koru
+            self.undrawn[old_box] -= 1
+            self._swap(members, pos, self.undrawn[old_box])
+            pos = self.undrawn[old_box]
+        self._swap(members, pos, len(members) - 1)
+        members.pop()
+        # Yeni kutuya çekilmiş olarak girer: O kutunun bir sonraki turunda gelir
+        target = self.members[new_box]
+        self.position[q] = len(target)
+        target.append(q)
+        self.box[q] = new_box
+
+    def record(self, q, correct):
+        """Puanlama sonucunu kaydeder ve soruyu Leitner kutuları arasında taşır."""
+        if correct:
+            self.correct[q] += 1
+            self._move(q, min(self.box[q] + 1, len(self.weights) - 1))
+        else:
+            self.wrong[q] += 1
+            self._move(q, 0)
+
+    def remap(self, matches):
+        """Yeni soru bankası için zamanlayıcı döndürür; `matches[q]` yeni sorunun eski numarası veya -1.
+
+        Eşleşen sorular kutularını, bu turda çekilip çekilmediklerini ve
+        sayaçlarını korur; yeni veya değişmiş sorular ilk kutuya çekilmemiş olarak girer.
+        """
+        count = len(matches)
+        new = QuestionScheduler(count, self.rng, self.weights)
+        undrawn = [[] for _ in self.weights]
+        drawn = [[] for _ in self.weights]
+        for q, old in enumerate(matches):
+            if old < 0:
+                undrawn[0].append(q)
+                continue
+            b = self.box[old]
+            new.box[q] = b
+            new.correct[q] = self.correct[old]
+            new.wrong[q] = self.wrong[old]
+            (undrawn if self.position[old] < self.undrawn[b] else drawn)[b].append(q)
+            if old == self.last:
+                new.last = q
+        for b in range(len(self.weights)):
+            members = array('I', undrawn[b] + drawn[b])
+            new.members[b] = members
+            new.undrawn[b] = len(undrawn[b])
+            for pos, q in enumerate(members):
+                new.position[q] = pos
+        return new
+
+    def box_sizes(self):
+        return [len(members) for members in self.members]
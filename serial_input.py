@@ -0,0 +1,292 @@
+import binascii
+import struct
+import threading
+import time
+from collections import namedtuple
+
+# -------------------------
+# Kontrol Durumu Anlık Görüntüsü
+# -------------------------
+# detents_total: Başlangıçtan beri biriken KY-040 adımlarının toplamı (+ yukarı, - aşağı)
+# pot: Son potansiyometre değeri (0-1023), hiç okunmadıysa -1
+# pot_time / sample_time: Son potansiyometre / son örneğin alındığı an (perf_counter)
+# seq: Her yeni örnekte bir artan sayaç
+ControlSnapshot = namedtuple("ControlSnapshot", "detents_total pot pot_time sample_time seq")
+
+EMPTY_SNAPSHOT = ControlSnapshot(0, -1, 0.0, 0.0, 0)
+
+
+def parse_ascii_line(line):
+    """"D1,P512" biçimindeki satırı (detent, pot) ikilisine çevirir.
+
+    Satırda bulunmayan alan None döner; bozuk alan veya hiç D/P alanı
+    olmayan satır (konsol olmayan bir seri aygıtın çıktısı) ValueError fırlatır.
+    """
+    detent = None
+    pot = None
+    for part in line.split(','):
+        part = part.strip()
+        if part.startswith('D'):
+            detent = int(part[1:])
+        elif part.startswith('P'):
+            pot = int(part[1:])
+    if detent is None and pot is None:
+        raise ValueError(f"D veya P alanı yok: {line!r}")
+    return detent, pot
+
+
+# -------------------------
+# İkili (Binary) Protokol
+# -------------------------
+# Sabit boyutlu çerçeve (17 bayt):
+#   SYNC(0xA5) | SEQ(u8) | COUNT(u8, 1-4) | 4 x [DETENT(i8), POT(u16 LE)] | CRC16(u16 LE)
+# CRC16-CCITT (binascii.crc_hqx) SEQ'ten son örneğe kadar olan baytları kapsar.
+# Kullanılmayan örnek yuvaları sıfırdır; POT=0xFFFF o örnekte pot okunmadı demektir.
+BINARY_SYNC = 0xA5
+BINARY_MAX_SAMPLES = 4
+BINARY_NO_POT = 0xFFFF
+_SAMPLE = struct.Struct("<bH")
+BINARY_FRAME_SIZE = 3 + BINARY_MAX_SAMPLES * _SAMPLE.size + 2
+
+# Açılış el sıkışması: Oyun "HELLO BIN <baud>" gönderir, ikili protokolü
+# destekleyen konsol "OK BIN <baud>" ile yanıt verir ve iki taraf da hızı değiştirir.
+HANDSHAKE_REQUEST = "HELLO BIN {baud}\n"
+HANDSHAKE_REPLY = "OK BIN {baud}"
+
+
+def encode_binary_frame(seq, samples):
+    """(detent, pot) örneklerini tek bir ikili çerçeveye paketler (konsol tarafı ve testler için)."""
+    if not 1 <= len(samples) <= BINARY_MAX_SAMPLES:
+        raise ValueError("çerçeve başına 1-4 örnek gönderilebilir")
+    body = bytearray((seq & 0xFF, len(samples)))
+    for detent, pot in samples:
+        body += _SAMPLE.pack(detent, BINARY_NO_POT if pot is None else pot)
+    body += bytes(_SAMPLE.size * (BINARY_MAX_SAMPLES - len(samples)))
+    crc = binascii.crc_hqx(bytes(body), 0xFFFF)
+    return bytes((BINARY_SYNC,)) + bytes(body) + struct.pack("<H", crc)
+
+
+class AsciiDecoder:
+    """Eski "D1,P512" satır protokolünü çözer (yedek protokol)."""
+
+    name = "ascii"
+
+    def __init__(self):
+        self._buffer = b""
+        self.frames = 0
+        self.errors = 0
+        self.dropped = 0
+
+    def feed(self, data):
+        """Gelen baytları işler ve çözülen (detent, pot) örneklerini döndürür."""
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        samples = []
+        for raw in lines:
+            try:
+                line = raw.decode('utf-8').strip()
+                if not line:
+                    continue
+                detent, pot = parse_ascii_line(line)
+            except (UnicodeDecodeError, ValueError):
+                self.errors += 1
+                continue
+            self.frames += 1
+            samples.append((detent or 0, pot))
+        return samples
+
+    def summary(self):
+        return f"protokol {self.name}: {self.frames} satır, {self.errors} bozuk"
+
+
+class BinaryDecoder:
+    """Sabit boyutlu, CRC korumalı ikili çerçeveleri çözer.
+
+    Bozuk çerçeveler sessizce yutulmaz: CRC hataları, sıra numarası
+    boşluklarından çıkarılan kayıp çerçeveler ve senkron için atlanan
+    baytlar ayrı sayaçlarda tutulur.
+    """
+
+    name = "binary"
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._last_seq = None
+        self.frames = 0
+        self.errors = 0
+        self.dropped = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data):
+        """Gelen baytları işler ve çözülen (detent, pot) örneklerini döndürür."""
+        buf = self._buffer
+        buf += data
+        samples = []
+        while True:
+            start = buf.find(BINARY_SYNC)
+            if start < 0:
+                self.skipped_bytes += len(buf)
+                buf.clear()
+                break
+            if start:
+                self.skipped_bytes += start
+                del buf[:start]
+            if len(buf) < BINARY_FRAME_SIZE:
+                break
+            frame = bytes(buf[:BINARY_FRAME_SIZE])
+            (crc,) = struct.unpack_from("<H", frame, BINARY_FRAME_SIZE - 2)
+            if binascii.crc_hqx(frame[1:-2], 0xFFFF) != crc or not 1 <= frame[2] <= BINARY_MAX_SAMPLES:
+                # Yanlış senkron veya bozuk çerçeve: Bir bayt kaydırıp yeniden dene
+                self.errors += 1
+                self.skipped_bytes += 1
+                del buf[:1]
+                continue
+            del buf[:BINARY_FRAME_SIZE]
+            seq = frame[1]
+            if self._last_seq is not None:
+                self.dropped += (seq - self._last_seq - 1) & 0xFF
+            self._last_seq = seq
+            self.frames += 1
+            for i in range(frame[2]):
+                detent, pot = _SAMPLE.unpack_from(frame, 3 + i * _SAMPLE.size)
+                samples.append((detent, None if pot == BINARY_NO_POT else pot))
+        return samples
+
+    def summary(self):
+        return (f"protokol {self.name}: {self.frames} çerçeve, {self.errors} CRC hatası, "
+                f"{self.dropped} kayıp, {self.skipped_bytes} atlanan bayt")
+
+
+def negotiate_protocol(ser, binary_baud, timeout=0.3):
+    """Konsolla ikili protokolü müzakere eder ve uygun çözücüyü döndürür.
+
+    Konsol belirtilen sürede yanıt vermezse (eski yazılım) ASCII protokolünde kalınır.
+    """
+    try:
+        ser.reset_input_buffer()
+        ser.write(HANDSHAKE_REQUEST.format(baud=binary_baud).encode('ascii'))
+        ser.flush()
+        expected = HANDSHAKE_REPLY.format(baud=binary_baud)
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            line = ser.readline().decode('ascii', errors='ignore').strip()
+            if line == expected:
+                if binary_baud != ser.baudrate:
+                    ser.baudrate = binary_baud
+                return BinaryDecoder()
+    except Exception:
+        pass
+    return AsciiDecoder()
+
+
+class LatencyStats:
+    """Girdi örneğinin alınmasından ekrana yansımasına kadar geçen süreyi izler."""
+
+    def __init__(self, smoothing=0.1):
+        self.smoothing = smoothing
+        self.count = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000.0
+        self.last_ms = ms
+        self.max_ms = max(self.max_ms, ms)
+        if self.count == 0:
+            self.avg_ms = ms
+        else:
+            self.avg_ms += (ms - self.avg_ms) * self.smoothing
+        self.count += 1
+
+    def summary(self):
+        return f"girdi→ekran gecikmesi: son {self.last_ms:.1f} ms, ort {self.avg_ms:.1f} ms, maks {self.max_ms:.1f} ms"
+
+
+class SerialReader:
+    """Seri portu arka planda sürekli okuyan ve son durumu yayınlayan iş parçacığı.
+
+    Okuyucu gelen baytları protokol çözücüsüne verir, KY-040 adımlarını biriktirir ve yeni bir
+    ControlSnapshot nesnesini tek bir atama ile yayınlar. Oyun döngüsü kilit
+    kullanmadan sadece `snapshot` özniteliğini okur. Port okunamaz hale gelirse
+    (kablo çıkarıldı) iş parçacığı sonlanır ve hata `error` özniteliğine yazılır.
+    """
+
+    def __init__(self, ser, decoder=None, latency=None):
+        self.ser = ser
+        self.decoder = decoder or AsciiDecoder()
+        self.snapshot = EMPTY_SNAPSHOT
+        self.latency = latency or LatencyStats()
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="SerialReader", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=0.5):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                chunk = self.ser.read(self.ser.in_waiting or 1)
+            except Exception as e:
+                # Port kapandı veya bağlantı koptu
+                if not self._stop.is_set():
+                    self.error = e
+                break
+            if chunk:
+                samples = self.decoder.feed(chunk)
+                if samples:
+                    self.publish(samples)
+
+    def publish(self, samples):
+        """Bir grup (detent, pot) örneğini mevcut durumla birleştirip tek seferde yayınlar."""
+        now = time.perf_counter()
+        prev = self.snapshot
+        detents_total, pot, pot_time = prev.detents_total, prev.pot, prev.pot_time
+        for detent, sample_pot in samples:
+            detents_total += detent
+            if sample_pot is not None:
+                pot, pot_time = sample_pot, now
+        self.snapshot = ControlSnapshot(detents_total, pot, pot_time, now, prev.seq + len(samples))
+
+
+class ControlConsumer:
+    """Oyun döngüsü tarafı: Her karede anlık görüntüden son değişimleri çıkarır."""
+
+    # Bu süreden eski potansiyometre değeri yok sayılır (klavyeye geri dönülür)
+    POT_STALE_AFTER = 0.5
+
+    def __init__(self, reader):
+        self.reader = reader
+        self._last_detents = 0
+        self._last_seq = 0
+        self.pending_sample_time = None
+
+    def poll(self):
+        """(ky040_pull_down, pot_value) döndürür.
+
+        ky040_pull_down son kareden beri biriken net adım sayısıdır
+        (+ yukarı çek, - aşağı sal); pot_value taze değilse -1'dir.
+        """
+        snap = self.reader.snapshot
+        detents = snap.detents_total - self._last_detents
+        self._last_detents = snap.detents_total
+        if snap.seq != self._last_seq:
+            self._last_seq = snap.seq
+            self.pending_sample_time = snap.sample_time
+        pot = snap.pot
+        if pot != -1 and time.perf_counter() - snap.pot_time > self.POT_STALE_AFTER:
+            pot = -1
+        return detents, pot
+
+    def frame_presented(self):
+        """Kare ekrana verildiğinde çağrılır; bekleyen örnek için gecikmeyi kaydeder."""
+        if self.pending_sample_time is not None:
+            self.reader.latency.add(time.perf_counter() - self.pending_sample_time)
+            self.pending_sample_time = None
@@ -0,0 +1,116 @@
+import argparse
+import multiprocessing
+import random
+import time
+
+from game_logic import GameState, ControlInput, NO_INPUT, FISH_SIZE
+from question_bank import load_question_bank
+
+
+# -------------------------
+# Girdi Politikaları
+# -------------------------
+# Her politika (oyun durumu, rng) alır ve o adımın ControlInput'unu döndürür.
+# rng politikaya aittir; oyunun kendi rastgele akışı (game.rng) kullanılmaz ki
+# politika değişince balık dizilimi ve sorular değişmesin.
+
+def idle_policy(game, rng):
+    """Hiçbir tuşa basmaz; kanca sadece kendiliğinden batar."""
+    return NO_INPUT
+
+
+def random_policy(game, rng):
+    """Rastgele tuş basışları üretir."""
+    return ControlInput(rng.random() < 0.1, rng.random() < 0.3, rng.random() < 0.3, rng.random() < 0.3, 0, -1)
+
+
+def seeker_policy(game, rng):
+    """Doğru cevaplı balığa yönelir, yakalayınca yukarı çeker (zorluk ayarı için basit bir oyuncu)."""
+    if game.caught_fish:
+        return ControlInput(True, False, False, False, 0, -1)
+    target = next((f for f in game.fishes if f.is_correct and f.x > 0), None)
+    if target is None:
+        return NO_INPUT
+    hx, hy = game.hook_pos
+    tx = target.x + FISH_SIZE[0] // 2
+    ty = target.y + FISH_SIZE[1] // 2
+    return ControlInput(hy > ty + 20, hy < ty - 20, hx > tx + 20, hx < tx - 20, 0, -1)
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "seeker": seeker_policy,
+}
+
+
+def simulate_session(seed, frames=3600, policy="seeker", questions=None):
+    """Tek bir oyunu görüntüsüz simüle eder ve özet sonucu döndürür."""
+    if questions is None:
+        questions = _process_bank()
+    game = GameState(questions, seed=seed)
+    policy_fn = POLICIES[policy]
+    policy_rng = random.Random(seed)
+    catches = 0
+    for _ in range(frames):
+        for kind, _fish, _player in game.step(policy_fn(game, policy_rng)):
+            if kind == "catch":
+                catches += 1
+    return {
+        "seed": seed,
+        "frames": frames,
+        "score": game.score,
+        "correct": game.correct_count,
+        "wrong": game.wrong_count,
+        "catches": catches,
+    }
+
+
+_BANK = None
+
+
+def _process_bank():
+    """Süreç başına bir kez açılan soru bankası (mmap süreçler arası aktarılamaz)."""
+    global _BANK
+    if _BANK is None:
+        _BANK = load_question_bank()
+    return _BANK
+
+
+def _simulate_args(args):
+    return simulate_session(*args)
+
+
+def simulate_many(games, frames=3600, policy="seeker", workers=None, base_seed=0):
+    """Birçok oyunu bir süreç havuzunda paralel simüle eder."""
+    _process_bank()  # Önbelleği işçiler başlamadan derle
+    jobs = [(base_seed + i, frames, policy) for i in range(games)]
+    if workers == 1:
+        return [simulate_session(*job) for job in jobs]
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(_simulate_args, jobs, chunksize=max(1, games // 64))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balık tutma oyununu görüntüsüz, toplu olarak simüle eder.")
+    parser.add_argument("--games", type=int, default=1000, help="simüle edilecek oyun sayısı")
+    parser.add_argument("--frames", type=int, default=3600, help="oyun başına adım sayısı (60 adım = 1 sn)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="seeker")
+    parser.add_argument("--workers", type=int, default=None, help="süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--seed", type=int, default=0, help="ilk oyunun tohumu")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = simulate_many(args.games, args.frames, args.policy, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+
+    n = len(results)
+    avg = lambda key: sum(r[key] for r in results) / n
+    print(f"{n} oyun, {elapsed:.2f} sn ({n / elapsed:.1f} oyun/sn, "
+          f"gerçek zamandan {n * args.frames / 60.0 / elapsed:.0f}x hızlı)")
+    print(f"ortalama skor {avg('score'):.2f}, doğru {avg('correct'):.2f}, "
+          f"yanlış {avg('wrong'):.2f}, yakalama {avg('catches'):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class StartupLoader:
+    """Açılıştaki yavaş işleri (konsol bağlantısı, görseller, soru bankası) aynı anda arka planda çalıştırır.
+
+    Ana iş parçacığı menüyü çizerken her karede `poll()` ile biten işleri
+    alır ve sonuçlarını kendisi yerine koyar (örn. yüzeylerin convert
+    edilmesi). İşlerin süreleri `timings` sözlüğünde saniye olarak tutulur.
+    """
+
+    def __init__(self):
+        self._tasks = []
+        self._futures = {}
+        self._executor = None
+        self.timings = {}
+        self.started_at = None
+
+    def add(self, name, fn):
+        self._tasks.append((name, fn))
+        return self
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=len(self._tasks), thread_name_prefix="Startup")
+        for name, fn in self._tasks:
+            self._futures[name] = self._executor.submit(self._timed, name, fn)
+        self._executor.shutdown(wait=False)
+        return self
+
+    def _timed(self, name, fn):
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    @property
+    def pending(self):
+        """Henüz bitmemiş ya da sonucu alınmamış işlerin adları (ekleme sırasıyla)."""
+        return [name for name, _fn in self._tasks if name in self._futures]
+
+    @property
+    def done(self):
+        return not self._futures
+
+    def poll(self):
+        """Biten işleri [(ad, sonuç, hata)] olarak döndürür; her iş bir kez döner."""
+        return [self._take(name) for name in self.pending if self._futures[name].done()]
+
+    def wait(self):
+        """Kalan işlerin bitmesini bekler ve hepsini poll() biçiminde döndürür."""
+        return [self._take(name) for name in self.pending]
+
+    def _take(self, name):
+        future = self._futures.pop(name)
+        error = future.exception()
+        return name, None if error else future.result(), error
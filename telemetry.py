@@ -0,0 +1,132 @@
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+
+# -------------------------
+# Telemetri Olay Biçimi (JSON Lines, sadece sona eklenir)
+# -------------------------
+# Her satır bir olaydır; ortak alanlar "session" (oturum kimliği), "type" ve
+# "frame" (oyun adımı). Türler:
+#   session  : Oturum başlangıcı (zaman, oyuncu sayısı, soru sayısı)
+#   question : Yeni soru gösterildi (question_index, question)
+#   catch    : Bir kanca balık yakaladı (player, question, chosen, correct)
+#   answer   : Balık yüzeye çıkarıldı ve puanlandı (catch ile aynı alanlar +
+#              catch_time / answer_time: sorunun gösterilmesinden yakalamaya /
+#              yüzeye çıkarmaya kadar geçen oyun süresi, saniye)
+# Süreler oyun adımlarından hesaplanır; tekrar oynatmada da aynı çıkar.
+TELEMETRY_VERSION = 1
+
+
+class TelemetryWriter:
+    """Oyun olaylarını arka planda toplu halde JSONL dosyasının sonuna yazan iş parçacığı.
+
+    `emit()` sadece olayı bir kuyruğa koyar; JSON'a çevirme ve diske yazma
+    arka plandaki iş parçacığında, `batch_size` olayda veya `flush_interval`
+    saniyede bir tek `write` çağrısıyla yapılır. Böylece oyun döngüsü disk
+    yüzünden hiç beklemez. Yazma hatası olursa olaylar atılır ve `dropped`
+    sayacı artar; oyun çalışmaya devam eder.
+    """
+
+    def __init__(self, path, session=None, batch_size=256, flush_interval=1.0):
+        self.path = path
+        self.session = session or uuid.uuid4().hex[:12]
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.error = None
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="TelemetryWriter", daemon=True)
+
+    def start(self, **info):
+        """Yazıcıyı başlatır ve oturum başlangıç olayını (ek bilgilerle) kuyruğa koyar."""
+        self._thread.start()
+        self.emit({"type": "session", "frame": 0, "version": TELEMETRY_VERSION, "time": time.time(), **info})
+        return self
+
+    def emit(self, event):
+        """Olay sözlüğünü kuyruğa koyar (oyun döngüsünden çağrılır; sözlük sonra değiştirilmemeli)."""
+        event["session"] = self.session
+        self._queue.put(event)
+
+    __call__ = emit
+
+    def close(self, timeout=2.0):
+        """Kuyrukta kalan olayları yazar ve iş parçacığını durdurur."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            f = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            self.error = e
+            f = None
+        running = True
+        while running:
+            batch = []
+            try:
+                event = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            while event is not None:
+                batch.append(event)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            else:
+                running = False
+            if batch:
+                self._write(f, batch)
+        if f is not None:
+            f.close()
+
+    def _write(self, f, batch):
+        if f is None:
+            self.dropped += len(batch)
+            return
+        try:
+            f.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in batch))
+            f.flush()
+        except (OSError, TypeError, ValueError) as e:
+            self.error = e
+            self.dropped += len(batch)
+            return
+        self.written += len(batch)
+        self.batches += 1
+
+    def summary(self):
+        text = f"{self.written} olay {self.batches} toplu yazımda {self.path} dosyasına yazıldı"
+        if self.dropped:
+            text += f", {self.dropped} olay yazılamadı ({self.error})"
+        return text
+
+
+def iter_events(paths, types=None):
+    """Dosya veya klasörlerdeki (*.jsonl) olayları sırayla döndürür; bozuk satırlar atlanır.
+
+    Oyun yazarken kapanırsa son satır yarım kalabilir; bu yüzden ayrıştırılamayan
+    satırlar hata vermeden geçilir.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".jsonl"))
+        else:
+            files = [path]
+        for file_path in files:
+            with open(file_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if types is None or event.get("type") in types:
+                        yield event
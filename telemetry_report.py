@@ -0,0 +1,75 @@
+import argparse
+from collections import Counter
+
+from telemetry import iter_events
+
+
+class QuestionStats:
+    __slots__ = ("answers", "correct", "catch_time", "wrong_choices")
+
+    def __init__(self):
+        self.answers = 0
+        self.correct = 0
+        self.catch_time = 0.0
+        self.wrong_choices = Counter()
+
+    @property
+    def accuracy(self):
+        return self.correct / self.answers if self.answers else 0.0
+
+
+def question_accuracy(paths):
+    """Telemetri dosyalarındaki "answer" olaylarından soru başına istatistik çıkarır.
+
+    Dosyalar satır satır okunur; bellek kullanımı oturum sayısına değil, farklı
+    soru sayısına bağlıdır. (soru -> QuestionStats, oturum sayısı) döndürür.
+    """
+    stats = {}
+    sessions = set()
+    for event in iter_events(paths, types=("session", "answer")):
+        sessions.add(event.get("session"))
+        if event["type"] != "answer":
+            continue
+        item = stats.get(event["question"])
+        if item is None:
+            item = stats[event["question"]] = QuestionStats()
+        item.answers += 1
+        item.catch_time += event.get("catch_time", 0.0)
+        if event["correct"]:
+            item.correct += 1
+        else:
+            item.wrong_choices[event["chosen"]] += 1
+    return stats, len(sessions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Telemetri kayıtlarından soru başına doğruluk raporu üretir.")
+    parser.add_argument("paths", nargs="*", default=["telemetry.jsonl"],
+                        help="JSONL dosyaları veya *.jsonl içeren klasörler")
+    parser.add_argument("--min-answers", type=int, default=1, help="daha az cevaplanan soruları gösterme")
+    parser.add_argument("--sort", choices=("accuracy", "answers"), default="accuracy",
+                        help="sıralama: en düşük doğruluk veya en çok cevaplanan önce")
+    parser.add_argument("--limit", type=int, default=20, help="gösterilecek soru sayısı (0: hepsi)")
+    args = parser.parse_args()
+
+    stats, sessions = question_accuracy(args.paths)
+    rows = [(question, item) for question, item in stats.items() if item.answers >= args.min_answers]
+    if args.sort == "accuracy":
+        rows.sort(key=lambda row: (row[1].accuracy, -row[1].answers))
+    else:
+        rows.sort(key=lambda row: -row[1].answers)
+    if args.limit:
+        rows = rows[:args.limit]
+
+    total = sum(item.answers for item in stats.values())
+    print(f"{sessions} oturum, {len(stats)} soru, {total} cevap")
+    print(f"{'doğruluk':>8} {'cevap':>6} {'yakalama sn':>11}  {'soru':<40} en sık yanlış")
+    for question, item in rows:
+        common = item.wrong_choices.most_common(1)
+        wrong = f"{common[0][0]} ({common[0][1]})" if common else "-"
+        print(f"{item.accuracy * 100:>7.1f}% {item.answers:>6} {item.catch_time / item.answers:>11.2f}  "
+              f"{question[:40]:<40} {wrong}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Testlerin ve benchmarks/bench_consoles.py'nin paylaştığı sahte Arduino konsolu."""
+import os
+import pty
+import select
+import threading
+import time
+import tty
+
+from serial_input import encode_binary_frame, HANDSHAKE_REPLY
+
+BINARY_BAUD = 115200
+
+
+class FakeConsole(threading.Thread):
+    """Sözde terminal (pty) üzerinden Arduino konsolu gibi davranan iş parçacığı (sadece POSIX).
+
+    Oyunun el sıkışmasına ikili protokolle yanıt verir (`binary=False` ise
+    eski yazılım gibi yanıt vermez ve "D-1,P512" satırları gönderir), sonra
+    `rate` Hz ile KY-040 adımı ve potansiyometre değeri gönderir. Her dördüncü
+    örnek `pull` adımı içerir; `pull_frames` verilirse sadece ilk o kadar
+    örnek. `pot` verilmezse değer konsola göre farklı bir yerde yavaşça döner.
+    Gönderilen toplam adım `detents_sent`, son pot değeri `last_pot` içindedir.
+    """
+
+    def __init__(self, index, rate=120, binary=True, pull=-1, pull_frames=None, pot=None):
+        super().__init__(name=f"FakeConsole{index}", daemon=True)
+        self.index = index
+        self.rate = rate
+        self.binary = binary
+        self.pull = pull
+        self.pull_frames = pull_frames
+        self.pot = pot
+        self.master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.path = os.ttyname(self._slave)
+        self.sent = 0
+        self.detents_sent = 0
+        self.last_pot = None
+        self._stopped = threading.Event()
+
+    def _handshake(self, timeout=2.0):
+        buffer = b""
+        deadline = time.perf_counter() + timeout
+        while b"\n" not in buffer and time.perf_counter() < deadline and not self._stopped.is_set():
+            if select.select([self.master], [], [], 0.05)[0]:
+                buffer += os.read(self.master, 64)
+        if b"HELLO BIN" in buffer and self.binary:
+            os.write(self.master, (HANDSHAKE_REPLY.format(baud=BINARY_BAUD) + "\n").encode("ascii"))
+        elif not self.binary:
+            # Oyun yanıt beklerken gelen satırlar müzakerede okunup atılır; süre dolana kadar sus
+            self._stopped.wait(0.5)
+
+    def run(self):
+        self._handshake()
+        seq = 0
+        interval = 1.0 / self.rate
+        while not self._stopped.wait(interval):
+            # Yavaşça aşağı sal, potansiyometreyi konsola göre farklı bir yerde tut
+            pot = self.pot if self.pot is not None else (self.index * 128 + self.sent) % 1024
+            pulling = self.pull_frames is None or self.sent < self.pull_frames
+            detent = self.pull if pulling and self.sent % 4 == 0 else 0
+            if self.binary:
+                os.write(self.master, encode_binary_frame(seq, [(detent, pot)]))
+            else:
+                os.write(self.master, f"D{detent},P{pot}\n".encode("ascii"))
+            seq = (seq + 1) & 0xFF
+            self.sent += 1
+            self.detents_sent += detent
+            self.last_pot = pot
+
+    def stop(self):
+        self._stopped.set()
+        self.join(1.0)
+        os.close(self.master)
+        os.close(self._slave)
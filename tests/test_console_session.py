@@ -0,0 +1,109 @@
+import os
+import time
+
+import pytest
+
+if os.name != "posix":
+    pytest.skip("sahte konsollar pty gerektirir (Linux/macOS)", allow_module_level=True)
+
+import serial  # noqa: E402
+
+from console_session import ConsoleSession  # noqa: E402
+from game_logic import GameState, ControlInput, WIDTH  # noqa: E402
+from tests.fake_console import FakeConsole, BINARY_BAUD  # noqa: E402
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def consoles():
+    """Sahte konsolları başlatır; testin sonunda hepsini ve oturumu kapatır."""
+    started = []
+
+    def make(*fakes, binary_baud=BINARY_BAUD):
+        paths = {f"konsol{i + 1}": fake.path for i, fake in enumerate(fakes)}
+        session = ConsoleSession(list(paths), 9600, binary_baud, reset_delay=0.05,
+                                 open_port=lambda port, baud, timeout: serial.Serial(paths[port], baud,
+                                                                                     timeout=timeout))
+        started.append((session, fakes))
+        for fake in fakes:
+            fake.start()
+        session.open()
+        return session
+
+    yield make
+    for session, fakes in started:
+        session.close()
+        for fake in fakes:
+            if fake.is_alive():
+                fake.stop()
+
+
+def drain(session, fakes, pulls):
+    """Konsollar adım göndermeyi bitirene kadar oturumu yoklar; her konsolun toplam adımını `pulls`a ekler."""
+    def done():
+        for i, (pull, _pot) in enumerate(session.poll()):
+            pulls[i] += pull
+        return all(fake.sent > fake.pull_frames + 10 for fake in fakes)
+
+    assert wait_until(done), "sahte konsollar zamanında veri göndermedi"
+    for i, (pull, _pot) in enumerate(session.poll()):
+        pulls[i] += pull
+
+
+def test_negotiates_binary_and_ascii(consoles):
+    fakes = [FakeConsole(0, binary=True), FakeConsole(1, binary=False)]
+    session = consoles(*fakes)
+
+    assert len(session) == 2
+    assert [c.decoder.name for c in session.controllers] == ["binary", "ascii"]
+
+
+def test_ascii_only_session_skips_handshake(consoles):
+    session = consoles(FakeConsole(0, binary=False), binary_baud=None)
+
+    assert [c.decoder.name for c in session.controllers] == ["ascii"]
+
+
+def test_each_console_drives_its_own_player(consoles):
+    # Her konsol farklı yönde ve sayıda adım, farklı bir pot değeri gönderir
+    fakes = [FakeConsole(0, binary=True, pull=-1, pull_frames=20, pot=100),
+             FakeConsole(1, binary=False, pull=2, pull_frames=20, pot=600),
+             FakeConsole(2, binary=True, pull=-3, pull_frames=20, pot=1000)]
+    session = consoles(*fakes)
+    assert len(session) == 3
+
+    pulls = [0] * len(fakes)
+    drain(session, fakes, pulls)
+    assert pulls == [fake.detents_sent for fake in fakes] == [-5, 10, -15]
+
+    game = GameState([{"question": "S", "answer": "C", "distractors": ["Y"]}], seed=0, players=len(session))
+    game.reset()
+    for _ in range(120):
+        inputs = [ControlInput(False, False, False, False, pull, pot) for pull, pot in session.poll()]
+        game.step(inputs=inputs)
+    for player, fake in zip(game.players, fakes):
+        assert fake.last_pot == fake.pot
+        target = 10 + fake.pot / 1023.0 * (WIDTH - 20)
+        assert abs(player.hook_x_anchor - target) < 1.0
+
+
+def test_dropped_console_reads_as_no_input(consoles):
+    fakes = [FakeConsole(0, binary=True), FakeConsole(1, binary=True)]
+    session = consoles(*fakes)
+    session.start()
+    assert wait_until(lambda: all(pot != -1 for _pull, pot in session.poll()))
+
+    fakes[0].stop()  # Kablo çekildi
+
+    assert wait_until(lambda: session.poll()[0] == (0, -1))
+    assert ("dropped", "konsol1") in session.events()
+    assert session.poll()[1][1] != -1
+    assert session.connected_count == 1